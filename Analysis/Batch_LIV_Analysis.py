@@ -0,0 +1,42 @@
+#########################################################################
+# Script to analyze every LIV collected by one user                     #
+# Saves a table with one row per LIV (threshold, slope efficiency,      #
+# rollover, wall-plug efficiency, differential resistance and kinks)    #
+#                                                                       #
+# Author: agent                                                         #
+# Date: Oct 18, 2026                                                    #
+#########################################################################
+
+import os
+import sys
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__),'..','GUI Code'))
+from LIV_analysis import find_LIV_files, load_LIV_files, batch_LIV_analysis, save_table
+
+#Define data location
+user_name = ''
+folder_dates = None #list of dates e.g. ['2024_05_30','2024_05_31'], None for every date
+file_filter = '' #only analyze files containing this string e.g. a device name
+#Analysis options
+smoothing_window = 7 #points used to smooth before taking derivatives
+kink_tolerance = 0.1 #fractional drop in dL/dI to count as a kink
+relative_rollover_tolerance = 0.05 #fractional drop from peak power where the threshold fit stops (LIV figures use a fixed 0.05 mW)
+kink_sigma = 3 #a kink must also drop this many times the noise of dL/dI
+min_kink_width = 3 #points a drop must last to count as a kink
+#Define constants
+characterization_directory = os.path.join(os.path.dirname(__file__),'..','Data',user_name)
+results_dir = os.path.join(os.path.dirname(__file__),'Results')
+if not os.path.isdir(results_dir):
+	os.makedirs(results_dir)
+	print(" Created new directory:", results_dir)
+### Main Code
+start_time = time.time()
+file_paths = [file for file in find_LIV_files(characterization_directory, folder_dates) if file_filter in os.path.basename(file)]
+names = [os.path.relpath(file, characterization_directory) for file in file_paths]
+currents, voltages, powers = load_LIV_files(file_paths)
+load_time = time.time()-start_time
+table = batch_LIV_analysis(names, currents, voltages, powers, smoothing_window, kink_tolerance, relative_rollover_tolerance, kink_sigma, min_kink_width)
+table_location = os.path.join(results_dir, 'LIV_Summary_'+(user_name or 'all')+'.csv')
+save_table(table, table_location)
+print(" Analyzed "+str(len(names))+" LIVs in {:.2f} s ({:.2f} s loading)".format(time.time()-start_time, load_time))
+print(" Table saved to", table_location)
@@ -0,0 +1,39 @@
+#########################################################################
+# Script to find saved measurements using the catalog of the Data      #
+# directory, e.g. every LIV of one device at 20 C from the last month   #
+# The catalog is brought up to date first, which only reads files that #
+# are new or changed since the last run                                 #
+#                                                                       #
+# Author: agent                                                         #
+# Date: Oct 18, 2026                                                    #
+#########################################################################
+
+import os
+import sys
+import time
+from datetime import date, timedelta
+sys.path.append(os.path.join(os.path.dirname(__file__),'..','GUI Code'))
+from data_catalog import update_catalog, query_catalog
+
+#Search options, None matches anything
+measurement_type = 'LIV' #LIV, Spectrum, Autocorrelation, ...
+device = 'BRL9_M-AL' #may contain * wildcards e.g. 'BRL9_*'
+user = None
+date_from = date.today()-timedelta(days=31) #datetime.date or 'YYYY_MM_DD'
+date_to = None
+biases = {'C': 20} #unit: value of any source or temperature in the name e.g. {'mA': 120, 'V': -1.5}
+pulsed = None #True/False
+metrics = {} #name: (minimum, maximum) e.g. {'threshold_current [mA]': (None, 20), 'SMSR [dB]': (30, None)}
+print_metrics = True
+#Define constants
+characterization_directory = os.path.join(os.path.dirname(__file__),'..','Data')
+
+### Main Code
+update_catalog(characterization_directory)
+start_time = time.time()
+results = query_catalog(characterization_directory, measurement_type, device, user, date_from, date_to, biases, pulsed, metrics)
+print(" Found "+str(len(results))+" measurements in {:.1f} ms".format((time.time()-start_time)*1e3))
+for result in results:
+	print(" "+os.path.relpath(result.path, characterization_directory))
+	if print_metrics and result.metrics:
+		print("   "+", ".join(name+" = {:.4g}".format(value) for name, value in result.metrics.items()))
@@ -11,11 +11,15 @@
 #########################################################################
 
 import os
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib as mpl
-import QuantumTomography as qKLib
 import seaborn as sns
+sys.path.append(os.path.join(os.path.dirname(__file__),'..','GUI Code'))
+from QST_functions import reconstruct_state, bootstrap_state
+from time_tag_functions import coincidence_windows, centered_windows
+from data_files import load_csv
 
 font = {'family':'sans-serif', 'weight':'bold', 'size':14}
 plt.rc('font', **font)
@@ -36,58 +40,19 @@ polarizations = 'HVRD'                                                    # List
 peak_polarization = 'VH'                                                  # Which polarization to use to find the peak
 ### Options
 coincidence_type = 'Raw Coincidences' # Raw Coincidences, Coincidences Less Accidentals
+tomography_method = 'MLE' # MLE, linear
+num_resamples = 1000 # Poisson resamples used for confidence intervals, 0 to skip
+confidence = 0.95 # Confidence level of intervals
 counts_plot = True
 show_figs = True
 save_figs = False
-pulsed = False # Not yet configured for pulsed = True
+CAR_window_plot = True
+max_window_bins = 20 # CAR is found for every coincidence window up to this width [bins]
+pulsed = False
+pulse_period_bins = 454.5 # Pulse repetition period [bins], accidentals are taken from the following pulses if pulsed
+num_pulses = 49 # Number of following pulses used for accidentals if pulsed
 
 #Functions
-def fidelty(theta, rho):
-	# Finds fidelity of density matrix rho
-	psi = np.array([0,1,np.cos(theta)-1j*np.sin(theta),0]) # HV + e^(i*phi)VH
-	fid = 0.5*np.matmul(np.matmul(psi,rho),psi.conj())
-	#For an arbitrary density matrix rho_2:
-	# fid = ( np.trace( la.sqrtm( np.matmul( np.matmul(la.sqrtm(rho_2), rho), la.sqrtm(rho_2) ) ) ) )**2
-	return fid.real
-
-def max_fidelity(rho):
-	theta = np.linspace(-np.pi,np.pi,10000)
-	fid = [fidelty(i,rho) for i in theta]
-	imax = np.argmax(fid)
-	return fid[imax], theta[imax]*180/np.pi #max_fidelity, theta_max_fidelity_degrees
-
-def HV_basis(polarization):
-	# Returns comma separated string for polarization in H,V basis
-	if polarization == 'H':
-		return "1,0"
-	elif polarization == 'V':
-		return "0,1"
-	elif polarization == 'D':
-		return "0.7071,0.7071"
-	elif polarization == 'A':
-		return "0.7071,-0.7071"
-	elif polarization == 'R':
-		return "0.7071,0.7071j"
-	elif polarization == 'L':
-		return "0.7071,-0.7071j"
-	else:
-		raise Exception(polarization+" is not a valid polarization")
-
-def Tomo_Input(polarization_vector, coincidence_vector, intensity_vector):
-	#Formats data for tomography file
-	intensity = "np.array(["
-	tomo_input = "np.array(["
-	for i in range(len(polarization_vector)):
-		polarization = polarization_vector[i]
-		coinc_count = int(coincidence_vector[i])
-		intensity += str(intensity_vector[i])+','
-		tomo_input += "[1,0,0,"+str(coinc_count)+","+HV_basis(polarization[0])+","+HV_basis(polarization[1])+"],"
-	intensity = intensity[:-1]+"])"
-	tomo_input = tomo_input[:-1]+"])"
-	tomography_file_data = "conf['NQubits'] = 2\nconf['NDetectors'] = 1\nconf['Crosstalk'] = [[1,0,0,0],[0,1,0,0],[0,0,1,0],[0,0,0,1]]\nconf['UseDerivative'] = 0\nconf['Bellstate'] = 0\nconf['DoErrorEstimation'] = 0\nconf['DoDriftCorrection'] = 'no'\nconf['Window'] = 0\nconf['Efficiency'] = [1,1,1,1]\n"
-	tomography_file_data += "tomo_input="+str(tomo_input)+"\nintensity="+str(intensity)
-	return tomography_file_data
-
 def plot_counts(polarizations, counts, coincidence_type):
 	N = len(polarizations)
 	z_max = max(counts)
@@ -193,59 +158,54 @@ results_dir = os.path.join(os.path.dirname(__file__),'Results')
 if not os.path.isdir(results_dir):
 	os.makedirs(results_dir)
 	print(" Created new directory:", results_dir)
+#Load every polarization
+polarization_vector = [p1+p2 for p1 in polarizations for p2 in polarizations]
+histograms = np.array([load_csv(os.path.join(main_directory,device_name_start+p+device_name_end+".csv"))[:,1] for p in polarization_vector]) #currently no header
 #Find coincidence peak location
-file_name = device_name_start+peak_polarization+device_name_end
-file_path = os.path.join(main_directory,file_name+".csv")
-data = np.loadtxt(file_path,delimiter=",")#,skiprows=1) #currently no header, so no need for this   
-coincidences = data[:,1]
-i_peak = np.argmax(coincidences)
-if peak_width_bins%2 == 0:
-	#If asymmetric, use an extra point before the peak
-	peak_bin_start = i_peak-int(peak_width_bins/2)
-	peak_bin_end = i_peak+int(peak_width_bins/2)-1
+i_peak = np.argmax(histograms[polarization_vector.index(peak_polarization)])
+#Coincidences and accidentals for every window width of every file at once
+#Windows use an extra point before the peak if asymmetric
+max_width = max(max_window_bins, peak_width_bins)
+if pulsed:
+	windows = coincidence_windows(histograms, max_width, peak_index=i_peak, pulse_period=pulse_period_bins, num_pulses=num_pulses)
 else:
-	peak_bin_start = i_peak-int((peak_width_bins-1)/2)
-	peak_bin_end = i_peak+int((peak_width_bins-1)/2)
-peak_width = (peak_bin_end-peak_bin_start+1)*bin_width
-#Find accidentals range
-accidental_bin_start = i_peak+100
-accidental_bin_end = len(coincidences-1)
-### Loop through files and collect data
-polarization_vector = []
+	windows = coincidence_windows(histograms, max_width, peak_index=i_peak, accidental_start=100)
+window_coincidences, window_accidentals, window_CAR = centered_windows(windows)
+### Collect data
 coincidence_vector = []
 intensity_vector = []
-for p1 in polarizations:
-	for p2 in polarizations:
-		file_name = device_name_start+p1+p2+device_name_end
-		file_path = os.path.join(main_directory,file_name+".csv")
-		data = np.loadtxt(file_path,delimiter=",",skiprows=1)        
-		delay = data[:,0]
-		coincidences = data[:,1]
-		accidentals = coincidences[accidental_bin_start:accidental_bin_end+1]
-		####################################### Pulsed mode not configured #######################################
-		if pulsed:
-			peak_bin_starting = 130414#
-			peak_bin_ending = 130418#
-			bin_start = 0 #bins before (inclusive)
-			bin_end = 1  #bins after (exclusive)
-			bin_diff = 454.5
-			peak_bin_start = peak_bin_starting+np.argmax(coincidences[peak_bin_starting:peak_bin_ending])-bin_start
-			peak_bin_end = peak_bin_starting+np.argmax(coincidences[peak_bin_starting:peak_bin_ending])+bin_end
-			accidentals = np.concatenate([coincidences[peak_bin_start+int(bin_diff*k):peak_bin_end+int(bin_diff*k)] for k in range(1,50)])
-		####################################### Pulsed mode not configured #######################################
-		total_coincidences = sum(coincidences[peak_bin_start:peak_bin_end+1])
-		avg_accidentals = sum(accidentals)/len(accidentals)*(peak_bin_end-peak_bin_start+1)
-		if coincidence_type == 'Raw Coincidences':
-			coincidence_metric = total_coincidences
-		elif coincidence_type == 'Coincidences Less Accidentals':
-			coincidence_metric = total_coincidences-avg_accidentals
-		else:
-			raise Exception("Invalid coincidence type: "+coincidence_type)
-		coincidence_vector.append(coincidence_metric)
-		intensity_vector.append(avg_accidentals)
-		polarization_vector.append(p1+p2)
-		print(file_name+" CAR = {:.3f}".format(total_coincidences/avg_accidentals)+", argmax(coinc) = {:n}".format(np.argmax(coincidences))+", "+coincidence_type+" = {:n}".format(coincidence_metric))
+background_vector = []
+for i, polarization in enumerate(polarization_vector):
+	file_name = device_name_start+polarization+device_name_end
+	total_coincidences = window_coincidences[i,peak_width_bins-1]
+	avg_accidentals = window_accidentals[i,peak_width_bins-1]
+	if coincidence_type == 'Raw Coincidences':
+		coincidence_metric = total_coincidences
+		background_vector.append(0)
+	elif coincidence_type == 'Coincidences Less Accidentals':
+		coincidence_metric = total_coincidences-avg_accidentals
+		background_vector.append(avg_accidentals)
+	else:
+		raise Exception("Invalid coincidence type: "+coincidence_type)
+	coincidence_vector.append(coincidence_metric)
+	intensity_vector.append(avg_accidentals)
+	print(file_name+" CAR = {:.3f}".format(window_CAR[i,peak_width_bins-1])+", argmax(coinc) = {:n}".format(np.argmax(histograms[i]))+", "+coincidence_type+" = {:n}".format(coincidence_metric))
 intensity_vector = [1 for _ in intensity_vector] # Can use dichroic mirror to monitor pump power and normalize for that here
+### Plot CAR against window width
+if CAR_window_plot:
+	fig, ax = plt.subplots()
+	for i, polarization in enumerate(polarization_vector):
+		ax.plot(windows.widths*bin_width/1000, window_CAR[i], label=polarization)
+	ax.set_xlabel('Coincidence Window [ns]')
+	ax.set_ylabel('CAR')
+	ax.legend(ncol=4, fontsize=8)
+	plt.tight_layout()
+	if save_figs:
+		fig.savefig(os.path.join(results_dir, 'CAR_Window_'+device_name+'.png'))
+	if show_figs:
+		plt.show()
+	else:
+		plt.close()
 ### Plot Counts
 if counts_plot:
 	fig = plot_counts(polarizations, coincidence_vector, coincidence_type)
@@ -255,13 +215,13 @@ if counts_plot:
 		plt.show()
 	else:
 		plt.close()
-### Generate tomography file
-output_file = os.path.join(results_dir,'evalfile_'+coincidence_type+"_peak_width="+str(peak_width)+'ns_'+device_name+".txt")
-with open(output_file,"w") as f:
-	f.write(Tomo_Input(polarization_vector, coincidence_vector, intensity_vector))
-	f.close()
 ### Perform Tomography
-[rho,intensity,fvalp] = qKLib.Tomography().importEval(output_file)
+if num_resamples > 0:
+	bootstrap = bootstrap_state(polarization_vector, coincidence_vector, intensity_vector, tomography_method, num_resamples, confidence, background_vector)
+	tomography = bootstrap.estimate
+else:
+	tomography = reconstruct_state(polarization_vector, coincidence_vector, intensity_vector, tomography_method)
+rho = tomography.rho
 ### Plot Density Matrix
 fig = plot_density_matrix(rho)
 if save_figs:
@@ -271,7 +231,12 @@ if show_figs:
 else:
 	plt.close()
 ### Print results to console
-max_fid, phi = max_fidelity(rho)
-print('\npurity = {:.2f}%'.format(qKLib.purity(rho)*100))
-print('concurrence = {:.2f}%'.format(qKLib.concurrence(rho)*100))
-print('Max fidelity = {:.2f}%'.format(max_fid*100)+' at angle phi = {:.2f}'.format(phi)+' degrees')
\ No newline at end of file
+print('\npurity = {:.2f}%'.format(tomography.purity*100))
+print('concurrence = {:.2f}%'.format(tomography.concurrence*100))
+print('Max fidelity = {:.2f}%'.format(tomography.max_fidelity*100)+' at angle phi = {:.2f}'.format(tomography.max_fidelity_angle)+' degrees')
+if num_resamples > 0:
+	intervals = bootstrap.intervals
+	print('\n{:.0f}% confidence intervals from '.format(confidence*100)+str(num_resamples)+' Poisson resamples')
+	print('purity = {:.2f}% to {:.2f}%'.format(intervals['purity'][0]*100, intervals['purity'][1]*100))
+	print('concurrence = {:.2f}% to {:.2f}%'.format(intervals['concurrence'][0]*100, intervals['concurrence'][1]*100))
+	print('Max fidelity = {:.2f}% to {:.2f}%'.format(intervals['max_fidelity'][0]*100, intervals['max_fidelity'][1]*100)+', phi = {:.2f} to {:.2f} degrees'.format(*intervals['max_fidelity_angle']))
\ No newline at end of file
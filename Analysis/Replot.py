@@ -1,6 +1,8 @@
 #########################################################################
 # Script to replot figures for data previously collected 				#
 # e.g. to change plotting options like show_best_fit or show_SMSR		#
+# Files are plotted in parallel and only replotted if the data or the	#
+# plot settings changed since the figure was last saved					#
 #																		#
 # Author: Trevor Stirling												#
 # Date: May 29, 2023													#
@@ -8,16 +10,22 @@
 
 import os
 import sys
+import json
+import time
+import hashlib
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.optimize import curve_fit
-from common_functions import plot_LIV, plot_spectrum, plot_autocorrelator, get_file_locations, loading_bar
+import matplotlib
+from concurrent.futures import ProcessPoolExecutor
+sys.path.append(os.path.join(os.path.dirname(__file__),'..','GUI Code'))
+from data_files import data_extensions
 
 #Run Options
-display_fig = False
+display_fig = False #figures are displayed one at a time without multiprocessing
 save_fig = True
 whole_directory = True #If true, device_name is ignored
 print_figure_locations = False #boolean to output locations figures are saved to terminal
+processes = os.cpu_count() #number of files plotted at once
+force_replot = False #If true, replots every file even if its figure is up to date
 #Define data location
 folder_date = '2023_02_14'
 device_name = 'MaiTai_792nm_20uW_minG_512Hz_1700Hz_16000pts' #ignored for whole_directory
@@ -50,55 +58,144 @@ if sys.platform == "win32":
 	characterization_directory = os.path.join('..','Data')
 else:
 	characterization_directory = '/Volumes/macOS Mojave/Users/trevorstirling/Documents/Trevor/Research/Characterization/Data/'
-if print_figure_locations:
-	terminate_loading_bar = True
-else:
-	terminate_loading_bar = False
-if whole_directory:
-	all_file_directory = os.path.join(characterization_directory,folder_date,plot_type,'Data')
-	all_files = os.listdir(all_file_directory)
-	all_files = [file for file in all_files if not file.startswith('.')] #remove .DS_Store
-	# all_files = [file for file in all_files if file.endswith('1700Hz_16000pts.csv')] #filter
-	all_files.sort()
-else:
-	all_files = [device_name+'.csv']
-loading_bar(0,terminate=terminate_loading_bar)
-n_files = len(all_files)
-for i,file in enumerate(all_files):
-	device_name = file.split('.csv')[0]
-	#Import and plot data
-	data = np.loadtxt(os.path.join(characterization_directory,folder_date,plot_type,'Data',device_name+'.csv'), delimiter=',', skiprows=1)
-	[png_location, device_name] = get_file_locations(0, save_fig, characterization_directory, plot_type, device_name, folder_date)[1:3]
+manifest_name = '.replot_manifest.json' #records the data hash and settings each figure was made with
+
+def plot_settings():
+	#Every option that changes the figure for plot_type, a figure is replotted if any of these change
 	if plot_type == 'LIV':
-		current_area = device_length/10*injection_width/10000
+		return {'plot_type': plot_type, 'is_PD_current': is_PD_current, 'show_best_fit': show_best_fit, 'show_best_fit_numbers': show_best_fit_numbers, 'plot_current_density': plot_current_density, 'device_length': device_length, 'injection_width': injection_width, 'responsivity': responsivity}
+	elif plot_type == 'Spectrum':
+		return {'plot_type': plot_type, 'show_max': show_max, 'show_max_numbers': show_max_numbers, 'show_SMSR': show_SMSR, 'show_FWHM': show_FWHM, 'x_is_freq': x_is_freq, 'SMSR_peak_width': SMSR_peak_width}
+	elif plot_type == 'Autocorrelation':
+		return {'plot_type': plot_type, 'normalize_autocorrelation': normalize_autocorrelation, 'plot_envelope': plot_envelope, 'plot_fit': plot_fit, 'plot_lower': plot_lower, 'time_scale_factor': time_scale_factor, 'envelope_reduction_factor': envelope_reduction_factor}
+	else:
+		raise Exception("Invalid plot_type: "+plot_type)
+
+def settings_hash(settings):
+	return hashlib.sha1(json.dumps(settings, sort_keys=True).encode()).hexdigest()
+
+def file_hash(file_path):
+	h = hashlib.sha1()
+	with open(file_path, 'rb') as f:
+		for block in iter(lambda: f.read(1<<20), b''):
+			h.update(block)
+	return h.hexdigest()
+
+def is_up_to_date(data_location, png_location, settings_key, manifest_entry):
+	#Up to date if the figure is newer than the data and was made from the same data with the same settings
+	#Returns (up to date, data hash), the data is only hashed once the cheaper checks pass and the hash is None otherwise
+	if not os.path.isfile(png_location) or os.path.getmtime(png_location) < os.path.getmtime(data_location) or manifest_entry.get('settings') != settings_key:
+		return False, None
+	data_hash = file_hash(data_location)
+	return manifest_entry.get('data') == data_hash, data_hash
+
+def init_worker():
+	#Worker processes never display figures, so use the non-interactive backend
+	matplotlib.use('Agg')
+
+def replot_file(data_location, png_location, device_name, data_hash, settings):
+	#Loads one data file, plots it and saves the figure. Returns device_name, data hash and the calibration FWHM (Autocorrelation only)
+	#data_hash is None unless the main process already hashed the file
+	import matplotlib.pyplot as plt
+	from plot_functions import plot_LIV, plot_spectrum, plot_autocorrelator
+	from data_files import read_data_file
+	if data_hash is None:
+		data_hash = file_hash(data_location)
+	data = read_data_file(data_location).data
+	FWHM = None
+	if settings['plot_type'] == 'LIV':
+		current_area = settings['device_length']/10*settings['injection_width']/10000
 		current = data[:,0] #[A]
-		if is_PD_current:
-			power = data[:,2]/responsivity #[W]
+		if settings['is_PD_current']:
+			power = data[:,2]/settings['responsivity'] #[W]
 		else:
 			power = data[:,2] #[W]
 		voltage = data[:,1] #[V]
-		fig = plot_LIV(device_name, power, current, voltage, show_best_fit, show_best_fit_numbers, plot_current_density=plot_current_density, current_area=current_area)[0]
-	elif plot_type == 'Spectrum':
+		fig = plot_LIV(device_name, power, current, voltage, settings['show_best_fit'], settings['show_best_fit_numbers'], plot_current_density=settings['plot_current_density'], current_area=current_area)[0]
+	elif settings['plot_type'] == 'Spectrum':
 		wavelength = data[:,0] #[nm]
 		power = data[:,1] #[dBm]
-		fig = plot_spectrum(device_name, wavelength, power, show_max, show_max_numbers, show_SMSR, SMSR_peak_width, show_FWHM, x_is_freq)[0]
-	elif plot_type == 'Autocorrelation':
-		time = data[:,0] #[points]
-		time = [j/time_scale_factor for j in time] #convert from points to fs
+		fig = plot_spectrum(device_name, wavelength, power, settings['show_max'], settings['show_max_numbers'], settings['show_SMSR'], settings['SMSR_peak_width'], settings['show_FWHM'], settings['x_is_freq'])[0]
+	elif settings['plot_type'] == 'Autocorrelation':
+		time = data[:,0]/settings['time_scale_factor'] #convert from points to fs
 		intensity = data[:,1] #signal from lock-in channel 1 [mV]
-		[fig,FWHM] = plot_autocorrelator(device_name, time, intensity, envelope_reduction_factor=envelope_reduction_factor, plot_fit=plot_fit, plot_envelope=plot_envelope, plot_lower=plot_lower, normalize=normalize_autocorrelation)
-		if whole_directory == False:
-			print("If calibration run, try new calibration factor of","{:.3f}".format(FWHM*time_scale_factor/calibration_width))
-	#Save/display figure
-	if save_fig:
+		[fig,FWHM] = plot_autocorrelator(device_name, time, intensity, envelope_reduction_factor=settings['envelope_reduction_factor'], plot_fit=settings['plot_fit'], plot_envelope=settings['plot_envelope'], plot_lower=settings['plot_lower'], normalize=settings['normalize_autocorrelation'])
+	if png_location:
 		fig.savefig(png_location,bbox_inches='tight')
-		if print_figure_locations:
-			print(" Figure saved to",png_location)
 	if display_fig:
-		if plot_type == 'Autocorrelation':
+		if settings['plot_type'] == 'Autocorrelation':
 			plt.subplots_adjust(bottom=0.2)
 		print(" Displaying figure. Close figure to resume.")
 		plt.show()
 	else:
-		plt.close()
-	loading_bar((i+1)/n_files,terminate=terminate_loading_bar)
+		plt.close(fig)
+	return device_name, data_hash, FWHM
+
+### Main Code
+if __name__ == '__main__':
+	if not display_fig:
+		init_worker()
+	data_directory = os.path.join(characterization_directory,folder_date,plot_type,'Data')
+	figure_directory = os.path.join(characterization_directory,folder_date,plot_type,'Figures')
+	if save_fig and not os.path.isdir(figure_directory):
+		os.makedirs(figure_directory)
+		print(" Created new directory:", figure_directory)
+	if whole_directory:
+		all_files = [file for file in sorted(os.listdir(data_directory)) if os.path.splitext(file)[1] in data_extensions and not file.startswith('.')] #remove .DS_Store
+		# all_files = [file for file in all_files if file.endswith('1700Hz_16000pts.csv')] #filter
+	else:
+		all_files = [device_name+extension for extension in data_extensions if os.path.isfile(os.path.join(data_directory, device_name+extension))][:1]
+	settings = plot_settings()
+	settings_key = settings_hash(settings)
+	manifest_location = os.path.join(figure_directory, manifest_name)
+	manifest = {}
+	if save_fig and os.path.isfile(manifest_location):
+		with open(manifest_location) as f:
+			manifest = json.load(f)
+	#Find the files whose figures are out of date
+	start_time = time.time()
+	jobs = []
+	names = set()
+	for file in all_files:
+		name = os.path.splitext(file)[0]
+		if name in names:
+			continue #a .h5 file exported to .csv is only plotted once
+		names.add(name)
+		data_location = os.path.join(data_directory, file)
+		png_location = os.path.join(figure_directory, name+'.png') if save_fig else ''
+		data_hash = None
+		if save_fig and not display_fig and not force_replot and name in manifest:
+			up_to_date, data_hash = is_up_to_date(data_location, png_location, settings_key, manifest[name])
+			if up_to_date:
+				continue
+		jobs.append((data_location, png_location, name, data_hash))
+	n_skipped = len(all_files)-len(jobs)
+	if n_skipped > 0:
+		print(" "+str(n_skipped)+" of "+str(len(all_files))+" figures are up to date")
+	#Replot, in parallel unless figures are displayed
+	n_workers = 1 if display_fig else max(1, min(processes, len(jobs)))
+	if n_workers > 1:
+		pool = ProcessPoolExecutor(max_workers=n_workers, initializer=init_worker)
+		results = pool.map(replot_file, *zip(*jobs), [settings]*len(jobs), chunksize=max(1, len(jobs)//(n_workers*4)))
+	else:
+		pool = None
+		results = (replot_file(*job, settings) for job in jobs)
+	try:
+		for i, (name, data_hash, FWHM) in enumerate(results):
+			manifest[name] = {'data': data_hash, 'settings': settings_key}
+			if print_figure_locations and save_fig:
+				print(" Figure saved to",os.path.join(figure_directory, name+'.png'))
+			elif not display_fig:
+				print("\r Replotted "+str(i+1)+" of "+str(len(jobs)), end='')
+			if plot_type == 'Autocorrelation' and whole_directory == False:
+				print("\n If calibration run, try new calibration factor of","{:.3f}".format(FWHM*time_scale_factor/calibration_width))
+	finally:
+		#Record finished figures even if a file fails, so the next run resumes from there
+		if pool is not None:
+			pool.shutdown(cancel_futures=True)
+		if save_fig:
+			with open(manifest_location, 'w') as f:
+				json.dump(manifest, f, indent=1)
+	elapsed = time.time()-start_time
+	if len(jobs) > 0:
+		print("\n Replotted "+str(len(jobs))+" files in {:.2f} s ({:.1f} files/s) using ".format(elapsed, len(jobs)/elapsed if elapsed > 0 else 0)+str(n_workers)+" process"+("es" if n_workers > 1 else ""))
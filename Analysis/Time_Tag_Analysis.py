@@ -0,0 +1,43 @@
+#########################################################################
+# Script to build a coincidence histogram from a raw time tag file      #
+# Saves the histogram in the same format as the QST GUI, so any bin     #
+# width or number of bins can be used without re-measuring              #
+#                                                                       #
+# Author: agent                                                         #
+# Date: Oct 18, 2026                                                    #
+#########################################################################
+
+import os
+import sys
+import time
+import numpy as np
+sys.path.append(os.path.join(os.path.dirname(__file__),'..','GUI Code'))
+from time_tag_functions import read_time_tags, correlation_histogram, CAR_from_singles
+
+### File Information
+file_path = ''                        # .ttbin from TimeTagger.FileWriter or .npy from save_time_tags
+signal_channel = 1
+idler_channel = 3
+bin_width = 50                        # [ps]
+num_bins = 2000
+peak_width_bins = 2                   # Width of coincidence peak [bins]
+chunk_size = 10_000_000               # Tags read at once
+### Main Code
+results_dir = os.path.join(os.path.dirname(__file__),'Results')
+if not os.path.isdir(results_dir):
+	os.makedirs(results_dir)
+	print(" Created new directory:", results_dir)
+start_time = time.time()
+result = correlation_histogram(read_time_tags(file_path, chunk_size), signal_channel, idler_channel, bin_width, num_bins)
+print(" Processed "+os.path.basename(file_path)+" in {:.2f} s".format(time.time()-start_time))
+#Coincidences in the peak_width_bins bins around the maximum
+i_peak = np.argmax(result.histogram)
+peak_bin_start = max(i_peak-peak_width_bins//2, 0)
+coincidences = np.sum(result.histogram[peak_bin_start:peak_bin_start+peak_width_bins])
+CAR = CAR_from_singles(coincidences, result.signal_rate, result.idler_rate, peak_width_bins*bin_width, result.duration)
+print(" Signal rate = {:.0f} /s, idler rate = {:.0f} /s, duration = {:.2f} s".format(result.signal_rate, result.idler_rate, result.duration*1e-12))
+print(" Coincidences = {:n}, CAR = {:.2f}".format(coincidences, CAR))
+#Time axis [ns] as saved by the QST GUI
+csv_location = os.path.join(results_dir, os.path.splitext(os.path.basename(file_path))[0]+'_bin_width='+str(bin_width)+'_num_bins='+str(num_bins)+'.csv')
+np.savetxt(csv_location, [p for p in zip(result.delay/1000, result.histogram)], delimiter=",")
+print(" Data saved to", csv_location)
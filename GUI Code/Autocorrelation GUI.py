@@ -11,11 +11,9 @@
 #Removed step amplitude option as both 100 Hz and 1700 Hz jogs overwrite to 50 automatically
 
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
 import sys, os
 import time
-from GUI_common_functions import BluePSGButton,enforce_number,enforce_max_min,get_file_locations_GUI,connect_to_Piezo,connect_to_GPIB,plot_autocorrelator
+from GUI_common_functions import BluePSGButton,enforce_number,enforce_max_min,get_file_locations_GUI,connect_to_Piezo,connect_to_GPIB,plot_autocorrelator,open_data_writer,gui_attributes,instrument_attributes
 import PySimpleGUI as psg
 
 font = 'Tahoma'
@@ -83,6 +81,7 @@ def GUI(debug=False):
 			Autocorrelation(window,values)
 		elif event == 'Monitor Power':
 			Monitor_power(values)
+			import matplotlib.pyplot as plt
 			plt.style.use('default')
 		elif event == 'Default 1':
 			window['num_points'].update(value='16000')
@@ -149,6 +148,8 @@ def update_return_to_start(window,return_to_start):
 		window['reverse_factor_text'].update(visible=False)
 
 def Monitor_power(values):
+	import matplotlib.pyplot as plt
+	from matplotlib.animation import FuncAnimation
 	#initialize parameters
 	display_time = 10
 	update_time = 0.07 #approx, measured [s]
@@ -210,6 +211,7 @@ def update_approx_time(window,num_points,sampling_rate):
 		window['approx_time'].update(value="Approx time: "+str(num_sec_total)+"s")
 
 def Autocorrelation(window,values):
+	import matplotlib.pyplot as plt
 	#Save current settings to default file
 	if not os.path.isdir(GUI_defaults_dir):
 		os.makedirs(GUI_defaults_dir)
@@ -302,6 +304,12 @@ def Autocorrelation(window,values):
 	Piezo_inst.move_relative(start_point)
 	Piezo_inst.wait_for_complete(30000)
 	piezo_start_loc = Piezo_inst.get_position()
+	### Open data file, points are saved as they are read from the lock-in buffer
+	if save_data:
+		attributes = gui_attributes(values)
+		attributes.update(instrument_attributes({'lock_in': Lock_in_inst, 'piezo': Piezo_inst}))
+		data_writer = open_data_writer(csv_location, ['Time (unscaled) [A.U.]', 'Intensity [V]'], attributes)
+	intensity = []
 	# Start data collection
 	print(" Performing Autocorrelation...")
 	window.Refresh()
@@ -313,6 +321,10 @@ def Autocorrelation(window,values):
 	while buffer_size < num_points:
 		time.sleep(0.1)
 		buffer_size = Lock_in_inst.read_buffer_size()
+		if save_data and min(buffer_size, num_points) > len(intensity):
+			new_points = Lock_in_inst.read_from_buffer(min(buffer_size, num_points)-len(intensity), len(intensity), pause=False)
+			data_writer.append(np.column_stack([np.arange(len(intensity), len(intensity)+len(new_points)), new_points]))
+			intensity += new_points
 		if buffer_size < num_points:
 			#psg.one_line_progress_meter('Autocorrelation Progress', buffer_size, num_points, orientation='horizontal')
 			loading_window['progress_bar'].UpdateBar(buffer_size)
@@ -331,7 +343,11 @@ def Autocorrelation(window,values):
 		Piezo_inst.move_relative(-1*reverse_correction_factor*(piezo_end_loc-piezo_start_loc)-piezo_start_loc) #Labview used a correction factor here
 	print(" Reading Data from SR830")
 	window.Refresh()
-	intensity = Lock_in_inst.read_from_buffer(num_points)
+	#Only points not already streamed to the data file are read
+	if len(intensity) < num_points:
+		intensity += Lock_in_inst.read_from_buffer(num_points-len(intensity), len(intensity))
+	else:
+		Lock_in_inst.pause_buffer_collection()
 	Piezo_inst.wait_for_complete(60000)
 	Piezo_inst.disconnect()
 	Lock_in_inst.GPIB.control_ren(0)
@@ -340,10 +356,7 @@ def Autocorrelation(window,values):
 	x_axis = [i for i in range(num_points)]
 	### Save data to file
 	if save_data:
-		full_data = np.zeros((len(x_axis), 2))
-		full_data[:,0] = x_axis
-		full_data[:,1] = intensity
-		np.savetxt(csv_location, full_data, delimiter=',', header='Time (unscaled) [A.U.], Intensity [V]', comments='')
+		data_writer.close()
 		print(" Data saved to",csv_location)
 		window.Refresh()
 	### Plot data
@@ -7,8 +7,7 @@
 
 import sys, os
 import numpy as np
-import matplotlib.pyplot as plt
-from GUI_common_functions import connect_to_GPIB, plot_intensity_autocorrelation, BluePSGButton, get_file_locations_GUI
+from GUI_common_functions import connect_to_GPIB, plot_intensity_autocorrelation, BluePSGButton, get_file_locations_GUI, save_data_file, gui_attributes, instrument_attributes
 import PySimpleGUI as psg
 
 font = 'Tahoma'
@@ -54,6 +53,7 @@ def GUI(debug=False):
 	window.close()
 
 def Intensity_Autocorrelation_Capture(window,values):
+	import matplotlib.pyplot as plt
 	#Save current settings to default file
 	if not os.path.isdir(GUI_defaults_dir):
 		os.makedirs(GUI_defaults_dir)
@@ -94,7 +94,9 @@ def Intensity_Autocorrelation_Capture(window,values):
 		full_data = np.zeros((len(intensity), 2))
 		full_data[:,0] = time
 		full_data[:,1] = intensity
-		np.savetxt(csv_location, full_data , delimiter=',', header='Time [fs], Intensity [A.U.]', comments='')
+		attributes = gui_attributes(values)
+		attributes.update(instrument_attributes({'autocorrelator': autocorrelator_inst}))
+		save_data_file(csv_location, full_data, ['Time [fs]', 'Intensity [A.U.]'], attributes)
 		print(" Data saved to",csv_location)
 		window.refresh()
 	### Plot data
@@ -10,10 +10,9 @@
 # Untested - may need some debugging
 
 import numpy as np
-import matplotlib.pyplot as plt
 import sys, os
 import time
-from GUI_common_functions import BluePSGButton,enforce_number,get_file_locations_GUI,connect_to_PM,connect_to_GPIB,plot_spectrum
+from GUI_common_functions import BluePSGButton,enforce_number,Run_Namer,connect_to_PM,connect_to_GPIB,plot_spectrum,analyze_spectrum,Figure_Renderer,save_data_file,gui_attributes,instrument_attributes
 import PySimpleGUI as psg
 
 font = 'Tahoma'
@@ -86,6 +85,7 @@ def update_SA_channel(window, spectrum_analyzer):
 		window['Channel'].update(values = ['1', '2', '3'], value = '1')
 
 def Sweep_DFG(window,values):
+	import matplotlib.pyplot as plt
 	#Save current settings to default file
 	if not os.path.isdir(GUI_defaults_dir):
 		os.makedirs(GUI_defaults_dir)
@@ -125,61 +125,68 @@ def Sweep_DFG(window,values):
 	wavlength_list = [x for x in np.arange(wavelength_start,wavelength_stop+wavelength_step/2,wavelength_step)] #[nm]
 	num_sweeps = len(wavlength_list)*2
 	sweep_num = 0
-	for i in range(len(wavlength_list)):
-		Laser_inst.set_wavelength(wavlength_list[i])
-		print(wavlength_list[i])
-		if i == 0:
-			Laser_inst.set_power(laser_power)
-			Laser_inst.set_output('ON')
-			time.sleep(1)
-		for scan_name in [device_name+'_'+str(wavlength_list[i])+'_Signal',device_name+'_'+str(wavlength_list[i])+'_Idler']:
-			if scan_name[-6:] == 'Signal':
-				spectrum_analyzer_inst.set_sensitivity(sensitivity)
-				spectrum_analyzer_inst.set_wavelength(wavlength_list[i])
-			elif scan_name[-5:] == 'Idler':
-				spectrum_analyzer_inst.set_sensitivity('HIGH1')
-				spectrum_analyzer_inst.set_wavelength(1/(1/wavelength_pump-1/wavlength_list[i]))
-				spectrum_analyzer_inst.sweep(spectrum_analyzer_channel)
-				spectrum_analyzer_inst.peak_to_center()
-				spectrum_analyzer_inst.set_sensitivity(sensitivity)
-			### Collect Spectrum
-			sweep_num += 1
-			print(" Spectrum Analyzer sweeping "+str(sweep_num)+"/"+str(num_sweeps)+"...")
-			print(" Sweeping...")
-			window.refresh()
-			spectrum_analyzer_inst.sweep(spectrum_analyzer_channel, print_status=False)
-			print(" Sweep complete")
-			print(" Capturing...")
-			window.refresh()
-			x_data, power = spectrum_analyzer_inst.capture(spectrum_analyzer_channel, print_status=False)
-			print(" Capture complete")
-			window.refresh()
-			### Name Output Files
-			[csv_location, png_location, scan_name] = get_file_locations_GUI(save_data, save_fig, characterization_directory, 'Spectrum', scan_name)
-			if scan_name == '-NULL-':
-				return
-			### Save data to file
-			if save_data:
-				full_data = np.zeros((len(wavlength_list), 2))
-				full_data[:,0] = wavlength_list
-				full_data[:,1] = power_list
-				np.savetxt(csv_location, full_data, delimiter=',', header='Wavelength [nm], Power [W]', comments='')
-				print(" Data saved to",csv_location)
-				window.Refresh()
-			### Plot data
-			if display_fig or save_fig:
-				fig = plot_spectrum(scan_name, x_data, power, show_SMSR=show_SMSR, show_FWHM=show_FWHM)[0]
-				if save_fig:
-					fig.savefig(png_location,bbox_inches='tight')
-					print(" Figure saved to",png_location)
+	namer = Run_Namer(save_data, save_fig, characterization_directory, 'Spectrum') #names are resolved without popups so the sweep never waits
+	renderer = Figure_Renderer() #figures that are not displayed are saved in the background
+	try:
+		for i in range(len(wavlength_list)):
+			Laser_inst.set_wavelength(wavlength_list[i])
+			print(wavlength_list[i])
+			if i == 0:
+				Laser_inst.set_power(laser_power)
+				Laser_inst.set_output('ON')
+				time.sleep(1)
+			for scan_name in [device_name+'_'+str(wavlength_list[i])+'_Signal',device_name+'_'+str(wavlength_list[i])+'_Idler']:
+				if scan_name[-6:] == 'Signal':
+					spectrum_analyzer_inst.set_sensitivity(sensitivity)
+					spectrum_analyzer_inst.set_wavelength(wavlength_list[i])
+				elif scan_name[-5:] == 'Idler':
+					spectrum_analyzer_inst.set_sensitivity('HIGH1')
+					spectrum_analyzer_inst.set_wavelength(1/(1/wavelength_pump-1/wavlength_list[i]))
+					spectrum_analyzer_inst.sweep(spectrum_analyzer_channel)
+					spectrum_analyzer_inst.peak_to_center()
+					spectrum_analyzer_inst.set_sensitivity(sensitivity)
+				### Collect Spectrum
+				sweep_num += 1
+				print(" Spectrum Analyzer sweeping "+str(sweep_num)+"/"+str(num_sweeps)+"...")
+				print(" Sweeping...")
+				window.refresh()
+				spectrum_analyzer_inst.sweep(spectrum_analyzer_channel, print_status=False)
+				print(" Sweep complete")
+				print(" Capturing...")
+				window.refresh()
+				x_data, power = spectrum_analyzer_inst.capture(spectrum_analyzer_channel, print_status=False)
+				print(" Capture complete")
+				window.refresh()
+				### Name Output Files
+				[csv_location, png_location, scan_name] = namer.get_file_locations(scan_name)
+				if scan_name == '-NULL-':
+					return
+				### Save data to file
+				if save_data:
+					full_data = np.zeros((len(wavlength_list), 2))
+					full_data[:,0] = wavlength_list
+					full_data[:,1] = power_list
+					attributes = gui_attributes(values)
+					attributes.update(instrument_attributes({'laser': Laser_inst, 'spectrum_analyzer': spectrum_analyzer_inst}))
+					save_data_file(csv_location, full_data, ['Wavelength [nm]', 'Power [W]'], attributes)
+					print(" Data saved to",csv_location)
 					window.Refresh()
+				### Plot data
 				if display_fig:
+					fig = plot_spectrum(scan_name, x_data, power, show_SMSR=show_SMSR, show_FWHM=show_FWHM)[0]
+					if save_fig:
+						fig.savefig(png_location,bbox_inches='tight')
+						print(" Figure saved to",png_location)
 					print(" Displaying figure. Close figure to resume.")
 					window.Refresh()
 					plt.show()
-				else:
-					plt.close()
-	Laser_inst.set_output('OFF')
+				elif save_fig:
+					result = analyze_spectrum(x_data, power)
+					renderer.submit(png_location, 'draw_spectrum', scan_name, x_data, power, result, show_SMSR=show_SMSR, show_FWHM=show_FWHM)
+					window.Refresh()
+		Laser_inst.set_output('OFF')
+	finally:
+		renderer.close()
 	Laser_inst.GPIB.control_ren(0)
 	print(" Disconnected from instruments")
 	
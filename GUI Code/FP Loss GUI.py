@@ -9,10 +9,9 @@
 #########################################################################
 
 import numpy as np
-import matplotlib.pyplot as plt
 import sys, os
 import time
-from GUI_common_functions import BluePSGButton,enforce_number,get_file_locations_GUI,connect_to_PM,connect_to_GPIB,plot_FP_Loss
+from GUI_common_functions import BluePSGButton,enforce_number,get_file_locations_GUI,connect_to_PM,connect_to_GPIB,plot_FP_Loss,open_data_writer,gui_attributes,instrument_attributes
 import PySimpleGUI as psg
 
 font = 'Tahoma'
@@ -68,6 +67,7 @@ def GUI(debug=False):
 	window.close()
 
 def FP_Loss(window,values):
+	import matplotlib.pyplot as plt
 	set_PM_parameters = True
 	#Save current settings to default file
 	if not os.path.isdir(GUI_defaults_dir):
@@ -109,6 +109,15 @@ def FP_Loss(window,values):
 		window.Refresh()
 	else:
 		psg.popup(Power_meter+" is not set up as a power meter")
+	### Name Output Files
+	[csv_location, png_location, scan_name] = get_file_locations_GUI(save_data, save_fig, characterization_directory, 'FP Loss', scan_name)
+	if scan_name == '-NULL-':
+		return
+	### Open data file, points are saved as they are measured
+	if save_data:
+		attributes = gui_attributes(values)
+		attributes.update(instrument_attributes({'laser': Laser_inst, 'power_meter': PM_inst}))
+		data_writer = open_data_writer(csv_location, ['Wavelength [nm]', 'Power [W]'], attributes)
 	### Sweep values and collect data
 	wavlength_list = [x for x in np.arange(wavelength_start,wavelength_stop+wavelength_step/2,wavelength_step)] #[nm]
 	num_points = len(wavlength_list)
@@ -131,21 +140,18 @@ def FP_Loss(window,values):
 		loading_window['progress_bar'].UpdateBar(i+1)
 		loading_window['progress_text'].update(value='Scan Progress: '+str(round((i+1)/num_points*100,1))+'%')
 		if power_list[i] == '-NULL-':
+			if save_data:
+				data_writer.close(complete=False)
 			return
+		if save_data:
+			data_writer.append([wavlength_list[i], power_list[i]])
 	loading_window.close()
 	Laser_inst.set_output('OFF')
 	Laser_inst.GPIB.control_ren(0)
 	print(" Disconnected from instruments")
-	### Name Output Files
-	[csv_location, png_location, scan_name] = get_file_locations_GUI(save_data, save_fig, characterization_directory, 'FP Loss', scan_name)
-	if scan_name == '-NULL-':
-		return
 	### Save data to file
 	if save_data:
-		full_data = np.zeros((len(wavlength_list), 2))
-		full_data[:,0] = wavlength_list
-		full_data[:,1] = power_list
-		np.savetxt(csv_location, full_data, delimiter=',', header='Wavelength [nm], Power [W]', comments='')
+		data_writer.close()
 		print(" Data saved to",csv_location)
 		window.Refresh()
 	### Plot data
@@ -79,8 +79,8 @@ class A8614x:
 			return True
 	
 	def wait_for_sweeping(self):
-		self.GPIB.write('*OPC?')
-		self.GPIB.write('*WAI')
+		#*OPC? returns once the sweep started by INIT:IMM completes, reading it also keeps the reply out of the next query
+		self.GPIB.query('*OPC?')
 	
 	def sweep(self ,channel='N/A', print_status=True):
 		#if passed a channel, only sweep that channel
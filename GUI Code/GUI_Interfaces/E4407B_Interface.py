@@ -70,8 +70,8 @@ class E4407B:
 		#return result&8 == 8
 
 	def wait_for_sweeping(self):
-		if self.is_sweeping():
-			self.GPIB.query('*OPC?')
+		#is_sweeping cannot be read yet, *OPC? returns once a sweep started by :INIT completes
+		self.GPIB.query('*OPC?')
 			
 	def sweep(self, channel='N/A', print_status=True):
 		#if passed a channel, only sweep that channel
@@ -8,6 +8,7 @@
 # -read_buffer_size()                                                   #
 # -empty_buffer()                                                       #
 # -start_buffer_collection()                                            #
+# -pause_buffer_collection()                                            #
 # -read_from_buffer()                                                   #
 # -set_sampling_rate()                                                  #
 #                                                                       #
@@ -81,12 +82,17 @@ class SR830:
 	def start_buffer_collection(self):
 		self.GPIB.write("STRT")
 
-	def read_from_buffer(self, num_points):
+	def pause_buffer_collection(self):
 		self.GPIB.write("PAUS")
+
+	def read_from_buffer(self, num_points, start=0, pause=True):
+		#Points already stored can be read while storage continues with pause=False
+		if pause:
+			self.GPIB.write("PAUS")
 		#TRCA works but is slower
-		# result = self.GPIB.query("TRCA?1,0,"+str(num_points))
+		# result = self.GPIB.query("TRCA?1,"+str(start)+","+str(num_points))
 		# result = [float(i) for i in result.split(",")[:-1]]
-		self.GPIB.write("TRCB?1,0,"+str(num_points))
+		self.GPIB.write("TRCB?1,"+str(start)+","+str(num_points))
 		result = self.GPIB.read_raw()
 		result = [struct.unpack("f",result[i*4:i*4+4])[0] for i in range(len(result)//4)]
 		return result
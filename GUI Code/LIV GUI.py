@@ -4,21 +4,24 @@
 # GUI added by Eman Shayeb                                              #
 # Data is saved as                                                      #
 # device_source5value_source4value_source3value_source2value.txt        #
+# Progress is checkpointed after each L-I curve, Resume continues an    #
+# interrupted sweep from the first unfinished curve                     #
 #                                                                       #
 # Author: Trevor Stirling                                               #
 # Date: Oct 15, 2024                                                    #
 #########################################################################
 
 import numpy as np
-import matplotlib.pyplot as plt
 import sys, os
 import time
-from GUI_common_functions import BluePSGButton,enforce_number,plus_button,minus_button,get_file_locations_GUI,connect_to_PM,connect_to_GPIB,plot_LIV
+from datetime import date
+from GUI_common_functions import BluePSGButton,enforce_number,plus_button,minus_button,connect_to_PM,connect_to_GPIB,plot_LIV,open_data_writer,gui_attributes,instrument_attributes,save_checkpoint,load_checkpoint,remove_checkpoint,pending_indices,Run_Namer,analyze_LIV,Figure_Renderer,read_data_file,bias_map_slices,save_summary_figure
 import PySimpleGUI as psg
 
 font = 'Tahoma'
 GUI_defaults_dir = os.path.join(os.path.dirname(__file__),"GUI Defaults")
 GUI_file = os.path.basename(__file__).replace(" GUI.py",".txt")
+checkpoint_file = os.path.join(GUI_defaults_dir, GUI_file.replace(".txt","_checkpoint.json"))
 
 def current_source_title(num):
 	return [[psg.Text('--------------- Source '+str(num)+' Options ---------------',font=(font, 20))]]
@@ -56,7 +59,7 @@ def GUI(debug=False):
 	[psg.pin(psg.Column(current_source_layout(4),key='source_4_options',visible=False))],
 	[psg.Push(),psg.pin(psg.Column(current_source_title(5),key='source_5_title',visible=False)),psg.Push()],
 	[psg.pin(psg.Column(current_source_layout(5),key='source_5_options',visible=False))],
-	[BluePSGButton('Ω Check'), psg.Push(), psg.Checkbox('Display', size=(8,1), key='Display_fig', default=False), psg.Checkbox('Save', size=(6,1), key='Save_fig', default=True), BluePSGButton('LIV'), BluePSGButton('Exit')], #push adds flexible whitespace
+	[BluePSGButton('Ω Check'), psg.Push(), psg.Checkbox('Summary only', size=(12,1), key='summary_only', default=False), psg.Checkbox('Display', size=(8,1), key='Display_fig', default=False), psg.Checkbox('Save', size=(6,1), key='Save_fig', default=True), BluePSGButton('LIV'), BluePSGButton('Resume'), BluePSGButton('Exit')], #push adds flexible whitespace
 	print_window]
 	#Create window
 	window = psg.Window('LIV',layout, resizable=True)
@@ -119,6 +122,12 @@ def GUI(debug=False):
 			switch_v_i_text(window,num,values[event])
 		elif event == 'LIV':
 			LIV(window,values)
+		elif event == 'Resume':
+			checkpoint = load_checkpoint(checkpoint_file)
+			if checkpoint is None:
+				psg.popup("There is no interrupted sweep to resume")
+			else:
+				LIV(window,checkpoint['values'],checkpoint)
 		elif event == 'Ω Check':
 			resistance_check(window,values)
 		#data validation
@@ -237,7 +246,8 @@ def resistance_check(window,values):
 	window.Refresh()
 	Source_inst.GPIB.control_ren(0)
 
-def LIV(window,values):
+def LIV(window,values,checkpoint=None):
+	import matplotlib.pyplot as plt
 	#Save current settings to default file
 	if not os.path.isdir(GUI_defaults_dir):
 		os.makedirs(GUI_defaults_dir)
@@ -257,6 +267,7 @@ def LIV(window,values):
 	pause_interval = float(values['pause_interval'])
 	display_fig = values['Display_fig']
 	save_fig = values['Save_fig']
+	summary_only = values.get('summary_only', False) #an L-I overlay and threshold map for the whole sweep instead of a figure per curve
 	save_data = save_fig
 	K2520_internal_sweep = True
 	#Power meter
@@ -434,7 +445,6 @@ def LIV(window,values):
 	else:
 		current_area = 1
 	### Sweep values and collect data
-	sweep_num = 0
 	if Source_1_mode != 'Current':
 		psg.popup("Source #1 must be in current mode")
 		return
@@ -455,170 +465,246 @@ def LIV(window,values):
 	else:
 		Source_input_list_5 = [x for x in np.arange(Source_start_5,Source_stop_5+Source_step_5/2,Source_step_5)]
 	num_sweeps = len(Source_input_list_2)*len(Source_input_list_3)*len(Source_input_list_4)*len(Source_input_list_5)
-	for i5 in range(len(Source_input_list_5)):
-		if Source_5.lower() != 'off':
-			if i5 > 0:
-				Source_inst_5.set_value(Source_input_list_5[i5])
-			else:
-				Source_inst_5.safe_turn_on(Source_input_list_5[i5])
-			if Source_5_mode == 'Current':
-				print(" Source #5 = "+str(round(Source_input_list_5[i5]*1e3))+" mA")
-			else:
-				print(" Source #5 = "+str(round(Source_input_list_5[i5]*10)/10)+" V")
-			window.Refresh()
-		for i4 in range(len(Source_input_list_4)):
-			if Source_4.lower() != 'off':
+	### Checkpoint completed sweeps so an interrupted run can be resumed
+	if checkpoint is None:
+		if load_checkpoint(checkpoint_file) is not None and psg.popup_yes_no("An interrupted sweep can still be resumed. Start a new sweep and discard it?") != 'Yes':
+			return
+		checkpoint = {'values': {field: value for field, value in values.items() if field != 'output'}, 'folder_date': date.today().strftime("%Y_%m_%d"), 'completed': [], 'setpoints': {}}
+	else:
+		print(" Resuming sweep, "+str(len(checkpoint['completed']))+"/"+str(num_sweeps)+" sweeps already complete")
+		window.Refresh()
+		#sources may have been left on when the sweep was interrupted
+		for Source, Source_inst in [(Source_1,Source_inst_1),(Source_2,Source_inst_2),(Source_3,Source_inst_3),(Source_4,Source_inst_4),(Source_5,Source_inst_5)]:
+			if Source.lower() != 'off':
+				Source_inst.safe_turn_off()
+	#output names are resolved without popups so a taken name never stops the sweep, a resumed sweep keeps its run_id
+	namer = Run_Namer(save_data, save_fig, characterization_directory, 'LIV', checkpoint['folder_date'], run_id=checkpoint.get('run_id'))
+	checkpoint['run_id'] = namer.run_id
+	save_checkpoint(checkpoint_file, checkpoint)
+	#figures that are not displayed are saved in the background while the next point is measured
+	renderer = Figure_Renderer()
+	try:
+		#with summary_only every curve is kept for the summary figures, curves measured before a resume are read back from their files
+		summary_results = {}
+		summary_labels = {}
+		if 'files' not in checkpoint:
+			checkpoint['files'] = ['']*len(checkpoint['completed'])
+		if summary_only:
+			for index, file in zip(checkpoint['completed'], checkpoint['files']):
+				if os.path.isfile(file):
+					data = read_data_file(file).data
+					summary_results[tuple(index)] = analyze_LIV(data[:,2], data[:,0], data[:,1], data[:,3] if data.shape[1] > 3 else False)
+					summary_labels[tuple(index)] = os.path.splitext(os.path.basename(file))[0][len(device_name)+1:]
+		pending = pending_indices((len(Source_input_list_5),len(Source_input_list_4),len(Source_input_list_3),len(Source_input_list_2)), checkpoint['completed'])
+		sweep_num = len(checkpoint['completed'])
+		#the first setpoint of each source is ramped to from off, later ones are set directly
+		Source_on = [False]*6
+		for i5 in range(len(Source_input_list_5)):
+			if (i5,) not in pending:
+				continue
+			if Source_5.lower() != 'off':
+				if Source_on[5]:
+					Source_inst_5.set_value(Source_input_list_5[i5])
+				else:
+					Source_inst_5.safe_turn_on(Source_input_list_5[i5])
+					Source_on[5] = True
+				if Source_5_mode == 'Current':
+					print(" Source #5 = "+str(round(Source_input_list_5[i5]*1e3))+" mA")
+				else:
+					print(" Source #5 = "+str(round(Source_input_list_5[i5]*10)/10)+" V")
+				window.Refresh()
+			for i4 in range(len(Source_input_list_4)):
+				if (i5,i4) not in pending:
+					continue
 				if Source_4.lower() != 'off':
-					if i4 > 0:
-						Source_inst_4.set_value(Source_input_list_4[i4])
-					else:
-						Source_inst_4.safe_turn_on(Source_input_list_4[i4])
-					if Source_4_mode == 'Current':
-						print(" Source #4 = "+str(round(Source_input_list_4[i4]*1e3))+" mA")
-					else:
-						print(" Source #4 = "+str(round(Source_input_list_4[i4]*10)/10)+" V")
-					window.Refresh()
-			for i3 in range(len(Source_input_list_3)):
-				if Source_3.lower() != 'off':
-					if i3 > 0:
-						Source_inst_3.set_value(Source_input_list_3[i3])
-					else:
-						Source_inst_3.safe_turn_on(Source_input_list_3[i3])
-					if Source_3_mode == 'Current':
-						print(" Source #3 = "+str(round(Source_input_list_3[i3]*1e3))+" mA")
-					else:
-						print(" Source #3 = "+str(round(Source_input_list_3[i3]*10)/10)+" V")
-					window.Refresh()
-				for i2 in range(len(Source_input_list_2)):
-					if Source_2.lower() != 'off':
-						if i2 > 0:
-							Source_inst_2.set_value(Source_input_list_2[i2])
+					if Source_4.lower() != 'off':
+						if Source_on[4]:
+							Source_inst_4.set_value(Source_input_list_4[i4])
 						else:
-							Source_inst_2.safe_turn_on(Source_input_list_2[i2])
-						if Source_2_mode == 'Current':
-							print(" Source #2 = "+str(round(Source_input_list_2[i2]*1e3))+" mA")
+							Source_inst_4.safe_turn_on(Source_input_list_4[i4])
+							Source_on[4] = True
+						if Source_4_mode == 'Current':
+							print(" Source #4 = "+str(round(Source_input_list_4[i4]*1e3))+" mA")
 						else:
-							print(" Source #2 = "+str(round(Source_input_list_2[i2]*10)/10)+" V")
+							print(" Source #4 = "+str(round(Source_input_list_4[i4]*10)/10)+" V")
 						window.Refresh()
-					### Inner sweep
-					sweep_num += 1
-					print(" Source #1 sweeping "+str(sweep_num)+"/"+str(num_sweeps)+"...")
-					window.Refresh()
-					# Delay to let currents stabilize
-					time.sleep(0.1)
-					if Power_meter == 'K2520' and K2520_internal_sweep and Source_1 == 'K2520':
-						Source_input_list_1, voltage_list, power_list = Source_inst_1.sweep_current(Source_start_1, Source_step_1, Source_stop_1)
-						if pulsed_1:
-							Source_inst_1.enable_init_continuous() #set continuous initiating again after sweep
-						### Remove data points where detector clipped
-						if max(power_list)>1.5e38:
-							last_point = power_list.index(next(i for i in power_list if i>1.5e38))
-							if last_point == 0:
-								psg.popup("Detector was maxed out from the first data point")
-								return
-							Source_input_list_1 = Source_input_list_1[:last_point] #[A]
-							voltage_list = voltage_list[:last_point] #[V]
-							power_list = power_list[:last_point] #[A]
-						power_list_2 = False
-					else:
-						Source_input_list_1 = [x for x in np.arange(Source_start_1,Source_stop_1+Source_step_1/2,Source_step_1)] #[A]
-						voltage_list = [0]*len(Source_input_list_1) #[V]
-						power_list = [0]*len(Source_input_list_1) #[W]
-						if two_facet_LIV:
-							power_list_2 = [0]*len(Source_input_list_1) #[W]
-						else:
-							power_list_2 = False
-						for i in range(len(Source_input_list_1)):
-							if i > 0:
-								Source_inst_1.set_value(Source_input_list_1[i])
-							else:
-								Source_inst_1.safe_turn_on(Source_input_list_1[i])
-							if i == 0:
-								Source_inst_1.set_output('ON')
-							#delay for power meter to stabilize
-							time.sleep(0.2)
-							voltage_list[i] = Source_inst_1.read_value('Voltage')
-							power_list[i] = PM_inst.read_power()
-							if power_list[i] == '-NULL-':
-								return
-							if two_facet_LIV:
-								PM_inst.set_channel(Power_meter_channel_2)
-								time.sleep(0.1)
-								power_list_2[i] = PM_inst.read_power()
-								PM_inst.set_channel(Power_meter_channel_1)
-								time.sleep(0.1)
-							if pausing_enabled and i>0:
-								if Source_1_mode == 'Current' and round(Source_input_list_1[i]*1e3)%round(pause_interval) == 0:
-									psg.popup(str(round(Source_input_list_1[i]*1e3))+" mA: Pausing for mode profile capture. Click OK to continue")
-								elif Source_1_mode == 'Voltage' and round(Source_input_list_1[i],2)%round(pause_interval,2) == 0:
-									psg.popup(str(round(Source_input_list_1[i],2))+" V: Pausing for mode profile capture. Click OK to continue")
-						Source_inst_1.safe_turn_off()
-					if num_sweeps == 1:
-						Source_inst_1.GPIB.control_ren(0)
-						print(" Disconnected from instruments")
-					### Name Output Files
-					scan_name = device_name
-					if Source_5.lower() != 'off':
-						if Source_5_mode == 'Current':
-							scan_name += '_'+str(round(Source_input_list_5[i5]*1e3))+'mA'
-						elif Source_5_mode == 'Voltage':
-							scan_name += '_'+str(round(Source_input_list_5[i5]*10)/10)+'V'
-					if Source_4.lower() != 'off':
-						if Source_4_mode == 'Current':
-							scan_name += '_'+str(round(Source_input_list_4[i4]*1e3))+'mA'
-						elif Source_4_mode == 'Voltage':
-							scan_name += '_'+str(round(Source_input_list_4[i4]*10)/10)+'V'
+				for i3 in range(len(Source_input_list_3)):
+					if (i5,i4,i3) not in pending:
+						continue
 					if Source_3.lower() != 'off':
-						if Source_3_mode == 'Current':
-							scan_name += '_'+str(round(Source_input_list_3[i3]*1e3))+'mA'
-						elif Source_3_mode == 'Voltage':
-							scan_name += '_'+str(round(Source_input_list_3[i3]*10)/10)+'V'
-					if Source_2.lower() != 'off':
-						if Source_2_mode == 'Current':
-							scan_name += '_'+str(round(Source_input_list_2[i2]*1e3))+'mA'
-						elif Source_2_mode == 'Voltage':
-							scan_name += '_'+str(round(Source_input_list_2[i2]*10)/10)+'V'
-					[csv_location, png_location, scan_name] = get_file_locations_GUI(save_data, save_fig, characterization_directory, 'LIV', scan_name)
-					if scan_name == '-NULL-':
-						return
-					### Save data to file
-					if save_data:
-						if two_facet_LIV:
-							full_data = np.zeros((len(Source_input_list_1), 4))
-							full_data[:,3] = power_list_2
+						if Source_on[3]:
+							Source_inst_3.set_value(Source_input_list_3[i3])
 						else:
-							full_data = np.zeros((len(Source_input_list_1), 3))
-						full_data[:,0] = Source_input_list_1
-						full_data[:,1] = voltage_list
-						full_data[:,2] = power_list
-						if two_facet_LIV:
-							np.savetxt(csv_location, full_data, delimiter=',', header='Current [A], Voltage [V], Power Right [W], Power Left [W]', comments='')
+							Source_inst_3.safe_turn_on(Source_input_list_3[i3])
+							Source_on[3] = True
+						if Source_3_mode == 'Current':
+							print(" Source #3 = "+str(round(Source_input_list_3[i3]*1e3))+" mA")
 						else:
-							np.savetxt(csv_location, full_data, delimiter=',', header='Current [A], Voltage [V], Power [W]', comments='')
-						print(" Data saved to",csv_location)
+							print(" Source #3 = "+str(round(Source_input_list_3[i3]*10)/10)+" V")
 						window.Refresh()
-					### Plot data
-					if display_fig or save_fig:
-						fig = plot_LIV(scan_name, power_list, Source_input_list_1, voltage_list, plot_current_density=plot_current_density, current_area=current_area, power2=power_list_2)[0]
-						if save_fig:
-							fig.savefig(png_location,bbox_inches='tight')
-							print(" Figure saved to",png_location)
+					for i2 in range(len(Source_input_list_2)):
+						if (i5,i4,i3,i2) not in pending:
+							continue
+						if Source_2.lower() != 'off':
+							if Source_on[2]:
+								Source_inst_2.set_value(Source_input_list_2[i2])
+							else:
+								Source_inst_2.safe_turn_on(Source_input_list_2[i2])
+								Source_on[2] = True
+							if Source_2_mode == 'Current':
+								print(" Source #2 = "+str(round(Source_input_list_2[i2]*1e3))+" mA")
+							else:
+								print(" Source #2 = "+str(round(Source_input_list_2[i2]*10)/10)+" V")
+							window.Refresh()
+						### Name Output Files
+						scan_name = device_name
+						if Source_5.lower() != 'off':
+							if Source_5_mode == 'Current':
+								scan_name += '_'+str(round(Source_input_list_5[i5]*1e3))+'mA'
+							elif Source_5_mode == 'Voltage':
+								scan_name += '_'+str(round(Source_input_list_5[i5]*10)/10)+'V'
+						if Source_4.lower() != 'off':
+							if Source_4_mode == 'Current':
+								scan_name += '_'+str(round(Source_input_list_4[i4]*1e3))+'mA'
+							elif Source_4_mode == 'Voltage':
+								scan_name += '_'+str(round(Source_input_list_4[i4]*10)/10)+'V'
+						if Source_3.lower() != 'off':
+							if Source_3_mode == 'Current':
+								scan_name += '_'+str(round(Source_input_list_3[i3]*1e3))+'mA'
+							elif Source_3_mode == 'Voltage':
+								scan_name += '_'+str(round(Source_input_list_3[i3]*10)/10)+'V'
+						if Source_2.lower() != 'off':
+							if Source_2_mode == 'Current':
+								scan_name += '_'+str(round(Source_input_list_2[i2]*1e3))+'mA'
+							elif Source_2_mode == 'Voltage':
+								scan_name += '_'+str(round(Source_input_list_2[i2]*10)/10)+'V'
+						[csv_location, png_location, scan_name] = namer.get_file_locations(scan_name)
+						if scan_name == '-NULL-':
+							return
+						### Open data file, points are saved as they are measured
+						if save_data:
+							if two_facet_LIV:
+								columns = ['Current [A]', 'Voltage [V]', 'Power Right [W]', 'Power Left [W]']
+							else:
+								columns = ['Current [A]', 'Voltage [V]', 'Power [W]']
+							attributes = gui_attributes(values)
+							attributes.update(instrument_attributes({'source_1': Source_inst_1, 'source_2': Source_inst_2, 'source_3': Source_inst_3, 'source_4': Source_inst_4, 'source_5': Source_inst_5, 'power_meter': PM_inst}))
+							data_writer = open_data_writer(csv_location, columns, attributes)
+						### Inner sweep
+						sweep_num += 1
+						print(" Source #1 sweeping "+str(sweep_num)+"/"+str(num_sweeps)+"...")
+						window.Refresh()
+						# Delay to let currents stabilize
+						time.sleep(0.1)
+						if Power_meter == 'K2520' and K2520_internal_sweep and Source_1 == 'K2520':
+							Source_input_list_1, voltage_list, power_list = Source_inst_1.sweep_current(Source_start_1, Source_step_1, Source_stop_1)
+							if pulsed_1:
+								Source_inst_1.enable_init_continuous() #set continuous initiating again after sweep
+							### Remove data points where detector clipped
+							if max(power_list)>1.5e38:
+								last_point = power_list.index(next(i for i in power_list if i>1.5e38))
+								if last_point == 0:
+									psg.popup("Detector was maxed out from the first data point")
+									if save_data:
+										data_writer.close(complete=False)
+									return
+								Source_input_list_1 = Source_input_list_1[:last_point] #[A]
+								voltage_list = voltage_list[:last_point] #[V]
+								power_list = power_list[:last_point] #[A]
+							power_list_2 = False
+							if save_data:
+								data_writer.append(np.column_stack([Source_input_list_1, voltage_list, power_list]))
+						else:
+							Source_input_list_1 = [x for x in np.arange(Source_start_1,Source_stop_1+Source_step_1/2,Source_step_1)] #[A]
+							voltage_list = [0]*len(Source_input_list_1) #[V]
+							power_list = [0]*len(Source_input_list_1) #[W]
+							if two_facet_LIV:
+								power_list_2 = [0]*len(Source_input_list_1) #[W]
+							else:
+								power_list_2 = False
+							for i in range(len(Source_input_list_1)):
+								if i > 0:
+									Source_inst_1.set_value(Source_input_list_1[i])
+								else:
+									Source_inst_1.safe_turn_on(Source_input_list_1[i])
+								if i == 0:
+									Source_inst_1.set_output('ON')
+								#delay for power meter to stabilize
+								time.sleep(0.2)
+								voltage_list[i] = Source_inst_1.read_value('Voltage')
+								power_list[i] = PM_inst.read_power()
+								if power_list[i] == '-NULL-':
+									if save_data:
+										data_writer.close(complete=False)
+									return
+								if two_facet_LIV:
+									PM_inst.set_channel(Power_meter_channel_2)
+									time.sleep(0.1)
+									power_list_2[i] = PM_inst.read_power()
+									PM_inst.set_channel(Power_meter_channel_1)
+									time.sleep(0.1)
+								if save_data:
+									if two_facet_LIV:
+										data_writer.append([Source_input_list_1[i], voltage_list[i], power_list[i], power_list_2[i]])
+									else:
+										data_writer.append([Source_input_list_1[i], voltage_list[i], power_list[i]])
+								if pausing_enabled and i>0:
+									if Source_1_mode == 'Current' and round(Source_input_list_1[i]*1e3)%round(pause_interval) == 0:
+										psg.popup(str(round(Source_input_list_1[i]*1e3))+" mA: Pausing for mode profile capture. Click OK to continue")
+									elif Source_1_mode == 'Voltage' and round(Source_input_list_1[i],2)%round(pause_interval,2) == 0:
+										psg.popup(str(round(Source_input_list_1[i],2))+" V: Pausing for mode profile capture. Click OK to continue")
+							Source_inst_1.safe_turn_off()
+						if num_sweeps == 1:
+							Source_inst_1.GPIB.control_ren(0)
+							print(" Disconnected from instruments")
+						### Save data to file
+						if save_data:
+							data_writer.close()
+							print(" Data saved to",csv_location)
 							window.Refresh()
-						if display_fig:
+						### Plot data
+						if summary_only:
+							summary_results[(i5,i4,i3,i2)] = analyze_LIV(power_list, Source_input_list_1, voltage_list, power_list_2)
+							summary_labels[(i5,i4,i3,i2)] = scan_name[len(device_name)+1:]
+						elif display_fig:
+							fig = plot_LIV(scan_name, power_list, Source_input_list_1, voltage_list, plot_current_density=plot_current_density, current_area=current_area, power2=power_list_2)[0]
+							if save_fig:
+								fig.savefig(png_location,bbox_inches='tight')
+								print(" Figure saved to",png_location)
 							print(" Displaying figure. Close figure to resume.")
 							window.Refresh()
 							plt.show()
-						else:
-							plt.close()
-					print("")
-				if Source_2.lower() != 'off':
-					Source_inst_2.safe_turn_off()
-			if Source_3.lower() != 'off':
-				Source_inst_3.safe_turn_off()
-		if Source_4.lower() != 'off':
-			Source_inst_4.safe_turn_off()
-	if Source_5.lower() != 'off':
-		Source_inst_5.safe_turn_off()
+						elif save_fig:
+							result = analyze_LIV(power_list, Source_input_list_1, voltage_list, power_list_2)
+							renderer.submit(png_location, 'draw_LIV', scan_name, result, plot_current_density=plot_current_density, current_area=current_area)
+							window.Refresh()
+						checkpoint['completed'].append([i5,i4,i3,i2])
+						checkpoint['files'].append(csv_location)
+						checkpoint['setpoints'] = {'source_'+str(n): float(Source_input_list[i]) for n, Source, Source_input_list, i in [(2,Source_2,Source_input_list_2,i2),(3,Source_3,Source_input_list_3,i3),(4,Source_4,Source_input_list_4,i4),(5,Source_5,Source_input_list_5,i5)] if Source.lower() != 'off'}
+						save_checkpoint(checkpoint_file, checkpoint)
+						print("")
+					if Source_2.lower() != 'off':
+						Source_inst_2.safe_turn_off()
+						Source_on[2] = False
+				if Source_3.lower() != 'off':
+					Source_inst_3.safe_turn_off()
+					Source_on[3] = False
+			if Source_4.lower() != 'off':
+				Source_inst_4.safe_turn_off()
+				Source_on[4] = False
+		if Source_5.lower() != 'off':
+			Source_inst_5.safe_turn_off()
+		### Summary figures
+		if summary_only and len(summary_results) > 0 and (display_fig or save_fig):
+			indices = sorted(summary_results)
+			save_summary_figure(namer, renderer, device_name+'_LI_overlay', display_fig, save_fig, 'draw_LIV_overlay', device_name, [summary_results[index] for index in indices], [summary_labels[index] for index in indices], plot_current_density, current_area)
+			sources = [('Source #'+str(n), 'mA' if Source_mode == 'Current' else 'V', [x*1e3 if Source_mode == 'Current' else x for x in Source_input_list]) for n, Source_mode, Source_input_list in [(5,Source_5_mode,Source_input_list_5),(4,Source_4_mode,Source_input_list_4),(3,Source_3_mode,Source_input_list_3),(2,Source_2_mode,Source_input_list_2)]]
+			threshold_currents = {index: result.threshold_current if result.good_fit else np.nan for index, result in summary_results.items()}
+			for name_suffix, x_values, y_values, z, x_label, y_label in bias_map_slices(threshold_currents, sources):
+				save_summary_figure(namer, renderer, device_name+'_threshold_map'+name_suffix, display_fig, save_fig, 'draw_threshold_map', device_name+name_suffix, x_values, y_values, z, x_label, y_label)
+	finally:
+		renderer.close()
+	remove_checkpoint(checkpoint_file)
 	if num_sweeps > 1:
 		Source_inst_1.GPIB.control_ren(0)
 		print(" Disconnected from instruments")
@@ -0,0 +1,129 @@
+#########################################################################
+# Functions to analyze many LIV curves at once                          #
+# Curves are grouped by length and each group is processed as one 2D    #
+# array, giving one row per curve in a single table                     #
+# -load_LIV_files()                                                     #
+# -batch_LIV_analysis()                                                 #
+# -save_table()                                                         #
+# -find_LIV_files()                                                     #
+#                                                                       #
+# Author: agent                                                         #
+# Date: Oct 18, 2026                                                    #
+#########################################################################
+
+import numpy as np
+import csv
+import os
+from scipy.signal import savgol_filter
+from analysis_functions import fit_threshold
+from data_files import read_data_file, data_extensions
+
+#Columns of the table returned by batch_LIV_analysis
+LIV_table_columns = ['file', 'num_points', 'threshold_current [mA]', 'threshold_sd [mA]', 'slope_efficiency [W/A]', 'max_power [mW]', 'rollover_current [mA]', 'max_WPE [%]', 'max_WPE_current [mA]', 'differential_resistance [Ohm]', 'first_kink_current [mA]', 'num_kinks']
+
+def load_LIV_files(file_paths):
+	#Loads LIV .csv or .h5 files as saved by the LIV GUI, returns lists of current [A], voltage [V] and power [W] arrays
+	#For two facet LIVs, only the right facet is used
+	currents = []
+	voltages = []
+	powers = []
+	for file_path in file_paths:
+		data = read_data_file(file_path).data
+		currents.append(data[:,0])
+		voltages.append(data[:,1])
+		powers.append(data[:,2])
+	return currents, voltages, powers
+
+def batch_LIV_analysis(names, currents, voltages, powers, smoothing_window=7, kink_tolerance=0.1, relative_rollover_tolerance=0.05, kink_sigma=3, min_kink_width=3):
+	#names, currents [A], voltages [V] and powers [W] are lists with one entry per curve, curves may differ in length
+	#Returns a dict of numpy arrays keyed by LIV_table_columns with one row per curve in the order given
+	#Points after the power first drops relative_rollover_tolerance*max power below its peak are excluded from the threshold fit
+	#analyze_LIV and the LIV figures stop at a fixed 0.05 mW drop instead, which noise can reach on dense sweeps, so thresholds of
+	#noisy curves may differ slightly from their figures
+	#A kink is a dip in dL/dI between threshold and rollover more than kink_tolerance below the median slope above threshold and kink_sigma
+	#times the noise of dL/dI below it, lasting at least min_kink_width points
+	num_curves = len(names)
+	table = {column: np.full(num_curves, np.nan) for column in LIV_table_columns}
+	table['file'] = np.array(names, dtype=object)
+	lengths = np.array([len(current) for current in currents])
+	for length in np.unique(lengths):
+		rows = np.flatnonzero(lengths == length)
+		current = np.array([currents[i] for i in rows], dtype=float)*1000 #[mA]
+		voltage = np.array([voltages[i] for i in rows], dtype=float) #[V]
+		power = np.array([powers[i] for i in rows], dtype=float)
+		power = (power-power[:,:1])*1000 #converts from [W] to [mW] and zeros background
+		table['num_points'][rows] = length
+		if length < 4:
+			continue
+		#Threshold and slope efficiency
+		fit = fit_threshold(current, power, tolerance=relative_rollover_tolerance*np.max(power, axis=1, keepdims=True))
+		table['threshold_current [mA]'][rows] = fit.threshold
+		table['threshold_sd [mA]'][rows] = fit.threshold_sd
+		table['slope_efficiency [W/A]'][rows] = fit.post_thresh_slope
+		#Smoothed derivatives
+		window = min(smoothing_window, length-(length+1)%2) #must be odd and no longer than the curve
+		if window > 2:
+			power_smooth = savgol_filter(power, window, 2, axis=1)
+			voltage_smooth = savgol_filter(voltage, window, 2, axis=1)
+		else:
+			power_smooth = power
+			voltage_smooth = voltage
+		dI = np.gradient(current, axis=1)
+		with np.errstate(divide='ignore', invalid='ignore'):
+			dLdI = np.gradient(power_smooth, axis=1)/dI #[mW/mA]
+			dVdI = np.gradient(voltage_smooth, axis=1)/dI*1000 #[Ohm]
+			WPE = power/(current*voltage)*100 #[%]
+		WPE[~np.isfinite(WPE) | (current <= 0)] = np.nan
+		#Rollover and power
+		max_index = np.argmax(power_smooth, axis=1)
+		table['max_power [mW]'][rows] = np.max(power, axis=1)
+		table['rollover_current [mA]'][rows] = current[np.arange(len(rows)), max_index]
+		table['differential_resistance [Ohm]'][rows] = dVdI[:,-1]
+		if np.any(np.isfinite(WPE)):
+			has_WPE = np.isfinite(WPE).any(axis=1)
+			WPE_index = np.argmax(np.where(np.isfinite(WPE), WPE, -np.inf), axis=1)
+			table['max_WPE [%]'][rows] = np.where(has_WPE, WPE[np.arange(len(rows)), WPE_index], np.nan)
+			table['max_WPE_current [mA]'][rows] = np.where(has_WPE, current[np.arange(len(rows)), WPE_index], np.nan)
+		#Kinks
+		index = np.arange(length)
+		#the median slope and the median deviation from it are not pulled up by noise like the highest slope is, so dense sweeps do not find extra kinks
+		lasing = (current > fit.threshold[:,None]) & (index < max_index[:,None])
+		with np.errstate(invalid='ignore'):
+			slope = np.nanmedian(np.where(lasing, dLdI, np.nan), axis=1)[:,None]
+			#start once the smoothed slope has risen to the median slope after threshold
+			reached = lasing & (dLdI >= (1-kink_tolerance)*slope)
+			kink_start = np.where(reached.any(axis=1), np.argmax(reached, axis=1), length)
+			above_threshold = lasing & (index >= kink_start[:,None])
+			slope_noise = 1.4826*np.nanmedian(np.where(above_threshold, np.abs(dLdI-slope), np.nan), axis=1)[:,None]
+			in_dip = above_threshold & (dLdI < (1-kink_tolerance)*slope-kink_sigma*np.nan_to_num(slope_noise))
+		dip_start = in_dip.copy()
+		dip_start[:,1:] &= ~in_dip[:,:-1]
+		#a dip counts from its start if it lasts min_kink_width points
+		dip_count = np.concatenate([np.zeros((len(rows),1), dtype=int), np.cumsum(in_dip, axis=1)], axis=1)
+		width = min(min_kink_width, length)
+		lasts = np.zeros_like(in_dip)
+		lasts[:,:length-width+1] = dip_count[:,width:]-dip_count[:,:length-width+1] == width
+		is_kink = dip_start & lasts
+		table['num_kinks'][rows] = np.sum(is_kink, axis=1)
+		table['first_kink_current [mA]'][rows] = np.where(is_kink.any(axis=1), current[np.arange(len(rows)), np.argmax(is_kink, axis=1)], np.nan)
+	return table
+
+def save_table(table, file_path):
+	#Writes a table from batch_LIV_analysis to csv, one row per curve
+	columns = list(table.keys())
+	with open(file_path, 'w', newline='') as f:
+		writer = csv.writer(f)
+		writer.writerow(columns)
+		for i in range(len(table[columns[0]])):
+			writer.writerow([table[column][i] for column in columns])
+
+def find_LIV_files(characterization_directory, folder_dates=None):
+	#Lists every LIV data file under characterization_directory/<date>/LIV/Data, optionally only for the dates given
+	file_paths = []
+	if folder_dates is None:
+		folder_dates = sorted(os.listdir(characterization_directory))
+	for folder_date in folder_dates:
+		data_directory = os.path.join(characterization_directory, folder_date, 'LIV', 'Data')
+		if os.path.isdir(data_directory):
+			file_paths += [os.path.join(data_directory, file) for file in sorted(os.listdir(data_directory)) if os.path.splitext(file)[1] in data_extensions and not file.startswith('.')]
+	return file_paths
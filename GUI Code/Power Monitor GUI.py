@@ -5,11 +5,9 @@
 # Date: Aug 23, 2024                                                    #
 #########################################################################
 
-import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
 import sys, os
 import time
-from GUI_common_functions import BluePSGButton,enforce_number,connect_to_GPIB,connect_to_PM
+from GUI_common_functions import BluePSGButton,enforce_number,connect_to_GPIB,connect_to_PM,get_file_locations_GUI,open_data_writer,gui_attributes,instrument_attributes
 import PySimpleGUI as psg
 
 font = 'Tahoma'
@@ -27,6 +25,7 @@ def GUI(debug=False):
 		print_window = [psg.Multiline(size=(10,5), expand_x=True, expand_y=True, key='output', reroute_stdout=True)]
 	layout = [[psg.Text('Power Meter:'), psg.Combo(['Newport', 'SR830', 'K2520'], default_value='Newport', size=(8,1), enable_events=True, readonly=True, key='Power_meter'), psg.Text('Channel:', key='channel_text'), psg.Combo(['A','B'], default_value='A', size=(2,1), readonly=True, key='Channel', visible=True), psg.Text('Range:'), psg.Combo(['W', 'mW', 'μW', 'nW', 'pW'], default_value='mW', size=(4,1), enable_events=True, readonly=True, key='Range'), ],
 	[psg.Text('Display Time [s]:'), psg.InputText('10', key='display_time', size=(4,1), enable_events=True), psg.Text('Update Time [s]:'), psg.InputText('0.07', key='update_time', size=(4,1), enable_events=True)],
+	[psg.Checkbox('Record', key='Record', default=False), psg.Text('Your Name:'), psg.InputText('', key='User_name', size=(10,1), expand_x=True), psg.Text('Device Name:'), psg.InputText('', key='Device_name', size=(10,1), expand_x=True)],
 	[psg.Push(),BluePSGButton('Start'), BluePSGButton('Exit')],
 	print_window]
 	#Create window
@@ -78,6 +77,8 @@ def update_channels(window, power_meter):
 		window['channel_text'].update(visible=False)
 
 def Power_Monitor(window,values):
+	import matplotlib.pyplot as plt
+	from matplotlib.animation import FuncAnimation
 	#Save current settings to default file
 	if not os.path.isdir(GUI_defaults_dir):
 		os.makedirs(GUI_defaults_dir)
@@ -93,6 +94,9 @@ def Power_Monitor(window,values):
 	power_range = values['Range']
 	display_time = float(values['display_time'])
 	update_time = float(values['update_time'])
+	record = values['Record']
+	user_name = values['User_name']
+	device_name = values['Device_name']
 	if len(power_range)==1:
 		scale = 1
 	else:
@@ -125,6 +129,19 @@ def Power_Monitor(window,values):
 			return
 	else:
 		raise Exception(colour.red+" "+Power_meter," is not set up as a power meter"+colour.end)
+	#Open data file, every reading is saved as it is measured so recordings can run indefinitely
+	data_writer = None
+	if record:
+		characterization_directory = os.path.join('..','Data',user_name)
+		[csv_location, png_location, device_name] = get_file_locations_GUI(True, False, characterization_directory, 'Power Monitor', device_name)
+		if device_name == '-NULL-':
+			return
+		attributes = gui_attributes(values)
+		attributes.update(instrument_attributes({'power_meter': PM_inst}))
+		if Power_meter == 'SR830':
+			data_writer = open_data_writer(csv_location, ['Time [s]', 'Signal [V]'], attributes)
+		else:
+			data_writer = open_data_writer(csv_location, ['Time [s]', 'Power [W]'], attributes)
 	#initialize vectors
 	num_points = round(display_time/update_time)
 	x = [(i-num_points+1)*update_time for i in range(num_points)]
@@ -137,15 +154,21 @@ def Power_Monitor(window,values):
 	line = plt.plot(x, y)[0]
 	#Update plot
 	start_time = time.time()
-	animation = FuncAnimation(fig, update, fargs=(PM_inst,x,y,fig,line,start_time,scale), interval=1)
+	animation = FuncAnimation(fig, update, fargs=(PM_inst,x,y,fig,line,start_time,scale,data_writer), interval=1)
 	plt.show()
+	if data_writer:
+		data_writer.close()
+		print(" Data saved to",csv_location)
+		window.Refresh()
 	if Power_meter == 'K2520' or Power_meter == 'SR830':
 		PM_inst.GPIB.control_ren(0)
 
-def update(frame,PM_inst,x,y,fig,line,start_time,scale):
+def update(frame,PM_inst,x,y,fig,line,start_time,scale,data_writer=None):
 	#read power
 	power = PM_inst.read_power() #[W] or [V]
 	elapsed_time = time.time()-start_time
+	if data_writer:
+		data_writer.append([elapsed_time, power])
 	#update vectors
 	x.append(elapsed_time)
 	x.pop(0)
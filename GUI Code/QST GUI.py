@@ -11,7 +11,9 @@ import matplotlib
 import matplotlib.pyplot as plt
 import sys, os
 import time
+import threading
 from GUI_common_functions import BluePSGButton,enforce_number,get_file_locations_GUI
+from time_tag_functions import coincidence_windows, centered_windows
 import PySimpleGUI as psg
 
 if sys.platform == "win32":
@@ -141,20 +143,11 @@ def angle_format(window,key,num):
 	window[key].update(string)
 
 def CAR(hist_data,peak_width):
+	#peak_width bins around the maximum, with one extra point before the peak if asymmetric
 	if max(hist_data) == 0 or peak_width == 0:
 		return 0
-	else:
-		i = np.argmax(hist_data)
-	if peak_width%2 == 0:
-		#asymmetric about peak, use one extra point before the peak
-		counts = sum(hist_data[i-int(peak_width/2):i+int(peak_width/2)])
-	else:
-		counts = sum(hist_data[i-int(peak_width/2):i+int(peak_width/2)+1])
-	if i+100 < len(hist_data):
-		accidental_average = np.average(hist_data[i+100:-1])
-	else:
-		accidental_average = np.average(hist_data[i+1:-1])
-	return counts/peak_width/accidental_average
+	result = coincidence_windows(hist_data, max_width=peak_width, accidental_end=-1)
+	return centered_windows(result)[2][0,-1]
 
 def initialize_TT(signal_channel, idler_channel, bin_width, num_bins):
 	if not 'tagger' in globals():
@@ -171,6 +164,9 @@ def initialize_TT(signal_channel, idler_channel, bin_width, num_bins):
 
 def Alignment(window,values):
 	run_time = 2 #time [s]
+	poll_rate = 10 #histogram reads per second
+	display_rate = 30 #maximum figure updates per second
+	smoothing = 0.3 #weight of the newest read in the running CAR
 	# Pull parameters from GUI
 	signal_channel = int(values['signal_channel'])
 	idler_channel = int(values['idler_channel'])
@@ -179,39 +175,97 @@ def Alignment(window,values):
 	if sys.platform == "win32":
 		### Initialize Figure
 		tagger, histogram, _ = initialize_TT(signal_channel, idler_channel, bin_width, num_bins)
-		# hist_data=np.array([1,1,1,1,1,1])
 		time_arr=(np.arange(0,num_bins) - int(num_bins/2) )*bin_width/1000
-		#Prepare figure
+		#Prepare figure, only animated artists are redrawn each frame
 		fig, ax = plt.subplots()
 		plt.xlabel("Time (ns)")
 		plt.ylabel("Number of Counts")
 		ax.set_ylim(0,1000)
-		plotted_previous, = plt.plot(time_arr,np.zeros(num_bins))
-		plotted_data, = plt.plot(time_arr,np.zeros(num_bins))
+		plotted_previous, = ax.plot(time_arr,np.zeros(num_bins),animated=True)
+		plotted_data, = ax.plot(time_arr,np.zeros(num_bins),animated=True)
 		plot_text_1=plt.text(0.01,0.78,"Idler Channel: "+str(idler_channel) +"\nSignal Channel: "+str(signal_channel)+"\nBin Width (ps): "+str(bin_width)+"\nNumber of Bins: "+str(num_bins)+"\nIntegration Time (s): "+str(run_time),transform = ax.transAxes)
-		plot_text_2=plt.text(0.6,0.1,"CAR: {:.2f}".format(0)+"\nMAX: {:n}".format(0), transform = ax.transAxes, fontsize=20)
-		plot_text_3=plt.text(0.6,0.75,"Previous\nCAR: {:.2f}".format(0)+"\nMAX: {:n}".format(0), transform = ax.transAxes, fontsize=20)
-		plt.ion()
-		while True:
-        	### Collect new data
-			histogram.startFor(int(run_time*1E12))
-			time.sleep(0.2)
-			hist_data=histogram.getData()
-			while histogram.isRunning():
-				hist_data=histogram.getData()
-				plt.figure(1)
-				plt.pause(0.2)
-				plotted_data.set_ydata(hist_data)
-				plot_text_2.set_text("CAR: {:.2f}".format(CAR(hist_data,1))+"\nMAX: {:n}".format(max(hist_data)))
-				if not plt.fignum_exists(fig.number):
-					return
-				fig.canvas.draw()
-				time.sleep(0.0001)
+		plot_text_2=plt.text(0.6,0.1,"CAR: {:.2f}".format(0)+"\nMAX: {:n}".format(0), transform = ax.transAxes, fontsize=20, animated=True)
+		plot_text_3=plt.text(0.6,0.75,"Previous\nCAR: {:.2f}".format(0)+"\nMAX: {:n}".format(0), transform = ax.transAxes, fontsize=20, animated=True)
+		animated_artists = [plotted_previous, plotted_data, plot_text_2, plot_text_3]
+		#Recapture the static background whenever the whole figure is drawn (e.g. resizing)
+		display = {'background': None}
+		def capture_background(event):
+			display['background'] = fig.canvas.copy_from_bbox(fig.bbox)
+		fig.canvas.mpl_connect('draw_event', capture_background)
+		plt.show(block=False)
+		fig.canvas.draw()
+		### Collect data in the background, independent of the display rate
+		state = {'data': None, 'running': None, 'previous': None, 'new_data': False, 'new_cycle': False, 'stop': False}
+		acquisition_thread = threading.Thread(target=alignment_acquisition, args=(histogram, run_time, poll_rate, smoothing, state), daemon=True)
+		acquisition_thread.start()
+		frame_time = 1/display_rate
+		while plt.fignum_exists(fig.number):
+			frame_start = time.time()
+			if state['new_cycle']:
+				state['new_cycle'] = False
+				previous = state['previous']
+				plotted_previous.set_ydata(previous)
+				plot_text_3.set_text("Previous\nCAR: {:.2f}".format(CAR(previous,1))+"\nMAX: {:n}".format(max(previous)))
+				ax.set_ylim(0,max(max(previous)*1.2,1))
+				fig.canvas.draw() #full redraw for the new axis limits, recaptures background
+			if state['new_data']:
+				state['new_data'] = False
+				plotted_data.set_ydata(state['data'])
+				plot_text_2.set_text("CAR: {:.2f}".format(CAR(state['running'],1))+"\nMAX: {:n}".format(max(state['data']))+"\n{:.0f} FPS".format(1/frame_time))
 			### Update Figure
-			plotted_previous.set_ydata(histogram.getData())
-			plot_text_3.set_text("Previous\nCAR: {:.2f}".format(CAR(hist_data,1))+"\nMAX: {:n}".format(max(hist_data)))
-			ax.set_ylim(0,max(hist_data)*1.2)
-			fig.canvas.draw()
+			if display['background'] is not None:
+				fig.canvas.restore_region(display['background'])
+				for artist in animated_artists:
+					ax.draw_artist(artist)
+				fig.canvas.blit(fig.bbox)
+			fig.canvas.flush_events()
+			time.sleep(max(1/display_rate-(time.time()-frame_start),0))
+			frame_time = time.time()-frame_start
+		state['stop'] = True
+		acquisition_thread.join()
+
+def alignment_acquisition(histogram, run_time, poll_rate, smoothing, state):
+	#Repeats run_time acquisitions, reading the histogram poll_rate times per second
+	#state['running'] is an exponentially weighted histogram of the counts added between reads
+	running = None
+	while not state['stop']:
+		histogram.startFor(int(run_time*1E12))
+		last_data = None
+		while histogram.isRunning() and not state['stop']:
+			time.sleep(1/poll_rate)
+			data = histogram.getData()
+			new_counts = data if last_data is None else data-last_data
+			last_data = data
+			running = new_counts if running is None else smoothing*new_counts+(1-smoothing)*running
+			state['running'] = running
+			state['data'] = data
+			state['new_data'] = True
+		if state['stop']:
+			histogram.stop()
+			break
+		state['previous'] = histogram.getData()
+		state['new_cycle'] = True
+
+def acquire(measurements, run_time, snapshot_rate=0, snapshot=None, cancelled=None, timeout=10):
+	#Runs every measurement for run_time [s] and blocks until they finish without reading their data
+	#Every 1/snapshot_rate s (every 0.2 s if snapshot_rate is 0) snapshot(elapsed time) is called and cancelled() is checked
+	#Returns True if finished, False if cancelled or still running timeout s after run_time (measurements are stopped)
+	for measurement in measurements:
+		measurement.startFor(int(run_time*1E12))
+	start_time = time.time()
+	check_interval = 1/snapshot_rate if snapshot_rate > 0 else 0.2
+	last_snapshot = start_time
+	for measurement in measurements:
+		while not measurement.waitUntilFinished(int(min(check_interval,0.2)*1000)):
+			elapsed = time.time()-start_time
+			if (cancelled is not None and cancelled()) or elapsed > run_time+timeout:
+				for m in measurements:
+					m.stop()
+				return False
+			if snapshot is not None and time.time()-last_snapshot >= check_interval:
+				last_snapshot = time.time()
+				snapshot(elapsed)
+	return True
 
 def QST_Scan(window, values):
 	#Save current settings to default file
@@ -241,11 +295,29 @@ def QST_Scan(window, values):
 		### Collect Data
 		tagger, histogram, countrate = initialize_TT(signal_channel, idler_channel, bin_width, num_bins)		
 		time_arr=(np.arange(0,num_bins) - int(num_bins/2) )*bin_width/1000
-		histogram.startFor(int(run_time*1E12))
-		countrate.startFor(int(run_time*1E12))
-		while histogram.isRunning():
-			hist_data=histogram.getData()
-			count_1,count_2=countrate.getData()
+		#Progress window, updated from periodic snapshots while waiting
+		loading_layout = [[psg.Text('Scan Progress: 0%',key='progress_text')],
+		[psg.ProgressBar(1000, orientation='h', size=(20, 20), expand_x=True, key='progress_bar')],
+		[psg.Text('Peak Counts: 0',key='peak_text')],
+		[psg.Push(), psg.Cancel()]]
+		loading_window = psg.Window("Scan Progress", loading_layout)
+		loading_window.finalize()
+		def show_progress(elapsed):
+			loading_window['progress_bar'].UpdateBar(int(min(elapsed/run_time,1)*1000))
+			loading_window['progress_text'].update(value='Scan Progress: '+str(round(min(elapsed/run_time,1)*100,1))+'%')
+			loading_window['peak_text'].update(value='Peak Counts: {:n}'.format(max(histogram.getData())))
+		def cancelled():
+			event, _ = loading_window.read(timeout=0)
+			return event == psg.WIN_CLOSED or event == 'Cancel'
+		finished = acquire([histogram, countrate], run_time, snapshot_rate=2, snapshot=show_progress, cancelled=cancelled)
+		loading_window.close()
+		if not finished:
+			print(" Scan cancelled")
+			window.Refresh()
+			return
+		#Fetch the results once
+		hist_data=histogram.getData()
+		count_1,count_2=countrate.getData()
 		peak_width = 1 #number of bins
 		car = CAR(hist_data,peak_width)
 		print("CAR "+str(car))
@@ -258,7 +330,7 @@ def QST_Scan(window, values):
 		plt.ylabel("Number of Counts")
 		plt.plot(time_arr,hist_data)
 		### Name Output Files
-		[csv_location, png_location, scan_name] = get_file_locations_GUI(save_data, save_fig, characterization_directory, 'QST', scan_name)
+		[csv_location, png_location, scan_name] = get_file_locations_GUI(save_data, save_fig, characterization_directory, 'QST', scan_name, data_extension='.csv') #QST_Analysis reads these csv files
 		if scan_name == '-NULL-':
 			return
 		### Save data to file
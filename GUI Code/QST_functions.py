@@ -0,0 +1,192 @@
+#########################################################################
+# Functions to analyze two qubit polarization states                    #
+# Density matrices can be a single 4x4 array or any stack of them       #
+# (..., 4, 4), e.g. bootstrap resamples                                 #
+# -fidelity()                                                           #
+# -max_fidelity()                                                       #
+# -phase_family()                                                       #
+# -reconstruct_state()                                                  #
+# -purity()                                                             #
+# -concurrence()                                                        #
+# -bootstrap_state()                                                    #
+#                                                                       #
+# Author: agent                                                         #
+# Date: Oct 18, 2026                                                    #
+#########################################################################
+
+import numpy as np
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+#rho in the HH, HV, VH, VV basis, max_fidelity_angle [degrees] as returned by max_fidelity
+Tomography_Result = namedtuple('Tomography_Result', ['rho', 'purity', 'concurrence', 'max_fidelity', 'max_fidelity_angle'])
+#estimate is the Tomography_Result of the measured counts, resamples holds one row per resample
+#intervals and sd are dicts keyed by 'purity', 'concurrence', 'max_fidelity' and 'max_fidelity_angle', intervals are (lower, upper)
+QST_Bootstrap = namedtuple('QST_Bootstrap', ['estimate', 'resamples', 'intervals', 'sd'])
+
+#Single photon polarization states in the H, V basis
+polarization_states = {
+	'H': np.array([1, 0]),
+	'V': np.array([0, 1]),
+	'D': np.array([1, 1])/np.sqrt(2),
+	'A': np.array([1, -1])/np.sqrt(2),
+	'R': np.array([1, 1j])/np.sqrt(2),
+	'L': np.array([1, -1j])/np.sqrt(2),
+	}
+#Pauli matrices, used as the basis for linear inversion
+pauli = np.array([[[1,0],[0,1]], [[0,1],[1,0]], [[0,-1j],[1j,0]], [[1,0],[0,-1]]], dtype=complex)
+two_qubit_pauli = np.einsum('aij,bkl->abikjl', pauli, pauli).reshape(16, 4, 4)
+
+def phase_family(theta):
+	#Target states (HV + e^(i*theta)VH)/sqrt(2) in the HH, HV, VH, VV basis, one row per angle [rad]
+	theta = np.atleast_1d(np.asarray(theta, dtype=float))
+	states = np.zeros((len(theta), 4), dtype=complex)
+	states[:,1] = 1/np.sqrt(2)
+	states[:,2] = np.exp(1j*theta)/np.sqrt(2)
+	return states
+
+def fidelity(rho, targets):
+	#Fidelity <psi|rho|psi> of every density matrix with every pure target state
+	#rho is (..., 4, 4) and targets is (4,) or (num_targets, 4), returns (...) or (..., num_targets)
+	rho = np.asarray(rho)
+	targets = np.asarray(targets)
+	fid = np.einsum('tj,...jk,tk->...t', targets.conj().reshape(-1, targets.shape[-1]), rho, targets.reshape(-1, targets.shape[-1])).real
+	if targets.ndim == 1:
+		return fid[...,0]
+	return fid
+
+def mixed_fidelity(rho, sigma):
+	#Uhlmann fidelity (Tr sqrt(sqrt(sigma) rho sqrt(sigma)))^2 for mixed targets, rho and sigma broadcast against each other
+	eigenvalues, eigenvectors = np.linalg.eigh(sigma)
+	sqrt_sigma = (eigenvectors*np.sqrt(np.clip(eigenvalues, 0, None))[...,None,:])@np.swapaxes(eigenvectors, -1, -2).conj()
+	product_eigenvalues = np.linalg.eigvalsh(sqrt_sigma@rho@sqrt_sigma)
+	return np.sum(np.sqrt(np.clip(product_eigenvalues, 0, None)), axis=-1)**2
+
+def max_fidelity(rho):
+	#Exact maximum of fidelity over phase_family(theta)
+	#The fidelity is (rho[1,1]+rho[2,2])/2 + |rho[1,2]|cos(theta+arg(rho[1,2])), so it peaks at theta = arg(rho[2,1])
+	#Returns max_fidelity, theta_max_fidelity_degrees
+	rho = np.asarray(rho)
+	coherence = rho[...,2,1]
+	fid = (rho[...,1,1].real+rho[...,2,2].real)/2+np.abs(coherence)
+	return fid, np.angle(coherence, deg=True)
+
+def measurement_projectors(polarization_pairs):
+	#Projectors onto |p1>|p2> for each measurement e.g. ['HH','HV',...], shape (num_measurements, 4, 4)
+	for pair in polarization_pairs:
+		for polarization in pair:
+			if polarization not in polarization_states:
+				raise Exception(polarization+" is not a valid polarization")
+	states = np.array([np.kron(polarization_states[pair[0]], polarization_states[pair[1]]) for pair in polarization_pairs], dtype=complex)
+	return np.einsum('mi,mj->mij', states, states.conj())
+
+def linear_inversion(counts, projectors, intensity=None):
+	#Least squares solution of counts = N*intensity*Tr(P*rho) over Hermitian rho, which may not be positive
+	#counts is (..., num_measurements), returns (..., 4, 4) with unit trace
+	counts = np.asarray(counts, dtype=float)
+	intensity = np.ones(counts.shape[-1]) if intensity is None else np.asarray(intensity, dtype=float)
+	design = np.einsum('mij,kji->mk', projectors, two_qubit_pauli).real*intensity[:,None]/4
+	coefficients = counts@np.linalg.pinv(design).T
+	rho = np.einsum('...k,kij->...ij', coefficients, two_qubit_pauli)/4
+	return rho/np.trace(rho, axis1=-2, axis2=-1)[...,None,None]
+
+def maximum_likelihood(counts, projectors, intensity=None, max_iter=10000, tolerance=1e-7):
+	#Poisson maximum likelihood density matrix by the R*rho*R iteration, normalized for measurement sets that do not sum to identity
+	#(Rehacek, Hradil and Jezek, Phys. Rev. A 63, 040303 (2001)). Every dataset in counts (..., num_measurements) is iterated together
+	counts = np.asarray(counts, dtype=float)
+	intensity = np.ones(counts.shape[-1]) if intensity is None else np.asarray(intensity, dtype=float)
+	weighted_projectors = projectors*intensity[:,None,None]
+	G_inv = np.linalg.inv(np.sum(weighted_projectors, axis=0))
+	#Tr(P*rho) and sum(ratio*P) as matrix products over the flattened 4x4 matrices
+	flat_projectors = weighted_projectors.reshape(-1, 16)
+	batch_shape = counts.shape[:-1]
+	counts = counts.reshape(-1, counts.shape[-1])
+	#Start from the linear inversion estimate, made positive and mixed with a little white noise so no eigenvalue starts at zero
+	rho = 0.99*make_physical(linear_inversion(counts, projectors, intensity))+0.01*np.eye(4)/4
+	active = np.arange(len(counts))
+	iterations = 0
+	while len(active) > 0 and iterations < max_iter:
+		iterations += 1
+		probabilities = (np.swapaxes(rho[active], -1, -2).reshape(-1, 16)@flat_projectors.T).real
+		with np.errstate(divide='ignore', invalid='ignore'):
+			ratio = np.where(counts[active] > 0, counts[active]/probabilities, 0)
+		R = (ratio@flat_projectors).reshape(-1, 4, 4)
+		new_rho = G_inv@R@rho[active]@R@G_inv
+		new_rho = new_rho/np.trace(new_rho, axis1=-2, axis2=-1)[:,None,None]
+		change = np.max(np.abs(new_rho-rho[active]), axis=(1,2))
+		rho[active] = new_rho
+		active = active[change >= tolerance]
+	rho = (rho+np.swapaxes(rho, -1, -2).conj())/2
+	return rho.reshape(batch_shape+(4,4))
+
+def make_physical(rho):
+	#Closest positive semidefinite matrix with unit trace, by clipping negative eigenvalues
+	eigenvalues, eigenvectors = np.linalg.eigh(rho)
+	eigenvalues = np.clip(eigenvalues, 0, None)
+	eigenvalues = eigenvalues/np.sum(eigenvalues, axis=-1, keepdims=True)
+	return (eigenvectors*eigenvalues[...,None,:])@np.swapaxes(eigenvectors, -1, -2).conj()
+
+def purity(rho):
+	return np.einsum('...ij,...ji->...', rho, rho).real
+
+def concurrence(rho):
+	#Wootters concurrence from the eigenvalues of rho*(sigma_y x sigma_y)rho^*(sigma_y x sigma_y)
+	spin_flip = np.kron(pauli[2], pauli[2])
+	rho_tilde = spin_flip@np.conj(rho)@spin_flip
+	eigenvalues = np.sqrt(np.abs(np.linalg.eigvals(rho@rho_tilde).real))
+	eigenvalues = -np.sort(-eigenvalues, axis=-1)
+	return np.maximum(eigenvalues[...,0]-np.sum(eigenvalues[...,1:], axis=-1), 0)
+
+def reconstruct_state(polarization_pairs, counts, intensity=None, method='MLE'):
+	#Density matrix, purity, concurrence and maximum fidelity from coincidence counts for each polarization pair
+	#counts can be one dataset or (..., num_measurements) for many, method is 'MLE' or 'linear'
+	#Datasets with no counts (or non-finite counts) have no state, their results are NaN and the other datasets are reconstructed as usual
+	if method not in ['MLE', 'linear']:
+		raise Exception("Invalid tomography method: "+method)
+	projectors = measurement_projectors(polarization_pairs)
+	counts = np.asarray(counts, dtype=float)
+	batch_shape = counts.shape[:-1]
+	counts = counts.reshape(-1, counts.shape[-1])
+	valid = np.all(np.isfinite(counts), axis=-1) & (np.sum(counts, axis=-1) > 0)
+	rho = np.full((len(counts), 4, 4), np.nan, dtype=complex)
+	results = [np.full(len(counts), np.nan) for i in range(4)]
+	if np.any(valid):
+		if method == 'MLE':
+			rho[valid] = maximum_likelihood(counts[valid], projectors, intensity)
+		else:
+			rho[valid] = linear_inversion(counts[valid], projectors, intensity)
+		for result, values in zip(results, [purity(rho[valid]), concurrence(rho[valid])]+list(max_fidelity(rho[valid]))):
+			result[valid] = values
+	#[()] returns plain numbers for a single dataset
+	return Tomography_Result(rho.reshape(batch_shape+(4,4)), *[result.reshape(batch_shape)[()] for result in results])
+
+def bootstrap_state(polarization_pairs, counts, intensity=None, method='MLE', num_resamples=1000, confidence=0.95, background=None, processes=1, seed=None):
+	#Confidence intervals from Poisson resampling of the counts, each resample is reconstructed like the measurement
+	#If counts have had accidentals subtracted, pass the subtracted background so the raw counts are resampled
+	#Resamples are reconstructed together in one call, or split across processes if processes > 1
+	#(scripts using processes > 1 must run their main code under if __name__ == '__main__')
+	counts = np.asarray(counts, dtype=float)
+	background = np.zeros(counts.shape) if background is None else np.asarray(background, dtype=float)
+	estimate = reconstruct_state(polarization_pairs, counts, intensity, method)
+	rng = np.random.default_rng(seed)
+	resampled_counts = rng.poisson(np.clip(counts+background, 0, None), size=(num_resamples,)+counts.shape)-background
+	if processes > 1:
+		chunks = np.array_split(resampled_counts, processes)
+		with ProcessPoolExecutor(max_workers=processes) as pool:
+			results = list(pool.map(reconstruct_state, [polarization_pairs]*processes, chunks, [intensity]*processes, [method]*processes))
+		resamples = Tomography_Result(*[np.concatenate(values) for values in zip(*results)])
+	else:
+		resamples = reconstruct_state(polarization_pairs, resampled_counts, intensity, method)
+	intervals = {}
+	sd = {}
+	tail = (1-confidence)/2*100
+	for name in ['purity', 'concurrence', 'max_fidelity', 'max_fidelity_angle']:
+		values = getattr(resamples, name)
+		center = getattr(estimate, name)
+		if name == 'max_fidelity_angle':
+			#Measure angles relative to the estimate so intervals do not break at +/-180 degrees
+			values = center+(values-center+180)%360-180
+		#resamples with no counts give NaN and are left out
+		intervals[name] = tuple(np.nanpercentile(values, [tail, 100-tail]))
+		sd[name] = np.nanstd(values, ddof=1)
+	return QST_Bootstrap(estimate, resamples, intervals, sd)
@@ -7,7 +7,6 @@
 #########################################################################
 
 import numpy as np
-import matplotlib.pyplot as plt
 import sys, os
 import time
 from GUI_common_functions import BluePSGButton,enforce_number,plus_button,minus_button,get_file_locations_GUI,connect_to_PM,connect_to_GPIB,plot_LIV
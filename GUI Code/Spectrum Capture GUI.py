@@ -6,9 +6,10 @@
 #########################################################################
 
 import sys, os
+import time
+import threading
 import numpy as np
-import matplotlib.pyplot as plt
-from GUI_common_functions import BluePSGButton,enforce_number,get_file_locations_GUI,connect_to_GPIB,plot_spectrum
+from GUI_common_functions import BluePSGButton,enforce_number,get_file_locations_GUI,connect_to_GPIB,plot_spectrum,save_data_file,gui_attributes,instrument_attributes
 import PySimpleGUI as psg
 
 symbol_open = '▾'
@@ -27,7 +28,8 @@ def GUI(debug=False):
 		print_window = []
 	else:
 		print_window = [psg.Multiline(size=(10,5), expand_x=True, expand_y=True, key='output', reroute_stdout=True)]
-	SA_options = [[BluePSGButton('Peak to Center'), psg.InputText('780', key='wavelength', size=(6,1), enable_events=True), BluePSGButton('Set λ [nm]', key='set_center'), psg.InputText('20', key='span', size=(3,1), enable_events=True), BluePSGButton('Set span [nm]', key='set_span'), BluePSGButton('Repeat')]]
+	SA_options = [[BluePSGButton('Peak to Center'), psg.InputText('780', key='wavelength', size=(6,1), enable_events=True), BluePSGButton('Set λ [nm]', key='set_center'), psg.InputText('20', key='span', size=(3,1), enable_events=True), BluePSGButton('Set span [nm]', key='set_span'), BluePSGButton('Repeat')],
+	[psg.Text('Frames:'), psg.InputText('500', key='num_frames', size=(5,1), enable_events=True), psg.Text('Display Rate [fps]:'), psg.InputText('5', key='display_rate', size=(3,1), enable_events=True), BluePSGButton('Waterfall')]]
 	layout = [[psg.Text('Your Name:'), psg.InputText('', key='User_name', size=(30,1), expand_x=True), psg.Text('(for data saving)')],
 	[psg.Text('Device Name:'), psg.InputText('', key='Device_name', size=(30,1), expand_x=True)],
 	[psg.Text('Spectrum Analyzer:'), psg.Combo(['A86146B', 'A86142A', 'AQ6317B', 'AQ6374', 'E4407B'], default_value='AQ6374', size=(8,1), enable_events=True, readonly=True, key='Spectrum_analyzer'), psg.Text('Channel:'), psg.Combo(['A', 'B', 'C', 'D', 'E', 'F', 'G'], default_value='A', size=(2,1), readonly=True, key='Channel')],
@@ -75,6 +77,8 @@ def GUI(debug=False):
 			Spectrum_Analyzer_Capture(window,values)
 		elif event == 'Sweep':
 			sweep_SA(window, values)
+		elif event == 'Waterfall':
+			record_waterfall(window, values)
 		#open hidden sections
 		elif event == 'more_SA_options':
 			more_SA_options_open = not more_SA_options_open
@@ -88,6 +92,10 @@ def GUI(debug=False):
 			enforce_number(window,values,event)
 		elif event == 'span' and len(values[span]):
 			enforce_number(window,values,event)
+		elif event == 'num_frames':
+			enforce_number(window,values,event,decimal_allowed=False)
+		elif event == 'display_rate':
+			enforce_number(window,values,event)
 	window.close()
 
 def update_channels(window, spectrum_analyzer):
@@ -157,7 +165,148 @@ def sweep_continuously(values):
 	spectrum_analyzer_inst.sweep_continuous(1)
 	spectrum_analyzer_inst.GPIB.control_ren(0)
 
+def waterfall_acquisition(spectrum_analyzer_inst, channel, waterfall, state):
+	#Runs in its own thread so that reading traces never waits on the display or the disk
+	#Each trace is a single sweep that sweep() waits to complete, so every trace is one whole sweep and none are skipped
+	#waterfall row 0 holds the x axis and column 0 holds the timestamp [s] at the end of each sweep
+	#Errors are kept in state['error'] for the GUI to report, the thread always sets state['stop'] so the display loop ends
+	num_rows = waterfall.shape[0]-1
+	sweep_channel = channel #the channel is selected on the first sweep only
+	try:
+		while not state['stop']:
+			spectrum_analyzer_inst.sweep(sweep_channel, print_status=False)
+			sweep_channel = 'N/A'
+			trace_time = time.time()-state['start_time']
+			power = np.array(spectrum_analyzer_inst.capture(channel, print_status=False)[1])
+			row = state['frames']%num_rows+1
+			waterfall[row,0] = trace_time
+			waterfall[row,1:] = power
+			state['frames'] += 1
+			if state['is_file'] and state['frames'] == num_rows:
+				break
+	except Exception as e:
+		state['error'] = str(e)
+		print(" Waterfall acquisition stopped: "+str(e))
+	finally:
+		state['stop'] = True
+
+def update_waterfall_image(image, waterfall, frames, num_frames):
+	#Shows the recorded traces, oldest first
+	if frames > num_frames:
+		#ring buffer has wrapped
+		traces = np.roll(waterfall[1:,1:], -(frames%num_frames), axis=0)
+	else:
+		traces = waterfall[1:,1:]
+	finite_power = traces[np.isfinite(traces)]
+	if len(finite_power):
+		image.set_clim(finite_power.max()-50, finite_power.max())
+	image.set_data(traces)
+
+def record_waterfall(window, values):
+	import matplotlib.pyplot as plt
+	#Records timestamped traces of back to back single sweeps
+	#If saving, traces are streamed into a preallocated .npy file, otherwise the most recent traces are kept in a ring buffer
+	#Save current settings to default file
+	if not os.path.isdir(GUI_defaults_dir):
+		os.makedirs(GUI_defaults_dir)
+		print(" Created new directory:", GUI_defaults_dir)
+		window.Refresh()
+	with open(os.path.join(GUI_defaults_dir, GUI_file),"w") as f:
+		for field, value in values.items():
+			if field != "output":
+				f.write(field+": "+str(value)+"\n")
+	### Get parameters from GUI
+	user_name = values['User_name']
+	device_name = values['Device_name']
+	spectrum_analyzer = values['Spectrum_analyzer']
+	spectrum_analyzer_channel = values['Channel']
+	num_frames = max(int(values['num_frames']),1)
+	display_rate = max(float(values['display_rate']),0.1) #[fps]
+	save_fig = values['Save_fig']
+	save_data = save_fig
+	### Initialize other parameters
+	characterization_directory = os.path.join('..','Data',user_name)
+	### Name Output Files
+	[npy_location, png_location, device_name] = get_file_locations_GUI(save_data, save_fig, characterization_directory, 'Waterfall', device_name, data_extension='.npy')
+	if device_name == '-NULL-':
+		return
+	### Connect to Lab Equipment
+	spectrum_analyzer_inst = connect_to_GPIB(spectrum_analyzer)
+	if not spectrum_analyzer_inst:
+		return
+	x_is_freq = spectrum_analyzer_inst.isESA
+	### Prepare waterfall
+	x_data = np.array(spectrum_analyzer_inst.capture(spectrum_analyzer_channel, print_status=False)[0])
+	if save_data:
+		waterfall = np.lib.format.open_memmap(npy_location, mode='w+', dtype=np.float32, shape=(num_frames+1, len(x_data)+1))
+		waterfall[1:,0] = np.nan #marks traces that were never recorded
+	else:
+		waterfall = np.full((num_frames+1, len(x_data)+1), np.nan, dtype=np.float32)
+	waterfall[0,0] = np.nan
+	waterfall[0,1:] = x_data
+	state = {'stop': False, 'frames': 0, 'is_file': save_data, 'start_time': time.time(), 'error': None}
+	acquisition_thread = threading.Thread(target=waterfall_acquisition, args=(spectrum_analyzer_inst, spectrum_analyzer_channel, waterfall, state), daemon=True)
+	acquisition_thread.start()
+	print(" Recording waterfall...")
+	window.refresh()
+	### Live display, refreshed independently of the sweep rate
+	plt.ion()
+	fig, ax = plt.subplots()
+	plt.title(str(device_name))
+	image = ax.imshow(np.full((num_frames, len(x_data)), np.nan), aspect='auto', origin='lower', interpolation='nearest', extent=[x_data[0], x_data[-1], 0, num_frames])
+	fig.colorbar(image, ax=ax, label='Power [dBm]')
+	if x_is_freq:
+		ax.set_xlabel('Frequency [GHz]')
+	else:
+		ax.set_xlabel('Wavelength [nm]')
+	ax.set_ylabel('Trace')
+	loading_layout = [[psg.Text('Traces Recorded: 0', key='progress_text')],
+	[psg.Push(), psg.Button('Stop', key='Cancel')]]
+	loading_window = psg.Window("Waterfall Progress", loading_layout)
+	loading_window.finalize()
+	while not state['stop']:
+		event, _ = loading_window.read(timeout=1000/display_rate)
+		if event == psg.WIN_CLOSED or event == 'Cancel' or not plt.fignum_exists(fig.number):
+			break
+		frames = state['frames']
+		if frames == 0:
+			continue
+		update_waterfall_image(image, waterfall, frames, num_frames)
+		elapsed_time = time.time()-state['start_time']
+		loading_window['progress_text'].update(value='Traces Recorded: '+str(frames)+' ({:.2f}'.format(frames/elapsed_time)+' traces/s)')
+		fig.canvas.draw_idle()
+		fig.canvas.flush_events()
+	state['stop'] = True
+	acquisition_thread.join()
+	loading_window.close()
+	#the display may have stopped before the last traces were drawn
+	if state['frames'] > 0:
+		update_waterfall_image(image, waterfall, state['frames'], num_frames)
+		if plt.fignum_exists(fig.number):
+			fig.canvas.draw_idle()
+			fig.canvas.flush_events()
+	spectrum_analyzer_inst.GPIB.control_ren(0)
+	print(" Recorded "+str(state['frames'])+" traces ({:.2f}".format(state['frames']/(time.time()-state['start_time']))+" traces/s)")
+	print(" Disconnected from Spectrum Analyzer")
+	window.refresh()
+	if state['error'] is not None:
+		psg.popup("Waterfall stopped after "+str(state['frames'])+" traces: "+state['error'])
+	#Save data to file
+	if save_data:
+		waterfall.flush()
+		del waterfall
+		print(" Data saved to",npy_location)
+		window.refresh()
+	if save_fig and plt.fignum_exists(fig.number):
+		fig.savefig(png_location,bbox_inches='tight')
+		print(" Figure saved to",png_location)
+		window.refresh()
+	plt.ioff()
+	plt.close(fig)
+	window.refresh()
+
 def Spectrum_Analyzer_Capture(window,values):
+	import matplotlib.pyplot as plt
 	#Save current settings to default file
 	if not os.path.isdir(GUI_defaults_dir):
 		os.makedirs(GUI_defaults_dir)
@@ -206,9 +355,12 @@ def Spectrum_Analyzer_Capture(window,values):
 		full_data[:,0] = x_data
 		full_data[:,1] = power
 		if x_is_freq:
-			np.savetxt(csv_location, full_data , delimiter=',', header='Frequency [GHz], Power [dBm]', comments='')
+			columns = ['Frequency [GHz]', 'Power [dBm]']
 		else:
-			np.savetxt(csv_location, full_data , delimiter=',', header='Wavelength [nm], Power [dBm]', comments='')
+			columns = ['Wavelength [nm]', 'Power [dBm]']
+		attributes = gui_attributes(values)
+		attributes.update(instrument_attributes({'spectrum_analyzer': spectrum_analyzer_inst}))
+		save_data_file(csv_location, full_data, columns, attributes)
 		print(" Data saved to",csv_location)
 		window.refresh()
 	#Plot data
@@ -1,21 +1,24 @@
 #########################################################################
 # Script to take spectrum at different current values using	various lab #
 # equipment                                                             #
+# Progress is checkpointed after each spectrum, Resume continues an     #
+# interrupted sweep from the first spectrum not yet captured            #
 #                                                                       #
 # Author: Trevor Stirling                                               #
 # Date: Oct 15, 2024                                                    #
 #########################################################################
 
 import numpy as np
-import matplotlib.pyplot as plt
 import sys, os
 import time
-from GUI_common_functions import BluePSGButton,enforce_number,plus_button,minus_button,get_file_locations_GUI,connect_to_GPIB,plot_spectrum
+from datetime import date
+from GUI_common_functions import BluePSGButton,enforce_number,plus_button,minus_button,connect_to_GPIB,plot_spectrum,save_data_file,gui_attributes,instrument_attributes,save_checkpoint,load_checkpoint,remove_checkpoint,pending_indices,Run_Namer,analyze_spectrum,Figure_Renderer,read_data_file,bias_map_slices,save_summary_figure
 import PySimpleGUI as psg
 
 font = 'Tahoma'
 GUI_defaults_dir = os.path.join(os.path.dirname(__file__),"GUI Defaults")
 GUI_file = os.path.basename(__file__).replace(" GUI.py",".txt")
+checkpoint_file = os.path.join(GUI_defaults_dir, GUI_file.replace(".txt","_checkpoint.json"))
 
 def GUI(debug=False):
 	#Options
@@ -43,7 +46,7 @@ def GUI(debug=False):
 	[psg.pin(psg.Column(current_source_layout(4),key='source_4_options',visible=False))],
 	[psg.Push(),psg.pin(psg.Column(current_source_title(5),key='source_5_title',visible=False)),psg.Push()],
 	[psg.pin(psg.Column(current_source_layout(5),key='source_5_options',visible=False))],
-	[BluePSGButton('Ω Check'), psg.Push(), psg.Checkbox('Display', size=(8,1), key='Display_fig', default=False), psg.Checkbox('Save', size=(6,1), key='Save_fig', default=True), BluePSGButton('Capture Sweep'), BluePSGButton('Exit')], #push adds flexible whitespace
+	[BluePSGButton('Ω Check'), psg.Push(), psg.Checkbox('Summary only', size=(12,1), key='summary_only', default=False), psg.Checkbox('Display', size=(8,1), key='Display_fig', default=False), psg.Checkbox('Save', size=(6,1), key='Save_fig', default=True), BluePSGButton('Capture Sweep'), BluePSGButton('Resume'), BluePSGButton('Exit')], #push adds flexible whitespace
 	print_window]
 	#Create window
 	window = psg.Window('Spectrum Current Sweep',layout, resizable=True)
@@ -95,6 +98,12 @@ def GUI(debug=False):
 		#data validation
 		elif event == 'Capture Sweep':
 			Spectrum_Analyzer_Capture_Source_Sweep(window,values)
+		elif event == 'Resume':
+			checkpoint = load_checkpoint(checkpoint_file)
+			if checkpoint is None:
+				psg.popup("There is no interrupted sweep to resume")
+			else:
+				Spectrum_Analyzer_Capture_Source_Sweep(window,checkpoint['values'],checkpoint)
 		elif event == 'Ω Check':
 			resistance_check(window, values)
 		elif event == 'Spectrum_analyzer':
@@ -201,7 +210,8 @@ def resistance_check(window,values):
 	window.Refresh()
 	Source_inst.GPIB.control_ren(0)
 
-def Spectrum_Analyzer_Capture_Source_Sweep(window, values):
+def Spectrum_Analyzer_Capture_Source_Sweep(window, values, checkpoint=None):
+	import matplotlib.pyplot as plt
 	#Save current settings to default file
 	if not os.path.isdir(GUI_defaults_dir):
 		os.makedirs(GUI_defaults_dir)
@@ -219,6 +229,7 @@ def Spectrum_Analyzer_Capture_Source_Sweep(window, values):
 	adjust_center = values['adjust_center']
 	display_fig = values['Display_fig']
 	save_fig = values['Save_fig']
+	summary_only = values.get('summary_only', False) #spectral and SMSR maps for the whole sweep instead of a figure per spectrum
 	save_data = save_fig
 	#Spectrum Analyzer
 	spectrum_analyzer = values['Spectrum_analyzer']
@@ -371,7 +382,6 @@ def Spectrum_Analyzer_Capture_Source_Sweep(window, values):
 		Source_start_5 = Source_start_5*1e-3
 		Source_stop_5 = Source_stop_5*1e-3
 	### Sweep current and collect data
-	sweep_num = 0
 	if Source_1.lower() == 'off':
 		psg.popup("Source #1 must be enabled.")
 		return
@@ -393,143 +403,216 @@ def Spectrum_Analyzer_Capture_Source_Sweep(window, values):
 	else:
 		Source_input_list_5 = [x for x in np.arange(Source_start_5,Source_stop_5+Source_step_5/2,Source_step_5)]
 	num_sweeps = len(Source_input_list_1)*len(Source_input_list_2)*len(Source_input_list_3)*len(Source_input_list_4)*len(Source_input_list_5)
-	for i5 in range(len(Source_input_list_5)):
-		if Source_5.lower() != 'off':
-			if i5 > 0:
-				Source_inst_5.set_value(Source_input_list_5[i5])
-			else:
-				Source_inst_5.safe_turn_on(Source_input_list_5[i5])
-			if Source_5_mode == 'Current':
-				print(" Source #5 = "+str(round(Source_input_list_5[i5]*1e3))+" mA")
-			else:
-				print(" Source #5 = "+str(round(Source_input_list_5[i5]*10)/10)+" V")
-			window.refresh()
-		for i4 in range(len(Source_input_list_4)):
-			if Source_4.lower() != 'off':
-				if i4 > 0:
-					Source_inst_4.set_value(Source_input_list_4[i4])
+	### Checkpoint captured spectra so an interrupted run can be resumed
+	if checkpoint is None:
+		if load_checkpoint(checkpoint_file) is not None and psg.popup_yes_no("An interrupted sweep can still be resumed. Start a new sweep and discard it?") != 'Yes':
+			return
+		checkpoint = {'values': {field: value for field, value in values.items() if field != 'output'}, 'folder_date': date.today().strftime("%Y_%m_%d"), 'completed': [], 'setpoints': {}}
+	else:
+		print(" Resuming sweep, "+str(len(checkpoint['completed']))+"/"+str(num_sweeps)+" spectra already captured")
+		window.refresh()
+		#sources may have been left on when the sweep was interrupted
+		for Source, Source_inst in [(Source_1,Source_inst_1),(Source_2,Source_inst_2),(Source_3,Source_inst_3),(Source_4,Source_inst_4),(Source_5,Source_inst_5)]:
+			if Source.lower() != 'off':
+				Source_inst.safe_turn_off()
+	#output names are resolved without popups so a taken name never stops the sweep, a resumed sweep keeps its run_id
+	namer = Run_Namer(save_data, save_fig, characterization_directory, 'Spectrum', checkpoint['folder_date'], run_id=checkpoint.get('run_id'))
+	checkpoint['run_id'] = namer.run_id
+	save_checkpoint(checkpoint_file, checkpoint)
+	#figures that are not displayed are saved in the background while the next spectrum is captured
+	renderer = Figure_Renderer()
+	try:
+		#with summary_only every spectrum is kept for the summary figures, spectra captured before a resume are read back from their files
+		summary_spectra = {}
+		if 'files' not in checkpoint:
+			checkpoint['files'] = ['']*len(checkpoint['completed'])
+		if summary_only:
+			for index, file in zip(checkpoint['completed'], checkpoint['files']):
+				if os.path.isfile(file):
+					data = read_data_file(file).data
+					summary_spectra[tuple(index)] = (data[:,0].astype(np.float32), data[:,1].astype(np.float32), analyze_spectrum(data[:,0], data[:,1], x_is_freq=x_is_freq).SMSR)
+		pending = pending_indices((len(Source_input_list_5),len(Source_input_list_4),len(Source_input_list_3),len(Source_input_list_2),len(Source_input_list_1)), checkpoint['completed'])
+		sweep_num = len(checkpoint['completed'])
+		#the first setpoint of each source is ramped to from off, later ones are set directly
+		Source_on = [False]*6
+		for i5 in range(len(Source_input_list_5)):
+			if (i5,) not in pending:
+				continue
+			if Source_5.lower() != 'off':
+				if Source_on[5]:
+					Source_inst_5.set_value(Source_input_list_5[i5])
 				else:
-					Source_inst_4.safe_turn_on(Source_input_list_4[i4])
-				if Source_4_mode == 'Current':
-					print(" Source #4 = "+str(round(Source_input_list_4[i4]*1e3))+" mA")
+					Source_inst_5.safe_turn_on(Source_input_list_5[i5])
+					Source_on[5] = True
+				if Source_5_mode == 'Current':
+					print(" Source #5 = "+str(round(Source_input_list_5[i5]*1e3))+" mA")
 				else:
-					print(" Source #4 = "+str(round(Source_input_list_4[i4]*10)/10)+" V")
+					print(" Source #5 = "+str(round(Source_input_list_5[i5]*10)/10)+" V")
 				window.refresh()
-			for i3 in range(len(Source_input_list_3)):
-				if Source_3.lower() != 'off':
-					if i3 > 0:
-						Source_inst_3.set_value(Source_input_list_3[i3])
+			for i4 in range(len(Source_input_list_4)):
+				if (i5,i4) not in pending:
+					continue
+				if Source_4.lower() != 'off':
+					if Source_on[4]:
+						Source_inst_4.set_value(Source_input_list_4[i4])
 					else:
-						Source_inst_3.safe_turn_on(Source_input_list_3[i3])
-					if Source_3_mode == 'Current':
-						print(" Source #3 = "+str(round(Source_input_list_3[i3]*1e3))+" mA")
+						Source_inst_4.safe_turn_on(Source_input_list_4[i4])
+						Source_on[4] = True
+					if Source_4_mode == 'Current':
+						print(" Source #4 = "+str(round(Source_input_list_4[i4]*1e3))+" mA")
 					else:
-						print(" Source #3 = "+str(round(Source_input_list_3[i3]*10)/10)+" V")
+						print(" Source #4 = "+str(round(Source_input_list_4[i4]*10)/10)+" V")
 					window.refresh()
-				for i2 in range(len(Source_input_list_2)):
-					if Source_2.lower() != 'off':
-						if i2 > 0:
-							Source_inst_2.set_value(Source_input_list_2[i2])
-						else:
-							Source_inst_2.safe_turn_on(Source_input_list_2[i2])
-						if Source_2_mode == 'Current':
-							print(" Source #2 = "+str(round(Source_input_list_2[i2]*1e3))+" mA")
+				for i3 in range(len(Source_input_list_3)):
+					if (i5,i4,i3) not in pending:
+						continue
+					if Source_3.lower() != 'off':
+						if Source_on[3]:
+							Source_inst_3.set_value(Source_input_list_3[i3])
 						else:
-							print(" Source #2 = "+str(round(Source_input_list_2[i2]*10)/10)+" V")
-						window.refresh()
-					for i1 in range(len(Source_input_list_1)):
-						if Source_1_mode == 'Current':
-							print(" Source #1 = "+str(round(Source_input_list_1[i1]*1e3))+" mA")
+							Source_inst_3.safe_turn_on(Source_input_list_3[i3])
+							Source_on[3] = True
+						if Source_3_mode == 'Current':
+							print(" Source #3 = "+str(round(Source_input_list_3[i3]*1e3))+" mA")
 						else:
-							print(" Source #1 = "+str(round(Source_input_list_1[i1]*10)/10)+" V")
-						window.refresh()
-						if i1 > 0:
-							Source_inst_1.set_value(Source_input_list_1[i1])
-						else:
-							Source_inst_1.safe_turn_on(Source_input_list_1[i1])
-						# Delay to let sources stabilize
-						time.sleep(0.1)
-						### Collect Spectrum
-						sweep_num += 1
-						print(" Spectrum Analyzer sweeping "+str(sweep_num)+"/"+str(num_sweeps)+"...")
-						print(" Sweeping...")
-						window.refresh()
-						spectrum_analyzer_inst.sweep(spectrum_analyzer_channel, print_status=False)
-						print(" Sweep complete")
-						print(" Capturing...")
-						window.refresh()
-						x_data, power = spectrum_analyzer_inst.capture(spectrum_analyzer_channel, print_status=False)
-						print(" Capture complete")
+							print(" Source #3 = "+str(round(Source_input_list_3[i3]*10)/10)+" V")
 						window.refresh()
-						if adjust_center and max(power)>-50:
-							spectrum_analyzer_inst.peak_to_center()
-						if num_sweeps == 1:
-							Source_inst_1.GPIB.control_ren(0)
-							print(" Disconnected from instruments")
-						### Name Output Files
-						scan_name = device_name
-						if Source_5.lower() != 'off':
-							if Source_5_mode == 'Current':
-								scan_name += '_'+str(round(Source_input_list_5[i5]*1e3))+'mA'
-							elif Source_5_mode == 'Voltage':
-								scan_name += '_'+str(round(Source_input_list_5[i5]*10)/10)+'V'
-						if Source_4.lower() != 'off':
-							if Source_4_mode == 'Current':
-								scan_name += '_'+str(round(Source_input_list_4[i4]*1e3))+'mA'
-							elif Source_4_mode == 'Voltage':
-								scan_name += '_'+str(round(Source_input_list_4[i4]*10)/10)+'V'
-						if Source_3.lower() != 'off':
-							if Source_3_mode == 'Current':
-								scan_name += '_'+str(round(Source_input_list_3[i3]*1e3))+'mA'
-							elif Source_3_mode == 'Voltage':
-								scan_name += '_'+str(round(Source_input_list_3[i3]*10)/10)+'V'
+					for i2 in range(len(Source_input_list_2)):
+						if (i5,i4,i3,i2) not in pending:
+							continue
 						if Source_2.lower() != 'off':
+							if Source_on[2]:
+								Source_inst_2.set_value(Source_input_list_2[i2])
+							else:
+								Source_inst_2.safe_turn_on(Source_input_list_2[i2])
+								Source_on[2] = True
 							if Source_2_mode == 'Current':
-								scan_name += '_'+str(round(Source_input_list_2[i2]*1e3))+'mA'
-							elif Source_2_mode == 'Voltage':
-								scan_name += '_'+str(round(Source_input_list_2[i2]*10)/10)+'V'
-						if Source_1.lower() != 'off':
+								print(" Source #2 = "+str(round(Source_input_list_2[i2]*1e3))+" mA")
+							else:
+								print(" Source #2 = "+str(round(Source_input_list_2[i2]*10)/10)+" V")
+							window.refresh()
+						for i1 in range(len(Source_input_list_1)):
+							if (i5,i4,i3,i2,i1) not in pending:
+								continue
 							if Source_1_mode == 'Current':
-								scan_name += '_'+str(round(Source_input_list_1[i1]*1e3))+'mA'
-							elif Source_1_mode == 'Voltage':
-								scan_name += '_'+str(round(Source_input_list_1[i1]*10)/10)+'V'
-						[csv_location, png_location, scan_name] = get_file_locations_GUI(save_data, save_fig, characterization_directory, 'Spectrum', scan_name)
-						if scan_name == '-NULL-':
-							return
-						#Save data
-						if save_data:
-							full_data = np.zeros((len(power), 2))
-							full_data[:,0] = x_data
-							full_data[:,1] = power
-							if x_is_freq:
-								np.savetxt(csv_location, full_data , delimiter=',', header='Frequency [GHz], Power [dBm]', comments='')
+								print(" Source #1 = "+str(round(Source_input_list_1[i1]*1e3))+" mA")
 							else:
-								np.savetxt(csv_location, full_data , delimiter=',', header='Wavelength [nm], Power [dBm]', comments='')
-							print(" Data saved to",csv_location)
+								print(" Source #1 = "+str(round(Source_input_list_1[i1]*10)/10)+" V")
+							window.refresh()
+							if Source_on[1]:
+								Source_inst_1.set_value(Source_input_list_1[i1])
+							else:
+								Source_inst_1.safe_turn_on(Source_input_list_1[i1])
+								Source_on[1] = True
+							# Delay to let sources stabilize
+							time.sleep(0.1)
+							### Collect Spectrum
+							sweep_num += 1
+							print(" Spectrum Analyzer sweeping "+str(sweep_num)+"/"+str(num_sweeps)+"...")
+							print(" Sweeping...")
+							window.refresh()
+							spectrum_analyzer_inst.sweep(spectrum_analyzer_channel, print_status=False)
+							print(" Sweep complete")
+							print(" Capturing...")
+							window.refresh()
+							x_data, power = spectrum_analyzer_inst.capture(spectrum_analyzer_channel, print_status=False)
+							print(" Capture complete")
 							window.refresh()
-						#Plot data
-						if display_fig or save_fig:
-							fig = plot_spectrum(scan_name, x_data, power, x_is_freq=x_is_freq, show_SMSR=show_SMSR, show_FWHM=show_FWHM)[0]
-							if save_fig:
-								fig.savefig(png_location,bbox_inches='tight')
-								print(" Figure saved to",png_location)
+							if adjust_center and max(power)>-50:
+								spectrum_analyzer_inst.peak_to_center()
+							if num_sweeps == 1:
+								Source_inst_1.GPIB.control_ren(0)
+								print(" Disconnected from instruments")
+							### Name Output Files
+							scan_name = device_name
+							if Source_5.lower() != 'off':
+								if Source_5_mode == 'Current':
+									scan_name += '_'+str(round(Source_input_list_5[i5]*1e3))+'mA'
+								elif Source_5_mode == 'Voltage':
+									scan_name += '_'+str(round(Source_input_list_5[i5]*10)/10)+'V'
+							if Source_4.lower() != 'off':
+								if Source_4_mode == 'Current':
+									scan_name += '_'+str(round(Source_input_list_4[i4]*1e3))+'mA'
+								elif Source_4_mode == 'Voltage':
+									scan_name += '_'+str(round(Source_input_list_4[i4]*10)/10)+'V'
+							if Source_3.lower() != 'off':
+								if Source_3_mode == 'Current':
+									scan_name += '_'+str(round(Source_input_list_3[i3]*1e3))+'mA'
+								elif Source_3_mode == 'Voltage':
+									scan_name += '_'+str(round(Source_input_list_3[i3]*10)/10)+'V'
+							if Source_2.lower() != 'off':
+								if Source_2_mode == 'Current':
+									scan_name += '_'+str(round(Source_input_list_2[i2]*1e3))+'mA'
+								elif Source_2_mode == 'Voltage':
+									scan_name += '_'+str(round(Source_input_list_2[i2]*10)/10)+'V'
+							if Source_1.lower() != 'off':
+								if Source_1_mode == 'Current':
+									scan_name += '_'+str(round(Source_input_list_1[i1]*1e3))+'mA'
+								elif Source_1_mode == 'Voltage':
+									scan_name += '_'+str(round(Source_input_list_1[i1]*10)/10)+'V'
+							[csv_location, png_location, scan_name] = namer.get_file_locations(scan_name)
+							if scan_name == '-NULL-':
+								return
+							#Save data
+							if save_data:
+								full_data = np.zeros((len(power), 2))
+								full_data[:,0] = x_data
+								full_data[:,1] = power
+								if x_is_freq:
+									columns = ['Frequency [GHz]', 'Power [dBm]']
+								else:
+									columns = ['Wavelength [nm]', 'Power [dBm]']
+								attributes = gui_attributes(values)
+								attributes.update(instrument_attributes({'source_1': Source_inst_1, 'source_2': Source_inst_2, 'source_3': Source_inst_3, 'source_4': Source_inst_4, 'source_5': Source_inst_5, 'spectrum_analyzer': spectrum_analyzer_inst}))
+								save_data_file(csv_location, full_data, columns, attributes)
+								print(" Data saved to",csv_location)
 								window.refresh()
-							if display_fig:
+							#Plot data
+							if summary_only:
+								summary_spectra[(i5,i4,i3,i2,i1)] = (np.asarray(x_data, dtype=np.float32), np.asarray(power, dtype=np.float32), analyze_spectrum(x_data, power, x_is_freq=x_is_freq).SMSR)
+							elif display_fig:
+								fig = plot_spectrum(scan_name, x_data, power, x_is_freq=x_is_freq, show_SMSR=show_SMSR, show_FWHM=show_FWHM)[0]
+								if save_fig:
+									fig.savefig(png_location,bbox_inches='tight')
+									print(" Figure saved to",png_location)
 								print(" Displaying figure. Close figure to resume.")
 								window.refresh()
 								plt.show()
-							else:
-								plt.close()
-						print("")
-					Source_inst_1.safe_turn_off()
-				if Source_2.lower() != 'off':
-					Source_inst_2.safe_turn_off()
-			if Source_3.lower() != 'off':
-				Source_inst_3.safe_turn_off()
-		if Source_4.lower() != 'off':
-			Source_inst_4.safe_turn_off()
-	if Source_5.lower() != 'off':
-		Source_inst_5.safe_turn_off()
+							elif save_fig:
+								result = analyze_spectrum(x_data, power, x_is_freq=x_is_freq)
+								renderer.submit(png_location, 'draw_spectrum', scan_name, x_data, power, result, show_SMSR=show_SMSR, show_FWHM=show_FWHM, x_is_freq=x_is_freq)
+								window.refresh()
+							checkpoint['completed'].append([i5,i4,i3,i2,i1])
+							checkpoint['files'].append(csv_location)
+							checkpoint['setpoints'] = {'source_'+str(n): float(Source_input_list[i]) for n, Source, Source_input_list, i in [(1,Source_1,Source_input_list_1,i1),(2,Source_2,Source_input_list_2,i2),(3,Source_3,Source_input_list_3,i3),(4,Source_4,Source_input_list_4,i4),(5,Source_5,Source_input_list_5,i5)] if Source.lower() != 'off'}
+							save_checkpoint(checkpoint_file, checkpoint)
+							print("")
+						Source_inst_1.safe_turn_off()
+						Source_on[1] = False
+					if Source_2.lower() != 'off':
+						Source_inst_2.safe_turn_off()
+						Source_on[2] = False
+				if Source_3.lower() != 'off':
+					Source_inst_3.safe_turn_off()
+					Source_on[3] = False
+			if Source_4.lower() != 'off':
+				Source_inst_4.safe_turn_off()
+				Source_on[4] = False
+		if Source_5.lower() != 'off':
+			Source_inst_5.safe_turn_off()
+		### Summary figures
+		if summary_only and len(summary_spectra) > 0 and (display_fig or save_fig):
+			sources = [('Source #'+str(n), 'mA' if Source_mode == 'Current' else 'V', [x*1e3 if Source_mode == 'Current' else x for x in Source_input_list]) for n, Source_mode, Source_input_list in [(5,Source_5_mode,Source_input_list_5),(4,Source_4_mode,Source_input_list_4),(3,Source_3_mode,Source_input_list_3),(2,Source_2_mode,Source_input_list_2),(1,Source_1_mode,Source_input_list_1)]]
+			#one spectral map against source #1 for each setpoint of the other sources
+			for outer_index in sorted(set(index[:4] for index in summary_spectra)):
+				indices = sorted(index for index in summary_spectra if index[:4] == outer_index)
+				name_suffix = ''.join('_'+"{:g}".format(sources[n][2][i])+sources[n][1] for n, i in enumerate(outer_index) if len(sources[n][2]) > 1)
+				save_summary_figure(namer, renderer, device_name+'_spectral_map'+name_suffix, display_fig, save_fig, 'draw_spectral_map', device_name+name_suffix, [sources[4][2][index[4]] for index in indices], [summary_spectra[index][0] for index in indices], [summary_spectra[index][1] for index in indices], sources[4][0]+' ['+sources[4][1]+']', x_is_freq)
+			for name_suffix, x_values, y_values, z, x_label, y_label in bias_map_slices({index: spectrum[2] for index, spectrum in summary_spectra.items()}, sources):
+				save_summary_figure(namer, renderer, device_name+'_SMSR_map'+name_suffix, display_fig, save_fig, 'draw_SMSR_map', device_name+name_suffix, x_values, y_values, z, x_label, y_label)
+	finally:
+		renderer.close()
+	remove_checkpoint(checkpoint_file)
 	if num_sweeps > 1:
 		Source_inst_1.GPIB.control_ren(0)
 		print(" Disconnected from instruments")
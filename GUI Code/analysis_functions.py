@@ -0,0 +1,394 @@
+#########################################################################
+# Functions to extract figures of merit from measured data              #
+# Nothing here creates a figure or imports matplotlib, so these can be  #
+# used in batch analysis and sweep loops. Drawing is in plot_functions  #
+# -analyze_LIV()                                                        #
+# -analyze_spectrum()                                                   #
+# -analyze_FP_Loss()                                                    #
+# -analyze_autocorrelator()                                             #
+# -analyze_intensity_autocorrelation()                                  #
+# -fit_threshold()                                                      #
+# -preprocess_autocorrelation()                                         #
+# -FP_FSR()                                                             #
+#                                                                       #
+# Author: Trevor Stirling, agent                                        #
+# Date: Oct 18, 2026                                                    #
+#########################################################################
+
+import numpy as np
+import math
+from collections import namedtuple
+from functools import lru_cache
+from scipy.ndimage import maximum_filter1d, minimum_filter1d
+from scipy.stats import t as t_distribution
+from pulse_fitting import fit_pulse, pulse_initial_guess, sech_squared
+
+#Results returned by the analyze functions
+#current [mA], power [mW], threshold_current [mA], slopes [mW/mA/facet]
+LIV_Result = namedtuple('LIV_Result', ['current', 'voltage', 'power', 'power2', 'threshold_current', 'pre_thresh_slope', 'post_thresh_slope', 'good_fit', 'current_fit', 'fit_params'])
+#units follow the inputs of fit_threshold, threshold_CI is (lower, upper)
+Threshold_Fit = namedtuple('Threshold_Fit', ['threshold', 'threshold_sd', 'threshold_CI', 'pre_thresh_slope', 'post_thresh_slope', 'intercept', 'break_index', 'fit_end'])
+#x in [nm] or [GHz], power in [dBm]
+Spectrum_Result = namedtuple('Spectrum_Result', ['max_x', 'max_power', 'SMSR', 'SM_x', 'SM_power', 'FWHM', 'FW_start', 'FW_end', 'HM'])
+#power normalized to its maximum, FSR [nm], loss [m^-1], loss_sd is the standard error of the mean over fringes
+FP_Loss_Result = namedtuple('FP_Loss_Result', ['wavelength', 'power', 'FSR', 'contrast', 'loss', 'loss_sd', 'fringe_wavelength', 'fringe_contrast', 'fringe_loss'])
+#time [fs], FWHM is the autocorrelation FWHM and pulse_FWHM the corresponding sech^2 pulse FWHM, R_squared is for the fit
+Autocorrelation_Result = namedtuple('Autocorrelation_Result', ['time', 'intensity', 'fit_type', 'FWHM', 'pulse_FWHM', 'fit_params', 'lower_params', 'upper_envelope_index', 'lower_envelope_index', 'intensity_low', 'R_squared'])
+
+def analyze_LIV(power, current, voltage, power2=False):
+	#Expects power [W], current [A] and voltage [V]
+	power = (np.asarray(power, dtype=float)-power[0])*1000 #converts from [W] to [mW] and zeros background
+	if power2 is not False and power2 is not None:
+		power2 = (np.asarray(power2, dtype=float)-power2[0])*1000 #converts from [W] to [mW] and zeros background
+	else:
+		power2 = False
+	current = np.asarray(current, dtype=float)*1000 #converts from [A] to [mA]
+	voltage = np.asarray(voltage, dtype=float)
+	#Fit two lines meeting at threshold
+	if len(power)<4:
+		#can not curve fit
+		return LIV_Result(current, voltage, power, power2, 0, 0, 0, False, current[:0], None)
+	fit = fit_threshold(current, power)
+	current_fit = current[0:fit.fit_end]
+	threshold_current = fit.threshold #[mA]
+	pre_thresh_slope = fit.pre_thresh_slope #[mW/mA/facet]
+	post_thresh_slope = fit.post_thresh_slope #[mW/mA/facet]
+	params = [threshold_current, fit.intercept, pre_thresh_slope, post_thresh_slope-pre_thresh_slope] #as used by piecewise_linear
+	good_fit = False
+	#Check if standard deviation on threshold current is within 1/10 of the value chosen - experimental, consider changing to a better test
+	if fit.threshold_sd < threshold_current/10 and post_thresh_slope-pre_thresh_slope>pre_thresh_slope*1.5: #increase in slope at threshold, as the piecewise_linear fit gave
+		good_fit = True
+	return LIV_Result(current, voltage, power, power2, threshold_current, pre_thresh_slope, post_thresh_slope, good_fit, current_fit, params)
+
+def analyze_spectrum(x_data, power, peak_width=15, x_is_freq=False):
+	return Spectrum_Result(*spectrum_features(x_data, power, peak_width, x_is_freq))
+
+def analyze_FP_Loss(power, wavelength, L=1e-3, neff=3.14, peak_width=15):
+	#Hakki-Paoli loss from the contrast of every fringe, L [m], wavelength [nm]
+	#Scans with gaps (multiple segments) are split and each segment is treated separately
+	#peak_width [points] is only used if no FSR can be found from the Fourier spectrum
+	power = np.asarray(power, dtype=float)
+	power = power/np.max(power) #[W to A.U.]
+	wavelength = np.asarray(wavelength, dtype=float)
+	R = ((neff-1)/(neff+1))**2
+	FSRs = []
+	segment_lengths = []
+	fringe_wavelength = []
+	fringe_contrast = []
+	for segment in scan_segments(wavelength):
+		segment_wavelength = wavelength[segment]
+		segment_power = power[segment]
+		FSR = FP_FSR(segment_wavelength, segment_power)
+		if math.isnan(FSR):
+			window = peak_width
+		else:
+			FSRs.append(FSR)
+			segment_lengths.append(len(segment_power))
+			window = max(int(FSR/np.median(np.abs(np.diff(segment_wavelength)))/2), 3)
+		peaks, troughs = fringe_extrema(segment_power, window)
+		if len(peaks) == 0 or len(troughs) < 2:
+			continue
+		#Contrast of each peak against the trough level interpolated to its wavelength
+		peaks = peaks[(peaks > troughs[0]) & (peaks < troughs[-1])]
+		trough_level = np.interp(peaks, troughs, segment_power[troughs])
+		fringe_wavelength.append(segment_wavelength[peaks])
+		fringe_contrast.append(segment_power[peaks]/trough_level)
+	fringe_wavelength = np.concatenate(fringe_wavelength) if fringe_wavelength else np.array([])
+	fringe_contrast = np.concatenate(fringe_contrast) if fringe_contrast else np.array([])
+	with np.errstate(divide='ignore', invalid='ignore'):
+		fringe_loss = -1/2/L*np.log((np.sqrt(fringe_contrast)-1)/(np.sqrt(fringe_contrast)+1)/R) #[m^-1]
+	valid = np.isfinite(fringe_loss)
+	FSR = np.average(FSRs, weights=segment_lengths) if FSRs else np.nan
+	if np.any(valid):
+		contrast = np.mean(fringe_contrast[valid])
+		loss = np.mean(fringe_loss[valid])
+		loss_sd = np.std(fringe_loss[valid], ddof=1)/math.sqrt(np.sum(valid)) if np.sum(valid) > 1 else np.nan
+	else:
+		contrast = loss = loss_sd = np.nan
+	return FP_Loss_Result(wavelength, power, FSR, contrast, loss, loss_sd, fringe_wavelength, fringe_contrast, fringe_loss)
+
+def analyze_autocorrelator(time, intensity, envelope_reduction_factor=20, plot_lower=False, normalize=True, cutoff_freq=200e12, fit_type='low_pass'):
+	#intensity can be one trace or a 2D array of repeated scans, which are averaged
+	time = np.asarray(time, dtype=float) #[fs]
+	intensity = preprocess_autocorrelation(time, intensity, normalize) #[A.U.] normalized to a peak of 8 for an interferometric autocorrelation
+	lower_params = None
+	upper_envelope_index = None
+	lower_envelope_index = None
+	intensity_low = None
+	if fit_type == 'envelope':
+		lower_envelope_index, upper_envelope_index = envelope_indices(intensity, envelope_reduction_factor, envelope_reduction_factor)
+		#estimate upper envelope fitting parameters and fit
+		fit = fit_pulse(time[upper_envelope_index], intensity[upper_envelope_index], 'sech2')
+		if plot_lower:
+			#estimate lower envelope fitting parameters and fit
+			lower_params = fit_pulse(time[lower_envelope_index], intensity[lower_envelope_index], 'sech2').params
+	else:
+		#Filter
+		intensity_low = low_pass_filter(time, intensity, cutoff_freq)
+		#Fit
+		fit = fit_pulse(time, intensity_low, 'sech2')
+	return Autocorrelation_Result(time, intensity, fit_type, fit.FWHM, fit.pulse_FWHM, fit.params, lower_params, upper_envelope_index, lower_envelope_index, intensity_low, fit.R_squared)
+
+def analyze_intensity_autocorrelation(time, intensity, normalize=True, len_background=15):
+	if normalize:
+		intensity_max = max(intensity)
+		intensity = [i/intensity_max for i in intensity]
+	intensity = np.array(intensity) #[A.U.]
+	time = np.array(time) #[fs]
+	#Fit, with the offset estimated from the first len_background points
+	offset_estimate = np.mean(intensity[:len_background])
+	p0 = pulse_initial_guess(time, intensity, 'sech2')[0]
+	p0[1] += p0[0]-offset_estimate
+	p0[0] = offset_estimate
+	fit = fit_pulse(time, intensity, 'sech2', p0)
+	return Autocorrelation_Result(time, intensity, 'intensity', fit.FWHM, fit.pulse_FWHM, fit.params, None, None, None, None, fit.R_squared)
+
+def find_FW(x,y,width_y,middle_out=False,interpolate=False):
+	#Finds the full width of the peak at height width_y
+	#middle_out searches outwards from the peak for the first crossing, otherwise the outermost points above width_y are used
+	#interpolate places the edges on linearly interpolated crossings instead of on samples
+	x = np.asarray(x)
+	y = np.asarray(y)
+	y_max_index = int(np.argmax(y))
+	if middle_out:
+		below_after = np.flatnonzero(y[y_max_index+1:]<=width_y)+y_max_index+1
+		below_before = np.flatnonzero(y[:y_max_index]<=width_y)
+		if interpolate:
+			FW_end = crossing(x,y,below_after[0]-1,width_y) if len(below_after) else x[-1]
+			FW_start = crossing(x,y,below_before[-1],width_y) if len(below_before) else x[0]
+		else:
+			FW_end = x[below_after[0]-1] if len(below_after) and below_after[0] != len(y)-1 else x[-1]
+			FW_start = x[below_before[-1]+1] if len(below_before) and below_before[-1] != 0 else x[0]
+	else:
+		above_after = np.flatnonzero(y[y_max_index+1:]>=width_y)+y_max_index+1
+		above_before = np.flatnonzero(y[:y_max_index]>=width_y)
+		if interpolate:
+			last_above = above_after[-1] if len(above_after) else y_max_index
+			first_above = above_before[0] if len(above_before) else y_max_index
+			FW_end = crossing(x,y,last_above,width_y) if last_above != len(y)-1 else x[-1]
+			FW_start = crossing(x,y,first_above-1,width_y) if first_above != 0 else x[0]
+		else:
+			FW_end = x[above_after[-1]] if len(above_after) and above_after[-1] != y_max_index+1 else x[y_max_index]
+			FW_start = x[above_before[0]] if len(above_before) and above_before[0] != y_max_index-1 else x[y_max_index]
+	FWHM = FW_end-FW_start
+	return [FWHM,FW_start,FW_end]
+
+def crossing(x,y,i,level):
+	#Linearly interpolates where y crosses level between samples i and i+1
+	if y[i+1] == y[i]:
+		return x[i]
+	return x[i]+(level-y[i])/(y[i+1]-y[i])*(x[i+1]-x[i])
+
+def spectrum_features(x_data, power, peak_width=15, x_is_freq=False, interpolate=False):
+	#Finds the main peak, strongest side mode and FWHM of a spectrum
+	#A side mode must be the highest of the peak_width-1 points around it and lie outside the main peak
+	x_data = np.asarray(x_data)
+	power = np.asarray(power)
+	#Find peak power
+	if x_is_freq:
+		max_index = int(np.argmax(power[1:]))+1
+	else:
+		max_index = int(np.argmax(power))
+	max_x = x_data[max_index]
+	max_power = power[max_index]
+	#Find SMSR
+	peak_distance = int((peak_width-1)/2)
+	i = np.arange(1+peak_distance,len(power)-peak_distance)
+	local_max = maximum_filter1d(power, max(2*peak_distance,1), mode='nearest') #max(power[i-peak_distance:i+peak_distance])
+	is_peak = (power[i] == local_max[i]) & ((i < max_index-peak_distance) | (i > max_index+peak_distance))
+	peaks = i[is_peak]
+	if len(peaks):
+		SM_index = peaks[np.argmax(power[peaks])]
+		SM_x = x_data[SM_index]
+		SM_power = power[SM_index]
+		SMSR = max_power-SM_power
+	else:
+		SM_x = math.nan
+		SM_power = math.nan
+		SMSR = math.nan
+	#Find FWHM
+	HM = np.max(power)-10*math.log10(2)
+	[FWHM,FW_start,FW_end] = find_FW(x_data,power,HM,interpolate=interpolate)
+	return [max_x, max_power, SMSR, SM_x, SM_power, FWHM, FW_start, FW_end, HM]
+
+def piecewise_linear(x, x0, b, m1, m2):
+	condlist = [x < x0, x >= x0]
+	funclist = [lambda x: m1*x + b, lambda x: m1*x + b + m2*(x-x0)]
+	return np.piecewise(x, condlist, funclist)
+
+def SechSqr(x, offset, amplitude, center, width, suppress_overflow=True):
+	#sech_squared does not overflow, suppress_overflow is kept for existing callers
+	return offset+amplitude*sech_squared((x-center)/width)
+
+def envelope_indices(s, trough_reduction_factor=1, peak_reduction_factor=1):
+	#Finds the indices of every trough and peak, or every trough_reduction_factor troughs and peak_reduction_factor peaks.
+	s = np.asarray(s)
+	extrema = -np.diff(np.sign(np.diff(s)))
+	trough_indices = (extrema < 0).nonzero()[0]+1
+	peak_indices = (extrema > 0).nonzero()[0]+1
+	trough_indices_reduced = group_extreme(s, trough_indices, trough_reduction_factor, np.minimum)
+	peak_indices_reduced = group_extreme(s, peak_indices, peak_reduction_factor, np.maximum)
+	return trough_indices_reduced,peak_indices_reduced
+
+def group_extreme(s, indices, group_size, ufunc):
+	#Splits indices into consecutive groups of group_size and returns the index of the first extreme value of s in each group
+	#ufunc is np.minimum or np.maximum
+	if len(indices) == 0:
+		return indices
+	values = s[indices]
+	starts = np.arange(0, len(indices), group_size)
+	group_extremes = ufunc.reduceat(values, starts)
+	group = np.arange(len(indices))//group_size
+	is_extreme = np.flatnonzero(values == group_extremes[group])
+	_, first = np.unique(group[is_extreme], return_index=True)
+	return indices[is_extreme[first]]
+
+@lru_cache(maxsize=16)
+def low_pass_mask(num_points, time_step, cutoff_freq):
+	#Boolean mask of the rfft bins kept by low_pass_filter, time_step [fs]
+	return np.fft.rfftfreq(num_points, time_step*1e-15) <= cutoff_freq
+
+def low_pass_filter(time, intensity, cutoff_freq=200e12):
+	#Removes every frequency above cutoff_freq [Hz], time [fs]
+	#intensity can be one trace or a 2D array with one trace per row, all filtered in one call
+	intensity = np.asarray(intensity, dtype=float)
+	num_points = intensity.shape[-1]
+	Intensity_freq = np.fft.rfft(intensity, axis=-1)
+	Intensity_freq *= low_pass_mask(num_points, float(time[1]-time[0]), cutoff_freq)
+	return np.fft.irfft(Intensity_freq, n=num_points, axis=-1)
+
+def preprocess_autocorrelation(time, intensity, normalize=True, average=True, cutoff_freq=None):
+	#Prepares interferometric autocorrelation traces, intensity can be one trace or a 2D array with one scan per row
+	#Scans are averaged if average, normalized to a peak of 8 if normalize and low pass filtered if cutoff_freq is given
+	intensity = np.asarray(intensity, dtype=float)
+	if average and intensity.ndim == 2:
+		intensity = np.mean(intensity, axis=0)
+	if normalize:
+		intensity = intensity*8/np.max(intensity, axis=-1, keepdims=True)
+	if cutoff_freq is not None:
+		return intensity, low_pass_filter(time, intensity, cutoff_freq)
+	return intensity
+
+def rollover_index(power, tolerance=0.05):
+	#Returns the index of the first point (from the 5th on) that falls more than tolerance below the peak so far
+	#or the number of points if the power never rolls over. Accepts one curve or a 2D array of NaN padded curves
+	power = np.atleast_2d(np.asarray(power, dtype=float))
+	running_peak = np.maximum.accumulate(np.where(np.isnan(power), -np.inf, power), axis=1)
+	rolled_over = np.zeros(power.shape, dtype=bool)
+	rolled_over[:,4:] = power[:,4:] < running_peak[:,3:-1]-tolerance
+	num_points = np.sum(~np.isnan(power), axis=1)
+	return np.where(rolled_over.any(axis=1), rolled_over.argmax(axis=1), num_points)
+
+def fit_threshold(current, power, trim_rollover=True, tolerance=0.05, min_points=2, confidence=0.95):
+	#Exact least squares fit of one line below and one line above threshold
+	#Every split point is scored at once from cumulative sums, so the cost is O(n) per curve with no initial guess
+	#threshold is where the two lines cross, threshold_sd and threshold_CI come from the parameter covariance of both lines
+	#current and power can be single curves or 2D arrays with one curve per row (pad shorter curves with NaN)
+	single_curve = np.ndim(power) == 1
+	y = np.atleast_2d(np.asarray(power, dtype=float))
+	x = np.broadcast_to(np.atleast_2d(np.asarray(current, dtype=float)), y.shape)
+	valid = np.isfinite(x) & np.isfinite(y)
+	if trim_rollover:
+		fit_end = rollover_index(np.where(valid, y, np.nan), tolerance)
+		valid &= np.arange(y.shape[1]) < fit_end[:,None]
+	else:
+		fit_end = np.sum(valid, axis=1)
+	w = valid.astype(float)
+	num_total = np.maximum(np.sum(w, axis=1, keepdims=True), 1)
+	#centre each curve so the sums stay well conditioned
+	x_mean = np.sum(np.where(valid, x, 0), axis=1, keepdims=True)/num_total
+	y_mean = np.sum(np.where(valid, y, 0), axis=1, keepdims=True)/num_total
+	xc = np.where(valid, x-x_mean, 0)
+	yc = np.where(valid, y-y_mean, 0)
+	#sums over points [0,k) for every split k, and over [k,n) by subtraction from the total
+	sums = [w, xc, yc, xc*xc, xc*yc, yc*yc]
+	left = [np.concatenate([np.zeros((y.shape[0],1)), np.cumsum(a, axis=1)], axis=1) for a in sums]
+	right = [l[:,-1:]-l for l in left]
+	with np.errstate(divide='ignore', invalid='ignore'):
+		N1, m1, b1, SSE1, Sxx1, xbar1 = line_from_sums(*left)
+		N2, m2, b2, SSE2, Sxx2, xbar2 = line_from_sums(*right)
+		allowed = (N1 >= min_points) & (N2 >= min_points) & (Sxx1 > 0) & (Sxx2 > 0)
+		SSE = np.where(allowed, SSE1+SSE2, np.inf)
+		k = np.argmin(SSE, axis=1)[:,None]
+		pick = lambda a: np.take_along_axis(a, k, axis=1)[:,0]
+		N1, m1, b1, Sxx1, xbar1 = pick(N1), pick(m1), pick(b1), pick(Sxx1), pick(xbar1)
+		N2, m2, b2, Sxx2, xbar2 = pick(N2), pick(m2), pick(b2), pick(Sxx2), pick(xbar2)
+		SSE = pick(SSE)
+		#lines are y = y_mean + b + m*(x-x_mean)
+		threshold_c = (b2-b1)/(m1-m2)
+		threshold = threshold_c+x_mean[:,0]
+		intercept = y_mean[:,0]+b1-m1*x_mean[:,0]
+		#delta method on the crossing point of two independent lines
+		dof = num_total[:,0]-4
+		sigma2 = SSE/dof
+		variance = sigma2*(1/N1+(threshold_c-xbar1)**2/Sxx1+1/N2+(threshold_c-xbar2)**2/Sxx2)/(m1-m2)**2
+		threshold_sd = np.sqrt(variance)
+		half_width = t_distribution.ppf(0.5+confidence/2, np.maximum(dof,1))*threshold_sd
+	no_fit = ~allowed.any(axis=1) | (dof < 1)
+	threshold[no_fit] = np.nan
+	threshold_sd[no_fit] = np.inf
+	threshold_CI = np.stack([threshold-half_width, threshold+half_width], axis=-1)
+	result = Threshold_Fit(threshold, threshold_sd, threshold_CI, m1, m2, intercept, k[:,0], fit_end)
+	if single_curve:
+		return Threshold_Fit(*[a[0] for a in result])
+	return result
+
+def line_from_sums(N, Sx, Sy, Sxx, Sxy, Syy):
+	#Least squares line from point count and raw sums, returns slope, intercept, residual sum of squares
+	#and the centred Sxx and mean x needed for the parameter covariance
+	Sxx_c = Sxx-Sx*Sx/N
+	Sxy_c = Sxy-Sx*Sy/N
+	Syy_c = Syy-Sy*Sy/N
+	slope = Sxy_c/Sxx_c
+	intercept = (Sy-slope*Sx)/N
+	SSE = np.maximum(Syy_c-slope*Sxy_c, 0)
+	return N, slope, intercept, SSE, Sxx_c, Sx/N
+
+def scan_segments(x, gap_factor=5):
+	#Splits a scan into index arrays wherever the step is more than gap_factor times the median step
+	steps = np.abs(np.diff(x))
+	if len(steps) == 0:
+		return [np.arange(len(x))]
+	breaks = np.flatnonzero(steps > gap_factor*np.median(steps))+1
+	return np.split(np.arange(len(x)), breaks)
+
+def FP_FSR(wavelength, power, min_fringes=2, min_peak_ratio=5):
+	#Estimates the free spectral range [nm] from the strongest component of the Fourier spectrum of the fringes
+	#Returns nan if fewer than min_fringes fringes fit in the scan, or if no component is min_peak_ratio times above the median of the spectrum
+	num_points = len(power)
+	if num_points < 8:
+		return np.nan
+	span = wavelength[-1]-wavelength[0]
+	uniform_wavelength = np.linspace(wavelength[0], wavelength[-1], num_points)
+	if span < 0:
+		uniform_power = np.interp(uniform_wavelength[::-1], wavelength[::-1], power[::-1])[::-1]
+	else:
+		uniform_power = np.interp(uniform_wavelength, wavelength, power)
+	uniform_power = (uniform_power-np.mean(uniform_power))*np.hanning(num_points)
+	full_spectrum = np.abs(np.fft.rfft(uniform_power))
+	spectrum = full_spectrum.copy()
+	spectrum[:min_fringes+1] = 0 #ignore the slow envelope
+	i = np.argmax(spectrum)
+	#The fringes must stand out from the noise, and be a peak rather than the tail of the envelope or of a longer period
+	if spectrum[i] <= min_peak_ratio*np.median(full_spectrum[1:]) or full_spectrum[i-1] >= full_spectrum[i]:
+		return np.nan
+	#Parabolic interpolation between bins
+	if 0 < i < len(spectrum)-1:
+		a, b, c = np.log(full_spectrum[i-1:i+2]+1e-300)
+		i = i+0.5*(a-c)/(a-2*b+c) if a-2*b+c != 0 else i
+	FSR = abs(span)*num_points/(num_points-1)/i
+	if abs(span) < min_fringes*FSR:
+		return np.nan
+	return FSR
+
+def fringe_extrema(power, window):
+	#Returns the indices of local maxima and minima over a sliding window of window points, excluding the edges
+	#Flat tops count once
+	window = int(window)
+	peaks = power == maximum_filter1d(power, 2*window+1, mode='nearest')
+	troughs = power == minimum_filter1d(power, 2*window+1, mode='nearest')
+	for extrema in [peaks, troughs]:
+		extrema[1:] &= ~extrema[:-1]
+		extrema[:window] = False
+		extrema[len(power)-window:] = False
+	return np.flatnonzero(peaks), np.flatnonzero(troughs)
@@ -0,0 +1,237 @@
+#########################################################################
+# Functions to keep an SQLite catalog of every saved measurement        #
+# Files under Data/<user>/<YYYY_MM_DD>/<type>/Data are indexed by type, #
+# device, user, date, the bias values and pulsing in their names and    #
+# figures of merit extracted from the data (threshold, SMSR, ...)       #
+# The catalog is a .catalog.sqlite file in the Data directory. Updates  #
+# only read files that are new or changed since the last update, and    #
+# queries use the catalog alone without touching the directory tree     #
+# -update_catalog()                                                     #
+# -query_catalog()                                                      #
+# -parse_scan_name()                                                    #
+#                                                                       #
+# Author: agent                                                         #
+# Date: Oct 18, 2026                                                    #
+#########################################################################
+
+import numpy as np
+import os
+import re
+import time
+import sqlite3
+from collections import namedtuple
+from datetime import date, datetime
+from data_files import read_data_file, data_extensions
+
+catalog_name = '.catalog.sqlite'
+#biases are (value, unit) in the order they appear in the name, i.e. the highest numbered source first
+#metrics is a dict of name: value, see measurement_metrics for the names
+Catalog_Entry = namedtuple('Catalog_Entry', ['path', 'type', 'user', 'date', 'device', 'name', 'pulsed', 'biases', 'metrics'])
+
+#Source values added to names by the GUIs (e.g. _120mA, _-1.5V), plus temperatures (e.g. _20C) if added to the device name
+bias_pattern = re.compile(r'_(-?\d+(?:\.\d+)?)(mA|V|C)$')
+#Suffixes Run_Namer adds to keep names unique (_2, _run3 or a _HHMMSS timestamp)
+copy_pattern = re.compile(r'_(run\d+|\d+)$')
+date_pattern = re.compile(r'^\d{4}_\d{2}_\d{2}$')
+commit_interval = 200 #files cataloged between commits
+name_parser_version = 2 #stored as the catalog's user_version, names cataloged by an older parse_scan_name are parsed again
+
+def catalog_location(characterization_directory):
+	return os.path.join(characterization_directory, catalog_name)
+
+def connect_catalog(characterization_directory):
+	connection = sqlite3.connect(catalog_location(characterization_directory))
+	connection.executescript('''
+		CREATE TABLE IF NOT EXISTS measurements (id INTEGER PRIMARY KEY, path TEXT UNIQUE, type TEXT, user TEXT, date TEXT, device TEXT, name TEXT, pulsed INTEGER, size INTEGER, mtime_ns INTEGER);
+		CREATE TABLE IF NOT EXISTS biases (measurement_id INTEGER, position INTEGER, value REAL, unit TEXT);
+		CREATE TABLE IF NOT EXISTS metrics (measurement_id INTEGER, name TEXT, value REAL);
+		CREATE INDEX IF NOT EXISTS measurements_search ON measurements (type, device, date);
+		CREATE INDEX IF NOT EXISTS measurements_date ON measurements (date);
+		CREATE INDEX IF NOT EXISTS biases_search ON biases (unit, value, measurement_id);
+		CREATE INDEX IF NOT EXISTS biases_measurement ON biases (measurement_id);
+		CREATE INDEX IF NOT EXISTS metrics_search ON metrics (name, value, measurement_id);
+		CREATE INDEX IF NOT EXISTS metrics_measurement ON metrics (measurement_id);
+	''')
+	return connection
+
+def parse_scan_name(name):
+	#Splits a name built by the GUIs (device, then _pulsed, then one value per source) into device, pulsed and [(value, unit), ...]
+	#Values at the end of the device name (e.g. a temperature, BRL9_M-AL_20C_pulsed_120mA) are biases too, so pulsed and DC runs get the same device
+	match = copy_pattern.search(name)
+	if match and (match.group(1).startswith('run') or bias_pattern.search(name[:match.start()])):
+		name = name[:match.start()]
+	name, biases = split_biases(name)
+	pulsed = name.endswith('_pulsed')
+	if pulsed:
+		name, device_biases = split_biases(name[:-len('_pulsed')])
+		biases = device_biases+biases
+	return name, pulsed, biases
+
+def split_biases(name):
+	#Removes every value with a unit from the end of name, returns the rest and [(value, unit), ...] in the order they appeared
+	biases = []
+	match = bias_pattern.search(name)
+	while match:
+		biases.insert(0, (float(match.group(1)), match.group(2)))
+		name = name[:match.start()]
+		match = bias_pattern.search(name)
+	return name, biases
+
+def reparse_names(connection):
+	#Parses the names of every measurement again after parse_scan_name changes, without opening any files
+	for measurement_id, name in connection.execute('SELECT id, name FROM measurements').fetchall():
+		device, pulsed, biases = parse_scan_name(name)
+		connection.execute('UPDATE measurements SET device = ?, pulsed = ? WHERE id = ?', (device, int(pulsed), measurement_id))
+		connection.execute('DELETE FROM biases WHERE measurement_id = ?', (measurement_id,))
+		connection.executemany('INSERT INTO biases VALUES (?,?,?,?)', [(measurement_id, position, value, unit) for position, (value, unit) in enumerate(biases)])
+	connection.execute('PRAGMA user_version = '+str(name_parser_version))
+	connection.commit()
+
+def parse_data_path(relative_path):
+	#Returns user, date, type and name for a path like <user>/<YYYY_MM_DD>/<type>/Data/<name>.csv relative to the catalog
+	#user is '' when the catalog is made in a user's own folder, date is None if the folder is not a date
+	parts = os.path.normpath(relative_path).split(os.sep)
+	if len(parts) < 4 or parts[-2] != 'Data':
+		return None
+	folder_date = parts[-4].replace('_', '-') if date_pattern.match(parts[-4]) else None
+	user = parts[-5] if len(parts) >= 5 else ''
+	return user, folder_date, parts[-3], os.path.splitext(parts[-1])[0]
+
+def measurement_metrics(file_path, measurement_type):
+	#Figures of merit of one data file, only LIV and Spectrum measurements have any
+	from analysis_functions import analyze_LIV, spectrum_features
+	if measurement_type not in ['LIV', 'Spectrum']:
+		return {}
+	data, columns = read_data_file(file_path, cache=False)[0:2]
+	if data.shape[0] == 0:
+		return {}
+	if measurement_type == 'LIV':
+		result = analyze_LIV(data[:,2], data[:,0], data[:,1])
+		return {'num_points': data.shape[0], 'threshold_current [mA]': result.threshold_current, 'slope_efficiency [W/A]': result.post_thresh_slope, 'max_power [mW]': float(np.max(result.power)), 'max_current [mA]': float(np.max(result.current)), 'good_fit': int(result.good_fit)}
+	x_is_freq = len(columns) > 0 and columns[0].startswith('Frequency')
+	max_x, max_power, SMSR, SM_x, SM_power, FWHM = spectrum_features(data[:,0], data[:,1], x_is_freq=x_is_freq)[0:6]
+	if x_is_freq:
+		return {'peak_frequency [GHz]': max_x, 'peak_power [dBm]': max_power, 'SMSR [dB]': SMSR, 'FWHM [GHz]': FWHM}
+	return {'peak_wavelength [nm]': max_x, 'peak_power [dBm]': max_power, 'SMSR [dB]': SMSR, 'FWHM [nm]': FWHM}
+
+def find_data_files(characterization_directory):
+	#Yields (path relative to characterization_directory, size, mtime_ns) for every data file in a Data folder
+	for directory, folders, files in os.walk(characterization_directory):
+		folders[:] = [folder for folder in folders if not folder.startswith('.') and folder != 'Figures'] #skip .cache folders and figures
+		if os.path.basename(directory) != 'Data':
+			continue
+		for file in files:
+			if os.path.splitext(file)[1] in data_extensions and not file.startswith('.'):
+				stat = os.stat(os.path.join(directory, file))
+				yield os.path.relpath(os.path.join(directory, file), characterization_directory), stat.st_size, stat.st_mtime_ns
+
+def update_catalog(characterization_directory, extract_metrics=True, print_progress=True):
+	#Adds new and changed data files to the catalog and removes deleted ones, returns the number of files added, updated and removed
+	#Files are matched on size and modification time, so unchanged files are never opened
+	start_time = time.time()
+	connection = connect_catalog(characterization_directory)
+	known = {path: (measurement_id, size, mtime_ns) for measurement_id, path, size, mtime_ns in connection.execute('SELECT id, path, size, mtime_ns FROM measurements')}
+	changed = []
+	found = set()
+	for path, size, mtime_ns in find_data_files(characterization_directory):
+		found.add(path)
+		if path not in known or known[path][1:] != (size, mtime_ns):
+			changed.append((path, size, mtime_ns))
+	removed = [known[path][0] for path in known if path not in found]
+	num_added = 0
+	try:
+		if connection.execute('PRAGMA user_version').fetchone()[0] < name_parser_version:
+			reparse_names(connection)
+		for measurement_id in removed:
+			delete_measurement(connection, measurement_id)
+		for i, (path, size, mtime_ns) in enumerate(changed):
+			parsed = parse_data_path(path)
+			if parsed is None:
+				continue
+			user, folder_date, measurement_type, name = parsed
+			device, pulsed, biases = parse_scan_name(name)
+			metrics = {}
+			if extract_metrics:
+				try:
+					metrics = measurement_metrics(os.path.join(characterization_directory, path), measurement_type)
+				except Exception as e:
+					print(" Could not extract metrics from "+path+": "+str(e))
+			if path in known:
+				delete_measurement(connection, known[path][0])
+			else:
+				num_added += 1
+			measurement_id = connection.execute('INSERT INTO measurements (path, type, user, date, device, name, pulsed, size, mtime_ns) VALUES (?,?,?,?,?,?,?,?,?)', (path, measurement_type, user, folder_date, device, name, int(pulsed), size, mtime_ns)).lastrowid
+			connection.executemany('INSERT INTO biases VALUES (?,?,?,?)', [(measurement_id, position, value, unit) for position, (value, unit) in enumerate(biases)])
+			connection.executemany('INSERT INTO metrics VALUES (?,?,?)', [(measurement_id, metric, float(value)) for metric, value in metrics.items() if value is not None and np.isfinite(value)])
+			if print_progress:
+				print("\r Cataloged "+str(i+1)+" of "+str(len(changed))+" new or changed files", end='')
+			if (i+1)%commit_interval == 0:
+				connection.commit() #files cataloged so far are kept if the update is interrupted
+		connection.commit()
+	finally:
+		connection.close() #discards anything not yet committed
+	num_updated = len(changed)-num_added
+	if print_progress:
+		if len(changed) > 0:
+			print("")
+		print(" Catalog updated in {:.2f} s: ".format(time.time()-start_time)+str(num_added)+" added, "+str(num_updated)+" updated, "+str(len(removed))+" removed, "+str(len(found))+" files in total")
+	return num_added, num_updated, len(removed)
+
+def delete_measurement(connection, measurement_id):
+	connection.execute('DELETE FROM measurements WHERE id = ?', (measurement_id,))
+	connection.execute('DELETE FROM biases WHERE measurement_id = ?', (measurement_id,))
+	connection.execute('DELETE FROM metrics WHERE measurement_id = ?', (measurement_id,))
+
+def catalog_date(value):
+	#Dates may be given as datetime.date or 'YYYY_MM_DD' like the data folders
+	if isinstance(value, (date, datetime)):
+		return value.strftime('%Y-%m-%d')
+	return str(value).replace('_', '-')
+
+def query_catalog(characterization_directory, measurement_type=None, device=None, user=None, date_from=None, date_to=None, biases={}, pulsed=None, metrics={}, tolerance=1e-6):
+	#Returns a list of Catalog_Entry for measurements matching every condition given, newest first, paths are full paths
+	#device may contain * wildcards, dates are inclusive
+	#biases is a dict of unit: value matching any source at that value e.g. {'mA': 120, 'C': 20}
+	#metrics is a dict of name: (minimum, maximum) where either may be None e.g. {'threshold_current [mA]': (None, 20)}
+	conditions = []
+	parameters = []
+	if measurement_type is not None:
+		conditions.append('m.type = ?')
+		parameters.append(measurement_type)
+	if device is not None:
+		if '*' in device:
+			conditions.append("m.device GLOB ?")
+		else:
+			conditions.append('m.device = ?')
+		parameters.append(device)
+	if user is not None:
+		conditions.append('m.user = ?')
+		parameters.append(user)
+	if date_from is not None:
+		conditions.append('m.date >= ?')
+		parameters.append(catalog_date(date_from))
+	if date_to is not None:
+		conditions.append('m.date <= ?')
+		parameters.append(catalog_date(date_to))
+	if pulsed is not None:
+		conditions.append('m.pulsed = ?')
+		parameters.append(int(pulsed))
+	for unit, value in biases.items():
+		conditions.append('m.id IN (SELECT measurement_id FROM biases WHERE unit = ? AND value BETWEEN ? AND ?)')
+		parameters += [unit, value-tolerance, value+tolerance]
+	for metric, (minimum, maximum) in metrics.items():
+		conditions.append('m.id IN (SELECT measurement_id FROM metrics WHERE name = ? AND value BETWEEN ? AND ?)')
+		parameters += [metric, -np.inf if minimum is None else minimum, np.inf if maximum is None else maximum]
+	where = ' WHERE '+' AND '.join(conditions) if conditions else ''
+	connection = connect_catalog(characterization_directory)
+	try:
+		rows = connection.execute('SELECT m.id, m.path, m.type, m.user, m.date, m.device, m.name, m.pulsed FROM measurements m'+where+' ORDER BY m.date DESC, m.path', parameters).fetchall()
+		found_biases = {row[0]: [] for row in rows}
+		found_metrics = {row[0]: {} for row in rows}
+		for measurement_id, value, unit in connection.execute('SELECT b.measurement_id, b.value, b.unit FROM biases b WHERE b.measurement_id IN (SELECT m.id FROM measurements m'+where+') ORDER BY b.measurement_id, b.position', parameters):
+			found_biases[measurement_id].append((value, unit))
+		for measurement_id, metric, value in connection.execute('SELECT x.measurement_id, x.name, x.value FROM metrics x WHERE x.measurement_id IN (SELECT m.id FROM measurements m'+where+')', parameters):
+			found_metrics[measurement_id][metric] = value
+	finally:
+		connection.close()
+	return [Catalog_Entry(os.path.join(characterization_directory, path), measurement_type, user, folder_date, device, name, bool(pulsed), found_biases[measurement_id], found_metrics[measurement_id]) for measurement_id, path, measurement_type, user, folder_date, device, name, pulsed in rows]
@@ -0,0 +1,267 @@
+#########################################################################
+# Functions to read and write saved data files                          #
+# CSVs are parsed once and kept as .npy sidecars in a hidden .cache     #
+# folder beside them, so later loads are memory mapped instead of       #
+# parsed. A sidecar is only used while the CSV size and modification    #
+# time match the ones it was made from                                  #
+# HDF5 (.h5) files hold one chunked, compressed dataset per measurement #
+# with the GUI settings and instrument state as attributes, and can be  #
+# appended to while measuring. They need the h5py package               #
+# Writers stream rows to a .partial file that is renamed when the run   #
+# completes, so a crash keeps everything measured up to that point      #
+# -load_csv()                                                           #
+# -clear_csv_cache()                                                    #
+# -save_data_file()                                                     #
+# -read_data_file()                                                     #
+# -export_csv()                                                         #
+# -open_data_writer()                                                   #
+# -gui_attributes()                                                     #
+# -instrument_attributes()                                              #
+# -CSV_Writer, HDF5_Writer                                              #
+#                                                                       #
+# Author: agent                                                         #
+# Date: Oct 18, 2026                                                    #
+#########################################################################
+
+import numpy as np
+import os
+import time
+from collections import namedtuple
+
+#data is 2D with one column per entry of columns, attributes is a dict of settings saved with the data
+Data_File = namedtuple('Data_File', ['data', 'columns', 'attributes'])
+data_extensions = ['.csv', '.h5']
+
+cache_folder_name = '.cache'
+
+def csv_cache_location(file_path, delimiter=',', skiprows=0):
+	#Sidecar path for file_path, the name holds the CSV size, modification time and parse options so a stale sidecar is never found
+	stat = os.stat(file_path)
+	directory, file_name = os.path.split(os.path.abspath(file_path))
+	key = str(stat.st_size)+'_'+str(stat.st_mtime_ns)+'_'+str(ord(delimiter))+'_'+str(skiprows)
+	return os.path.join(directory, cache_folder_name, file_name+'.'+key+'.npy')
+
+def load_csv(file_path, delimiter=',', skiprows=0, cache=True):
+	#Loads a CSV of numbers as a 2D array, like np.loadtxt(file_path, delimiter=delimiter, skiprows=skiprows, ndmin=2)
+	#With cache, the result is a read-only memory map of the sidecar, made on the first load. Copy it before changing it in place
+	if not cache:
+		return np.loadtxt(file_path, delimiter=delimiter, skiprows=skiprows, ndmin=2)
+	cache_location = csv_cache_location(file_path, delimiter, skiprows)
+	try:
+		return np.load(cache_location, mmap_mode='r')
+	except (OSError, ValueError):
+		pass #no sidecar yet, or it is unreadable
+	data = np.loadtxt(file_path, delimiter=delimiter, skiprows=skiprows, ndmin=2)
+	try:
+		clear_csv_cache(file_path)
+		os.makedirs(os.path.dirname(cache_location), exist_ok=True)
+		#Write under a temporary name so a partly written sidecar is never loaded
+		temporary_location = cache_location[:-len('.npy')]+'.'+str(os.getpid())+'.tmp'
+		with open(temporary_location, 'wb') as f:
+			np.save(f, data)
+		os.replace(temporary_location, cache_location)
+	except OSError:
+		pass #read-only data directories are loaded without a cache
+	return data
+
+def clear_csv_cache(file_path):
+	#Removes every sidecar made from file_path
+	directory, file_name = os.path.split(os.path.abspath(file_path))
+	cache_directory = os.path.join(directory, cache_folder_name)
+	if not os.path.isdir(cache_directory):
+		return
+	for cache_file in os.listdir(cache_directory):
+		if cache_file.startswith(file_name+'.'):
+			try:
+				os.remove(os.path.join(cache_directory, cache_file))
+			except OSError:
+				pass
+
+def check_data_extension(file_path):
+	extension = os.path.splitext(file_path)[1].lower()
+	if extension not in data_extensions:
+		raise Exception("Unsupported data file type: "+os.path.basename(file_path))
+	if extension == '.h5':
+		try:
+			import h5py
+		except ImportError:
+			raise Exception(".h5 data files require the h5py package (pip install h5py)")
+	return extension
+
+def attribute_value(value):
+	#Converts a setting to a type HDF5 attributes can hold, or None to skip it
+	if isinstance(value, (bool, int, float, str, np.number, np.bool_)):
+		return value
+	if isinstance(value, (list, tuple, np.ndarray)):
+		try:
+			array = np.asarray(value)
+		except ValueError:
+			return None
+		if array.dtype.kind in 'biuf':
+			return array
+		if array.dtype.kind in 'SU':
+			return array.astype(str).tolist()
+	return None
+
+def gui_attributes(values, prefix=''):
+	#Attributes from the values dict of a PySimpleGUI window, skipping the console output and anything that is not a plain setting
+	attributes = {}
+	for field, value in values.items():
+		if field == 'output':
+			continue
+		value = attribute_value(value)
+		if value is not None:
+			attributes[prefix+str(field)] = value
+	return attributes
+
+def instrument_attributes(instruments):
+	#Attributes describing connected instruments from GUI_Interfaces, given as a dict of name: instrument
+	#Each records its type, address and plain settings such as mode and channel, instruments that are 'off' are skipped
+	attributes = {}
+	for name, instrument in instruments.items():
+		if isinstance(instrument, (str, bool)) or instrument is None:
+			continue
+		attributes[name+'_type'] = type(instrument).__name__
+		if hasattr(instrument, 'GPIB') and hasattr(instrument.GPIB, 'resource_name'):
+			attributes[name+'_address'] = instrument.GPIB.resource_name
+		for field, value in vars(instrument).items():
+			value = attribute_value(value)
+			if value is not None and not field.startswith('_'):
+				attributes[name+'_'+field] = value
+	return attributes
+
+class Data_Writer:
+	#Streams rows to file_path+'.partial' while measuring and renames it to file_path when the run completes, so a file with
+	#the final name is always complete and a crash leaves every row measured so far in the .partial file
+	#Rows are flushed as they are appended if flush_every_append, and always written and forced to disk at least every sync_interval seconds
+	flush_every_append = True
+
+	def __init__(self, file_path, sync_interval=5):
+		self.file_path = file_path
+		self.partial_path = file_path+'.partial'
+		self.sync_interval = sync_interval
+		self.last_sync = time.time()
+		self.num_rows = 0
+
+	def flush(self, sync=False):
+		due = sync or time.time()-self.last_sync >= self.sync_interval
+		if due or self.flush_every_append:
+			self.write_buffers()
+		if due:
+			os.fsync(self.file_descriptor())
+			self.last_sync = time.time()
+
+	def close(self, complete=True):
+		#With complete=False, e.g. after an error or cancel, the .partial file is kept for recovery
+		if self.file is None:
+			return
+		self.flush(sync=True)
+		self.file.close()
+		self.file = None
+		if complete:
+			os.replace(self.partial_path, self.file_path)
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.close(complete=exc_type is None)
+
+class CSV_Writer(Data_Writer):
+	#Writes the same layout as save_data_file: a header of the column names then one line per row
+	def __init__(self, file_path, columns, sync_interval=5):
+		Data_Writer.__init__(self, file_path, sync_interval)
+		self.file = open(self.partial_path, 'w')
+		self.file.write(', '.join(columns)+'\n')
+		self.flush(sync=True)
+
+	def append(self, rows):
+		#Adds one row or a 2D array of rows
+		rows = np.atleast_2d(np.asarray(rows, dtype=float))
+		np.savetxt(self.file, rows, delimiter=',')
+		self.num_rows += rows.shape[0]
+		self.flush()
+
+	def write_buffers(self):
+		self.file.flush()
+
+	def file_descriptor(self):
+		return self.file.fileno()
+
+class HDF5_Writer(Data_Writer):
+	#Data is in a resizable dataset named 'data' with the column names in its 'columns' attribute, settings are attributes of the file
+	#Flushing an HDF5 file recompresses every partly filled chunk, so rows are only flushed every sync_interval seconds and on close
+	flush_every_append = False
+
+	def __init__(self, file_path, columns, attributes={}, sync_interval=5, dtype=float, compression_level=1, chunk_rows=1024):
+		check_data_extension(file_path)
+		import h5py
+		Data_Writer.__init__(self, file_path, sync_interval)
+		self.columns = list(columns)
+		num_columns = len(self.columns)
+		self.file = h5py.File(self.partial_path, 'w')
+		#Each chunk holds chunk_rows rows of one column, so shuffle and gzip see runs of similar values
+		#Streaming writes use small chunks so each flush recompresses little, whole arrays are saved in larger ones
+		self.dataset = self.file.create_dataset('data', shape=(0, num_columns), maxshape=(None, num_columns), chunks=(chunk_rows, 1), dtype=dtype, shuffle=True, compression='gzip', compression_opts=compression_level)
+		self.dataset.attrs['columns'] = self.columns
+		self.set_attributes(attributes)
+		self.flush(sync=True)
+
+	def append(self, rows):
+		#Adds one row or a 2D array of rows to the end of the dataset
+		rows = np.atleast_2d(np.asarray(rows))
+		self.dataset.resize(self.num_rows+rows.shape[0], axis=0)
+		self.dataset[self.num_rows:] = rows
+		self.num_rows += rows.shape[0]
+		self.flush()
+
+	def set_attributes(self, attributes):
+		for name, value in attributes.items():
+			self.file.attrs[name] = value
+
+	def write_buffers(self):
+		self.file.flush()
+
+	def file_descriptor(self):
+		return self.file.id.get_vfd_handle()
+
+def open_data_writer(file_path, columns, attributes={}, sync_interval=5, chunk_rows=1024):
+	#Data_Writer for the extension of file_path, attributes and chunk_rows only apply to .h5 files
+	if check_data_extension(file_path) == '.csv':
+		return CSV_Writer(file_path, columns, sync_interval)
+	return HDF5_Writer(file_path, columns, attributes, sync_interval, chunk_rows=chunk_rows)
+
+def save_data_file(file_path, data, columns, attributes={}):
+	#Saves a 2D array with one column per name in columns, the format is chosen by the extension of file_path
+	#.csv files are written as before with a header of the column names, attributes are only saved in .h5 files
+	with open_data_writer(file_path, columns, attributes, chunk_rows=int(np.clip(len(data), 1, 65536))) as writer:
+		writer.append(data)
+
+def read_data_file(file_path, cache=True):
+	#Loads a file written by save_data_file or HDF5_Writer, or any CSV with or without a header line, as a Data_File
+	extension = check_data_extension(file_path)
+	if extension == '.csv':
+		with open(file_path) as f:
+			first_line = f.readline()
+		try:
+			[float(value) for value in first_line.split(',')]
+			columns = []
+			skiprows = 0
+		except ValueError:
+			columns = [column.strip() for column in first_line.split(',')]
+			skiprows = 1
+		return Data_File(load_csv(file_path, skiprows=skiprows, cache=cache), columns, {})
+	import h5py
+	with h5py.File(file_path, 'r') as f:
+		dataset = f['data']
+		columns = [str(column) for column in dataset.attrs.get('columns', [])]
+		attributes = {name: (value.decode() if isinstance(value, bytes) else value) for name, value in f.attrs.items()}
+		return Data_File(dataset[()], columns, attributes)
+
+def export_csv(file_path, csv_path=None):
+	#Writes the data of a .h5 file to a CSV with the same layout the GUIs save, returns the CSV path
+	if csv_path is None:
+		csv_path = os.path.splitext(file_path)[0]+'.csv'
+	data, columns = read_data_file(file_path)[0:2]
+	np.savetxt(csv_path, data, delimiter=',', header=', '.join(columns), comments='')
+	return csv_path
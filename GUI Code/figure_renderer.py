@@ -0,0 +1,84 @@
+#########################################################################
+# Saves figures in background processes so sweeps keep measuring while  #
+# the previous point is drawn. The sweep analyzes each point itself and #
+# submits the result with the name of a draw_*() function from          #
+# plot_functions, workers draw it with the Agg backend and save it      #
+# At most max_pending figures wait at once, submit only blocks when the #
+# workers fall that far behind. close() waits for every figure          #
+# -Figure_Renderer                                                      #
+#                                                                       #
+# Author: agent                                                         #
+# Date: Oct 18, 2026                                                    #
+#########################################################################
+
+import os
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+def init_render_worker():
+	#Workers never display figures, so use the non-interactive backend
+	import matplotlib
+	matplotlib.use('Agg')
+
+def render_figure(png_location, draw_function, args, kwargs):
+	#Runs in a worker, draw_function is the name of a function in plot_functions that returns a figure
+	import matplotlib.pyplot as plt
+	import plot_functions
+	fig = getattr(plot_functions, draw_function)(*args, **kwargs)
+	fig.savefig(png_location, bbox_inches='tight')
+	plt.close(fig)
+	return png_location
+
+class Figure_Renderer:
+	def __init__(self, processes=1, max_pending=8, print_locations=True):
+		self.processes = processes
+		self.max_pending = max_pending
+		self.print_locations = print_locations
+		self.pool = None
+		self.pending = deque()
+		self.num_saved = 0
+		self.num_failed = 0
+
+	def submit(self, png_location, draw_function, *args, **kwargs):
+		#Saves draw_function(*args, **kwargs) to png_location in the background, args must be picklable (e.g. analysis results)
+		if self.pool is None:
+			#spawned workers do not inherit the GUI's window or instrument connections
+			self.pool = ProcessPoolExecutor(max_workers=self.processes, mp_context=multiprocessing.get_context('spawn'), initializer=init_render_worker)
+		self.collect()
+		while len(self.pending) >= self.max_pending:
+			self.collect_oldest()
+		self.pending.append((png_location, self.pool.submit(render_figure, png_location, draw_function, args, kwargs)))
+
+	def collect(self):
+		#Reports figures that have finished, in the order they were submitted
+		while len(self.pending) > 0 and self.pending[0][1].done():
+			self.collect_oldest()
+
+	def collect_oldest(self):
+		png_location, future = self.pending.popleft()
+		try:
+			future.result()
+			self.num_saved += 1
+			if self.print_locations:
+				print(" Figure saved to",png_location)
+		except Exception as e:
+			self.num_failed += 1
+			print(" Could not save figure "+os.path.basename(png_location)+": "+str(e))
+
+	def flush(self):
+		#Waits until every submitted figure is saved
+		while len(self.pending) > 0:
+			self.collect_oldest()
+
+	def close(self):
+		self.flush()
+		if self.pool is not None:
+			self.pool.shutdown()
+			self.pool = None
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.close()
@@ -0,0 +1,272 @@
+#########################################################################
+# Functions to draw figures from the results of analysis_functions      #
+# -draw_*() build a figure from an analysis result                      #
+# -plot_*() analyze and draw in one call                                #
+# -draw_LIV_overlay(), draw_*_map() summarize a whole sweep in a few    #
+#  figures instead of one per point                                     #
+#                                                                       #
+# Author: Trevor Stirling, agent                                        #
+# Date: Oct 18, 2026                                                    #
+#########################################################################
+
+import matplotlib.pyplot as plt
+import numpy as np
+import math
+from analysis_functions import analyze_LIV, analyze_spectrum, analyze_FP_Loss, analyze_autocorrelator, analyze_intensity_autocorrelation, piecewise_linear, SechSqr
+
+def plot_LIV(device_name, power, current, voltage, show_best_fit=True, show_best_fit_numbers=True, plot_current_density=False, current_area=1, power2=False):
+	#If plotting current density, expects area to be [cm^-2]
+	result = analyze_LIV(power, current, voltage, power2)
+	fig = draw_LIV(device_name, result, show_best_fit, show_best_fit_numbers, plot_current_density, current_area)
+	return [fig, result.threshold_current, result.post_thresh_slope, result.good_fit]
+
+def draw_LIV(device_name, result, show_best_fit=True, show_best_fit_numbers=True, plot_current_density=False, current_area=1):
+	current = result.current
+	power = result.power
+	power2 = result.power2
+	good_fit = result.good_fit
+	#Format figure
+	fig, ax1 = plt.subplots()
+	plt.title(str(device_name))
+	plt_colour = 'tab:blue'
+	ax1.set_ylabel('Voltage [V]', color=plt_colour)
+	if plot_current_density:
+		ax1.plot(current/current_area/1000/1000, result.voltage, color=plt_colour)
+	else:
+		ax1.plot(current, result.voltage, color=plt_colour)
+	ax1.tick_params(axis='y', labelcolor=plt_colour)
+	ax2 = ax1.twinx()
+	plt_colour = 'tab:red'
+	plt_colour_2 = 'tab:purple'
+	ax2.set_ylabel('Power [mW]', color=plt_colour)
+	if good_fit and show_best_fit:
+		if plot_current_density:
+			ax2.plot(result.current_fit/current_area/1000/1000, piecewise_linear(result.current_fit,*result.fit_params),'--',color='black',label='_nolegend_')
+		else:
+			ax2.plot(result.current_fit, piecewise_linear(result.current_fit,*result.fit_params),'--',color='black',label='_nolegend_')
+	if plot_current_density:
+		ax2.plot(current/current_area/1000/1000, power, color=plt_colour)
+		x_label_string = 'Current Density [kA/cm^2]'
+		if power2 is not False:
+			ax2.plot(current/current_area/1000/1000, power2, color=plt_colour_2)
+	else:
+		ax2.plot(current, power, color=plt_colour)
+		x_label_string = 'Current [mA]'
+		if power2 is not False:
+			ax2.plot(current, power2, color=plt_colour_2)
+	if good_fit and show_best_fit_numbers:
+		ax1.set_xlabel(x_label_string+'\n\nThreshold current = '+"{:.1f}".format(result.threshold_current)+' mA\nSlope efficiency = '+"{:.1f}".format(result.post_thresh_slope*1000)+' mW/A/facet')
+	else:
+		ax1.set_xlabel(x_label_string)
+	ax2.tick_params(axis='y', labelcolor=plt_colour)
+	plt.tight_layout()
+	if power2 is not False:
+		ax2.legend(['Right facet', 'Left facet'])
+	return fig
+
+def plot_FP_Loss(device_name, power, wavelength, L=1e-3, neff=3.14, peak_width=15):
+	result = analyze_FP_Loss(power, wavelength, L, neff, peak_width)
+	print(result.loss)
+	fig = draw_FP_Loss(device_name, result)
+	return [fig, result.loss]
+
+def draw_FP_Loss(device_name, result):
+	#Format figure
+	fig, ax = plt.subplots()
+	plt.title(str(device_name))
+	ax.set_ylabel('Power [A.U.]')
+	ax.set_xlabel('Wavelength [nm]\nLoss = {:.2f} $\\pm$ {:.2f}'.format(result.loss/100, result.loss_sd/100)+r' $cm^{-1}$')
+	ax.plot(result.wavelength, result.power)
+	if len(result.fringe_loss) > 0:
+		#Loss of each fringe against wavelength
+		plt_colour = 'tab:red'
+		ax2 = ax.twinx()
+		ax2.plot(result.fringe_wavelength, result.fringe_loss/100, '.', color=plt_colour)
+		ax2.set_ylabel(r'Loss [$cm^{-1}$]', color=plt_colour)
+		ax2.tick_params(axis='y', labelcolor=plt_colour)
+	plt.tight_layout()
+	return fig
+
+def plot_spectrum(device_name, x_data, power, show_max=False, show_max_numbers=True, show_SMSR=False, peak_width=15, show_FWHM=False, x_is_freq=False):
+	result = analyze_spectrum(x_data, power, peak_width, x_is_freq)
+	fig = draw_spectrum(device_name, x_data, power, result, show_max, show_max_numbers, show_SMSR, show_FWHM, x_is_freq)
+	return [fig, result.max_x, result.max_power, result.SMSR, result.FWHM]
+
+def draw_spectrum(device_name, x_data, power, result, show_max=False, show_max_numbers=True, show_SMSR=False, show_FWHM=False, x_is_freq=False):
+	[max_x, max_power, SMSR, SM_x, SM_power, FWHM, FW_start, FW_end, HM] = result
+	#Format figure
+	fig, ax = plt.subplots()
+	plt.title(str(device_name))
+	ax.plot(x_data, power)
+	if show_SMSR and not math.isnan(SMSR):
+		plt.annotate(text='', xy=(SM_x,SM_power), xytext=(SM_x,max_power), arrowprops=dict(arrowstyle='<->'))
+		SMSR_text = plt.text(SM_x,SM_power+SMSR/2,' SMSR = '+str(round(SMSR,2))+' dB ')
+		if (x_data[-1]+x_data[0])/2 < SM_x:
+			plt.setp(SMSR_text,'horizontalalignment','right')
+	if show_FWHM:
+		FWHM_arrow_length = (x_data[-1]-x_data[0])/6
+		plt.annotate(text='', xy=(max(FW_start-FWHM_arrow_length,x_data[0]),HM), xytext=(FW_start,HM), arrowprops=dict(arrowstyle='<-'))
+		plt.annotate(text='', xy=(min(FW_end+FWHM_arrow_length,x_data[-1]),HM), xytext=(FW_end,HM), arrowprops=dict(arrowstyle='<-'))
+		if (x_data[-1]+x_data[0])/2 < (FW_start+FW_end)/2:
+			FHWM_text_x = FW_start
+		else:
+			FHWM_text_x = FW_end
+		if x_is_freq:
+			FWHM_text = plt.text(FHWM_text_x,HM+3,' FWHM = '+str(round(FWHM*1e3,2))+' MHz ')
+		else:
+			FWHM_text = plt.text(FHWM_text_x,HM+3,' FWHM = '+str(round(FWHM,2))+' nm ')
+		if (x_data[-1]+x_data[0])/2 < (FW_start+FW_end)/2:
+			plt.setp(FWHM_text,'horizontalalignment','right')
+	if show_max:
+		ax.plot(max_x, max_power, 'ok', markerfacecolor="None")
+	if show_max_numbers:
+		if x_is_freq:
+			ax.set_xlabel('Frequency [GHz]\n\nMax Power ='+"{:.1f}".format(max_power)+' dBm at '+"{:.2f}".format(max_x)+' GHz')
+		else:
+			ax.set_xlabel('Wavelength [nm]\n\nMax Power ='+"{:.1f}".format(max_power)+' dBm at '+"{:.2f}".format(max_x)+' nm')
+	else:
+		if x_is_freq:
+			ax.set_xlabel('Frequency [GHz]')
+		else:
+			ax.set_xlabel('Wavelength [nm]')
+	ax.set_ylabel('Power [dBm]')
+	plt.tight_layout()
+	return fig
+
+def plot_autocorrelator(device_name, time, intensity, envelope_reduction_factor=20, plot_fit=True, plot_envelope=False, plot_lower=False, x_axis_calibrated=True, normalize=True, cutoff_freq=200e12, fit_type='low_pass'):
+	result = analyze_autocorrelator(time, intensity, envelope_reduction_factor, plot_lower, normalize, cutoff_freq, fit_type)
+	fig = draw_autocorrelator(device_name, result, plot_fit, plot_envelope, plot_lower, x_axis_calibrated)
+	return [fig, result.pulse_FWHM]
+
+def draw_autocorrelator(device_name, result, plot_fit=True, plot_envelope=False, plot_lower=False, x_axis_calibrated=True):
+	time = result.time
+	intensity = result.intensity
+	FWHM = result.FWHM
+	#incease fitted curve resolution
+	time_mesh = np.linspace(time[0],time[-1],1000)
+	#Format figure
+	fig, ax1 = plt.subplots()
+	plt.plot(time,intensity,color='0.8')
+	if result.fit_type != 'envelope':
+		plt.plot(time,result.intensity_low,color='0.6')
+	if x_axis_calibrated:
+		x_axis_text = 'Time [fs]'
+	else:
+		x_axis_text = 'Number of data points [uncalibrated]'
+	if plot_envelope and result.fit_type == 'envelope':
+		plt.plot(time[result.upper_envelope_index],intensity[result.upper_envelope_index],color='0.1',label='_nolegend_')
+		if plot_lower:
+			plt.plot(time[result.lower_envelope_index],intensity[result.lower_envelope_index],color='0.1',label='_nolegend_')
+	if plot_fit:
+		plt.plot(time_mesh,SechSqr(time_mesh,*result.fit_params))
+		if x_axis_calibrated:
+			x_axis_text += '\nAutocorrelator sech$^2$ FWHM '+"{:.1f}".format(FWHM)+' fs\nCorresponding pulse FWHM '+"{:.1f}".format(FWHM/1.54)+' fs'
+		else:
+			x_axis_text += '\nAutocorrelator sech$^2$ FWHM '+"{:.1f}".format(FWHM)+' data points\nCorresponding pulse FWHM '+"{:.1f}".format(FWHM/1.54)+' data points'
+		if plot_lower and result.lower_params is not None:
+			lower_params = result.lower_params
+			plt.plot(time_mesh,SechSqr(time_mesh,*lower_params))
+			if x_axis_calibrated:
+				x_axis_text += '\nLower autocorrelator sech$^2$ FWHM '+"{:.1f}".format(lower_params[3])+' fs\nCorresponding lower pulse FWHM '+"{:.1f}".format(lower_params[3]/1.54)+' fs'
+			else:
+				x_axis_text += '\nLower autocorrelator sech$^2$ FWHM '+"{:.1f}".format(lower_params[3])+' data points\nCorresponding lower pulse FWHM '+"{:.1f}".format(lower_params[3]/1.54)+' data points'
+	plt.xlabel(x_axis_text)
+	plt.ylabel('Intensity [A.U.]')
+	plt.title(device_name)
+	return fig
+
+def plot_intensity_autocorrelation(device_name, time, intensity, plot_fit=True, normalize=True, len_background=15):
+	result = analyze_intensity_autocorrelation(time, intensity, normalize, len_background)
+	fig = draw_intensity_autocorrelation(device_name, result, plot_fit)
+	return [fig, result.pulse_FWHM]
+
+def draw_intensity_autocorrelation(device_name, result, plot_fit=True):
+	time = result.time
+	FWHM = result.FWHM
+	#incease fitted curve resolution
+	time_mesh = np.linspace(time[0],time[-1],1000)
+	#Format figure
+	fig, ax1 = plt.subplots()
+	plt.plot(time,result.intensity,'o',color='0.6')
+	if plot_fit:
+		plt.plot(time_mesh,SechSqr(time_mesh,*result.fit_params))
+	plt.xlabel('Time [fs]\nAutocorrelator sech$^2$ FWHM '+"{:.1f}".format(FWHM)+' fs\nCorresponding pulse FWHM '+"{:.1f}".format(FWHM/1.54)+' fs')
+	plt.ylabel('Intensity [A.U.]')
+	plt.title(device_name)
+	return fig
+
+def draw_LIV_overlay(device_name, results, labels, plot_current_density=False, current_area=1):
+	#L-I curves of a whole sweep on one set of axes, results are from analyze_LIV and labels name each curve (e.g. the other biases)
+	fig, ax = plt.subplots()
+	plt.title(str(device_name))
+	colours = plt.cm.viridis(np.linspace(0, 1, max(len(results), 1)))
+	for result, label, colour in zip(results, labels, colours):
+		if plot_current_density:
+			ax.plot(result.current/current_area/1000/1000, result.power, color=colour, label=label)
+		else:
+			ax.plot(result.current, result.power, color=colour, label=label)
+	if plot_current_density:
+		ax.set_xlabel('Current Density [kA/cm^2]')
+	else:
+		ax.set_xlabel('Current [mA]')
+	ax.set_ylabel('Power [mW]')
+	if 0 < len(results) <= 12:
+		ax.legend(fontsize='small')
+	plt.tight_layout()
+	return fig
+
+def draw_bias_map(title, x_values, y_values, z, x_label, y_label, z_label):
+	#Heat map of z[j,i] at bias x_values[i], y_values[j], points that were not measured are nan
+	#With a single y value, z is drawn against x instead
+	z = np.asarray(z, dtype=float)
+	fig, ax = plt.subplots()
+	plt.title(str(title))
+	if len(y_values) == 1:
+		ax.plot(x_values, z[0], 'o-')
+		ax.set_ylabel(z_label)
+	else:
+		mesh = ax.pcolormesh(bin_edges(x_values), bin_edges(y_values), np.ma.masked_invalid(z), shading='flat')
+		fig.colorbar(mesh, ax=ax, label=z_label)
+		ax.set_ylabel(y_label)
+	ax.set_xlabel(x_label)
+	plt.tight_layout()
+	return fig
+
+def bin_edges(values):
+	#Edges of cells centred on each value, for pcolormesh
+	values = np.asarray(values, dtype=float)
+	if len(values) == 1:
+		return np.array([values[0]-0.5, values[0]+0.5])
+	middles = (values[1:]+values[:-1])/2
+	return np.concatenate([[2*values[0]-middles[0]], middles, [2*values[-1]-middles[-1]]])
+
+def draw_threshold_map(device_name, x_values, y_values, threshold_currents, x_label, y_label):
+	#threshold_currents [mA] from analyze_LIV for each pair of biases, as in draw_bias_map
+	return draw_bias_map(device_name, x_values, y_values, threshold_currents, x_label, y_label, 'Threshold Current [mA]')
+
+def draw_SMSR_map(device_name, x_values, y_values, SMSR, x_label, y_label):
+	#SMSR [dB] from analyze_spectrum for each pair of biases, as in draw_bias_map
+	return draw_bias_map(device_name, x_values, y_values, SMSR, x_label, y_label, 'SMSR [dB]')
+
+def draw_spectral_map(device_name, bias_values, x_data, powers, bias_label='Current [mA]', x_is_freq=False):
+	#Image of power [dBm] with wavelength (or frequency) across and one row per bias value
+	#x_data and powers are lists with one spectrum per bias value, spectra are interpolated onto one grid covering all of them
+	#since the spectrum analyzer window may move between points
+	x_min = min(np.min(x) for x in x_data)
+	x_max = max(np.max(x) for x in x_data)
+	grid = np.linspace(x_min, x_max, max(len(x) for x in x_data))
+	rows = []
+	for x, power in zip(x_data, powers):
+		order = np.argsort(x)
+		rows.append(np.interp(grid, np.asarray(x, dtype=float)[order], np.asarray(power, dtype=float)[order], left=np.nan, right=np.nan))
+	fig, ax = plt.subplots()
+	plt.title(str(device_name))
+	image = ax.pcolormesh(bin_edges(grid), bin_edges(bias_values), np.ma.masked_invalid(np.array(rows)), shading='flat')
+	fig.colorbar(image, ax=ax, label='Power [dBm]')
+	if x_is_freq:
+		ax.set_xlabel('Frequency [GHz]')
+	else:
+		ax.set_xlabel('Wavelength [nm]')
+	ax.set_ylabel(bias_label)
+	plt.tight_layout()
+	return fig
@@ -0,0 +1,152 @@
+#########################################################################
+# Functions to fit pulse shapes to autocorrelation traces               #
+# Every model is offset+amplitude*shape((x-center)/width) with an       #
+# analytic Jacobian, fitted by Levenberg-Marquardt on all traces at     #
+# once. Initial parameters come from the trace itself                   #
+# -fit_pulse()                                                          #
+# -pulse_initial_guess()                                                #
+# -pulse_model()                                                        #
+#                                                                       #
+# Author: agent                                                         #
+# Date: Oct 18, 2026                                                    #
+#########################################################################
+
+import numpy as np
+from collections import namedtuple
+
+#params are [offset, amplitude, center, width] with one row per trace for 2D input
+#FWHM is in the units of x, pulse_FWHM assumes x is an intensity autocorrelation of the same pulse shape
+Pulse_Fit = namedtuple('Pulse_Fit', ['model', 'params', 'params_sd', 'FWHM', 'FWHM_sd', 'pulse_FWHM', 'R_squared', 'RMSE', 'success', 'iterations'])
+
+def sech_squared(u):
+	#sech(u)^2 written to avoid overflow for large |u|
+	e = np.exp(-2*np.abs(u))
+	return 4*e/(1+e)**2
+
+def sech_squared_derivative(u, s):
+	#s is sech_squared(u)
+	return -2*s*np.tanh(u)
+
+def gaussian(u):
+	return np.exp(-u**2)
+
+def gaussian_derivative(u, s):
+	return -2*u*s
+
+def lorentzian(u):
+	return 1/(1+u**2)
+
+def lorentzian_derivative(u, s):
+	return -2*u*s**2
+
+#shape, derivative of shape given the shape, FWHM/width, autocorrelation FWHM/pulse FWHM
+pulse_models = {
+	'sech2': (sech_squared, sech_squared_derivative, 1.7627, 1.54),
+	'gaussian': (gaussian, gaussian_derivative, 1.6651, 1.4142),
+	'lorentzian': (lorentzian, lorentzian_derivative, 2, 2),
+	}
+
+def pulse_model(x, offset, amplitude, center, width, model='sech2'):
+	return offset+amplitude*pulse_models[model][0]((x-center)/width)
+
+def pulse_jacobian(x, params, model='sech2'):
+	#Derivatives of the model with respect to [offset, amplitude, center, width], shape (traces, points, 4)
+	shape, derivative = pulse_models[model][0:2]
+	offset, amplitude, center, width = [p[:,None] for p in params.T]
+	u = (x-center)/width
+	J = np.empty(u.shape+(4,))
+	J[...,0] = 1
+	J[...,1] = shape(u)
+	ds = derivative(u, J[...,1])
+	J[...,2] = -amplitude*ds/width
+	J[...,3] = -amplitude*ds*u/width
+	return J
+
+def pulse_initial_guess(x, y, model='sech2', edge_fraction=0.05):
+	#Offset from the ends of the trace, amplitude and sign from the largest excursion from the offset,
+	#center from the centroid above half maximum and width from the half maximum crossings
+	#x and y can be single traces or 2D arrays with one trace per row
+	y = np.atleast_2d(np.asarray(y, dtype=float))
+	x = np.broadcast_to(np.atleast_2d(np.asarray(x, dtype=float)), y.shape)
+	rows = np.arange(y.shape[0])
+	num_edge = max(int(y.shape[1]*edge_fraction), 1)
+	offset = (np.mean(y[:,:num_edge], axis=1)+np.mean(y[:,-num_edge:], axis=1))/2
+	excursion = y-offset[:,None]
+	sign = np.where(np.max(excursion, axis=1) >= -np.min(excursion, axis=1), 1, -1)
+	excursion = excursion*sign[:,None]
+	peak = np.argmax(excursion, axis=1)
+	amplitude = excursion[rows, peak]*sign
+	above = excursion >= np.abs(amplitude)[:,None]/2
+	weights = np.where(above, excursion, 0)
+	center = np.sum(x*weights, axis=1)/np.sum(weights, axis=1)
+	first = np.argmax(above, axis=1)
+	last = y.shape[1]-1-np.argmax(above[:,::-1], axis=1)
+	FWHM = np.abs(x[rows, last]-x[rows, first])
+	#Fall back to the second moment if the peak is a single point
+	narrow = FWHM == 0
+	if np.any(narrow):
+		weights = np.clip(excursion[narrow], 0, None)
+		variance = np.sum(weights*(x[narrow]-center[narrow,None])**2, axis=1)/np.sum(weights, axis=1)
+		FWHM[narrow] = np.maximum(2.3548*np.sqrt(variance), np.abs(x[narrow,1]-x[narrow,0]))
+	width = FWHM/pulse_models[model][2]
+	return np.column_stack([offset, amplitude, center, width])
+
+def fit_pulse(x, y, model='sech2', p0=None, max_iter=100, tolerance=1e-10):
+	#Least squares fit of offset+amplitude*shape((x-center)/width) with model 'sech2', 'gaussian' or 'lorentzian'
+	#x and y can be single traces or 2D arrays with one trace per row, p0 defaults to pulse_initial_guess
+	#Every trace is stepped together by Levenberg-Marquardt, each with its own damping
+	single_trace = np.ndim(y) == 1
+	y = np.atleast_2d(np.asarray(y, dtype=float))
+	x = np.broadcast_to(np.atleast_2d(np.asarray(x, dtype=float)), y.shape)
+	if p0 is None:
+		params = pulse_initial_guess(x, y, model)
+	else:
+		params = np.array(np.broadcast_to(np.atleast_2d(np.asarray(p0, dtype=float)), (y.shape[0], 4)))
+	def residuals(x, y, params):
+		return y-pulse_model(x, *[p[:,None] for p in params.T], model=model)
+	cost = np.sum(residuals(x, y, params)**2, axis=1)
+	damping = np.full(y.shape[0], 1e-3)
+	converged = np.zeros(y.shape[0], dtype=bool)
+	iterations = 0
+	while iterations < max_iter and not np.all(converged):
+		iterations += 1
+		active = np.flatnonzero(~converged)
+		x_active = x[active]
+		y_active = y[active]
+		J = pulse_jacobian(x_active, params[active], model)
+		r = residuals(x_active, y_active, params[active])
+		JT = J.transpose(0,2,1)
+		JTJ = JT@J
+		JTr = (JT@r[:,:,None])[:,:,0]
+		A = JTJ+damping[active,None,None]*np.einsum('ikk->ik', JTJ)[:,:,None]*np.eye(4)
+		try:
+			step = np.linalg.solve(A, JTr[:,:,None])[:,:,0]
+		except np.linalg.LinAlgError:
+			step = (np.linalg.pinv(A)@JTr[:,:,None])[:,:,0]
+		trial = params[active]+step
+		trial_cost = np.sum(residuals(x_active, y_active, trial)**2, axis=1)
+		better = np.isfinite(trial_cost) & (trial_cost <= cost[active])
+		small_step = np.all(np.abs(step) <= tolerance*(np.abs(params[active])+tolerance), axis=1)
+		converged[active] = better & ((cost[active]-trial_cost <= tolerance*cost[active]) | small_step)
+		params[active[better]] = trial[better]
+		cost[active[better]] = trial_cost[better]
+		damping[active] = np.where(better, damping[active]/10, damping[active]*10)
+		converged |= damping > 1e12
+	params[:,3] = np.abs(params[:,3]) #ensure width is positive
+	#Fit quality and parameter uncertainty from the final Jacobian
+	num_points = y.shape[1]
+	J = pulse_jacobian(x, params, model)
+	JTJ = J.transpose(0,2,1)@J
+	variance = cost/max(num_points-4, 1)
+	with np.errstate(divide='ignore', invalid='ignore'):
+		covariance = np.linalg.pinv(JTJ)*variance[:,None,None]
+		params_sd = np.sqrt(np.abs(np.einsum('ikk->ik', covariance)))
+		R_squared = 1-cost/np.sum((y-np.mean(y, axis=1, keepdims=True))**2, axis=1)
+	RMSE = np.sqrt(cost/num_points)
+	FWHM_factor, deconvolution = pulse_models[model][2:4]
+	FWHM = params[:,3]*FWHM_factor
+	FWHM_sd = params_sd[:,3]*FWHM_factor
+	success = np.isfinite(cost) & (damping <= 1e12)
+	if single_trace:
+		return Pulse_Fit(model, params[0], params_sd[0], FWHM[0], FWHM_sd[0], FWHM[0]/deconvolution, R_squared[0], RMSE[0], bool(success[0]), iterations)
+	return Pulse_Fit(model, params, params_sd, FWHM, FWHM_sd, FWHM/deconvolution, R_squared, RMSE, success, iterations)
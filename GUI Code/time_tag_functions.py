@@ -0,0 +1,173 @@
+#########################################################################
+# Functions to build coincidence histograms from raw time tags          #
+# Tags are streamed in chunks so the memory used does not depend on the #
+# length of the acquisition. Timestamps are integers in [ps]            #
+# -read_time_tags()                                                     #
+# -correlation_histogram()                                              #
+# -rebin_histogram()                                                    #
+# -CAR_from_singles()                                                   #
+# -coincidence_windows()                                                #
+#                                                                       #
+# Author: agent                                                         #
+# Date: Oct 18, 2026                                                    #
+#########################################################################
+
+import numpy as np
+import os
+from collections import namedtuple
+
+#Layout of raw time tag files written with save_time_tags
+time_tag_dtype = np.dtype([('channel', '<i4'), ('timestamp', '<i8')])
+#delay [ps] is the start of each bin, delay = t_idler-t_signal, rates are [1/s] and duration [ps]
+Correlation_Result = namedtuple('Correlation_Result', ['delay', 'histogram', 'bin_width', 'signal_rate', 'idler_rate', 'duration'])
+#coincidences, accidentals and CAR are (num_histograms, len(widths), len(offsets)), a window starts at peak_index+offset [bins]
+Window_Result = namedtuple('Window_Result', ['widths', 'offsets', 'coincidences', 'accidentals', 'CAR', 'peak_index'])
+
+def save_time_tags(file_path, channels, timestamps):
+	#Writes tags as a .npy array of time_tag_dtype, which read_time_tags can stream back
+	tags = np.empty(len(timestamps), dtype=time_tag_dtype)
+	tags['channel'] = channels
+	tags['timestamp'] = timestamps
+	np.save(file_path, tags)
+
+def read_time_tags(file_path, chunk_size=10_000_000):
+	#Yields (channels, timestamps) in chunks of at most chunk_size tags
+	#.ttbin files from TimeTagger.FileWriter need the TimeTagger package, .npy files are from save_time_tags
+	if file_path.endswith('.ttbin'):
+		import TimeTagger
+		reader = TimeTagger.FileReader(file_path)
+		while reader.hasData():
+			data = reader.getData(chunk_size)
+			is_tag = data.getEventTypes() == 0 #skip overflow and error events
+			yield data.getChannels()[is_tag], data.getTimestamps()[is_tag]
+	elif file_path.endswith('.npy'):
+		tags = np.load(file_path, mmap_mode='r')
+		for start in range(0, len(tags), chunk_size):
+			chunk = tags[start:start+chunk_size]
+			yield np.asarray(chunk['channel']), np.asarray(chunk['timestamp'])
+	else:
+		raise Exception("Unsupported time tag file: "+os.path.basename(file_path))
+
+def pair_delays(signal, idler, min_delay, max_delay):
+	#Every idler-signal delay in [min_delay, max_delay) from sorted signal and idler timestamps
+	start = np.searchsorted(idler, signal+min_delay, side='left')
+	end = np.searchsorted(idler, signal+max_delay, side='left')
+	num_pairs = end-start
+	total = np.sum(num_pairs)
+	if total == 0:
+		return np.zeros(0, dtype=np.int64)
+	#Index of every idler tag paired with each signal tag, without a loop over signal tags
+	signal_index = np.repeat(np.arange(len(signal)), num_pairs)
+	offsets = np.arange(total)-np.repeat(np.cumsum(num_pairs)-num_pairs, num_pairs)
+	return idler[start[signal_index]+offsets]-signal[signal_index]
+
+def correlation_histogram(tag_chunks, signal_channel, idler_channel, bin_width, num_bins):
+	#Histogram of t_idler-t_signal for every pair of tags, binned like TimeTagger.Correlation
+	#Bins are centered on zero delay: bin i starts at (i-num_bins//2)*bin_width [ps]
+	#tag_chunks is an iterable of (channels, timestamps) in time order, e.g. from read_time_tags
+	bin_width = int(bin_width)
+	min_delay = -(num_bins//2)*bin_width
+	max_delay = min_delay+num_bins*bin_width
+	histogram = np.zeros(num_bins, dtype=np.int64)
+	num_signal = 0
+	num_idler = 0
+	first_time = None
+	last_time = None
+	pending_signal = np.zeros(0, dtype=np.int64)
+	pending_idler = np.zeros(0, dtype=np.int64)
+	for channels, timestamps in tag_chunks:
+		if len(timestamps) == 0:
+			continue
+		timestamps = np.asarray(timestamps, dtype=np.int64)
+		if first_time is None:
+			first_time = timestamps[0]
+		last_time = timestamps[-1]
+		signal = timestamps[channels == signal_channel]
+		idler = timestamps[channels == idler_channel]
+		num_signal += len(signal)
+		num_idler += len(idler)
+		signal = np.concatenate([pending_signal, signal])
+		idler = np.concatenate([pending_idler, idler])
+		#Signal tags whose window ends before the last tag seen have all their partners
+		complete = signal+max_delay <= last_time
+		delays = pair_delays(signal[complete], idler, min_delay, max_delay)
+		histogram += np.bincount((delays-min_delay)//bin_width, minlength=num_bins)
+		pending_signal = signal[~complete]
+		#Keep idler tags that could still pair with a pending or future signal tag
+		keep_from = (pending_signal[0] if len(pending_signal) > 0 else last_time)+min_delay
+		pending_idler = idler[idler >= keep_from]
+	#Tags at the end of the acquisition
+	delays = pair_delays(pending_signal, pending_idler, min_delay, max_delay)
+	histogram += np.bincount((delays-min_delay)//bin_width, minlength=num_bins)
+	duration = 0 if first_time is None else last_time-first_time
+	delay = min_delay+np.arange(num_bins)*bin_width
+	with np.errstate(divide='ignore', invalid='ignore'):
+		signal_rate = num_signal/(duration*1e-12)
+		idler_rate = num_idler/(duration*1e-12)
+	return Correlation_Result(delay, histogram, bin_width, signal_rate, idler_rate, duration)
+
+def rebin_histogram(delay, histogram, bin_width, new_bin_width, new_num_bins=None):
+	#Re-bins a histogram with bins starting at delay [ps] to new_bin_width, centered on zero delay like correlation_histogram
+	#Counts are taken from the cumulative sum at the new bin edges, so new edges that are not old edges are split linearly
+	#For exact results acquire at a fine bin_width and use multiples of it
+	delay = np.asarray(delay)
+	edges = np.append(delay, delay[-1]+bin_width)
+	cumulative = np.concatenate([[0], np.cumsum(histogram)])
+	if new_num_bins is None:
+		new_num_bins = int((edges[-1]-edges[0])//new_bin_width)
+	new_delay = -(new_num_bins//2)*new_bin_width+np.arange(new_num_bins)*new_bin_width
+	new_edges = np.append(new_delay, new_delay[-1]+new_bin_width)
+	return new_delay, np.diff(np.interp(new_edges, edges, cumulative))
+
+def CAR_from_singles(coincidences, signal_rate, idler_rate, window, duration):
+	#Coincidence to accidental ratio with accidentals expected from uncorrelated singles
+	#rates [1/s], window and duration [ps]
+	accidentals = signal_rate*idler_rate*window*1e-12*duration*1e-12
+	with np.errstate(divide='ignore', invalid='ignore'):
+		return coincidences/accidentals
+
+def coincidence_windows(histograms, max_width=20, max_offset=None, peak_index=None, accidental_start=100, accidental_end=None, pulse_period=None, num_pulses=49):
+	#Coincidences, accidentals and CAR for every window width from 1 to max_width bins and every start from -max_offset to max_offset bins from the peak
+	#histograms is one histogram or (num_histograms, num_bins), e.g. all 16 polarizations, peak_index defaults to the maximum of each
+	#Continuous wave: accidentals per bin are the average of histogram[peak+accidental_start:accidental_end]
+	#Pulsed: accidentals are the average of the same window shifted by int(k*pulse_period) bins for k = 1 to num_pulses
+	#Every window sum is a difference of one cumulative sum, so all windows cost one vectorized operation
+	histograms = np.atleast_2d(np.asarray(histograms, dtype=float))
+	num_histograms, num_bins = histograms.shape
+	if peak_index is None:
+		peak_index = np.argmax(histograms, axis=1)
+	peak_index = np.broadcast_to(np.asarray(peak_index), (num_histograms,))
+	if max_offset is None:
+		max_offset = max_width
+	cumulative = np.concatenate([np.zeros((num_histograms,1)), np.cumsum(histograms, axis=1)], axis=1)
+	rows = np.arange(num_histograms)[:,None,None]
+	widths = np.arange(1, max_width+1)
+	offsets = np.arange(-max_offset, max_offset+1)
+	start = np.broadcast_to(peak_index[:,None,None]+offsets[None,None,:], (num_histograms, len(widths), len(offsets)))
+	end = start+widths[None,:,None]
+	def window_sums(rows, start, end):
+		valid = (start >= 0) & (end <= num_bins)
+		sums = cumulative[rows, np.clip(end, 0, num_bins)]-cumulative[rows, np.clip(start, 0, num_bins)]
+		return np.where(valid, sums, np.nan)
+	coincidences = window_sums(rows, start, end)
+	if pulse_period is None:
+		accidental_first = np.where(peak_index+accidental_start < num_bins, peak_index+accidental_start, peak_index+1)
+		accidental_last = len(range(num_bins)[:accidental_end]) #accidental_end is a slice end, so -1 excludes the last bin
+		accidental_rate = (cumulative[np.arange(num_histograms), accidental_last]-cumulative[np.arange(num_histograms), accidental_first])/(accidental_last-accidental_first)
+		accidentals = np.broadcast_to(accidental_rate[:,None,None]*widths[None,:,None], start.shape)
+	else:
+		shifts = (pulse_period*np.arange(1, num_pulses+1)).astype(int)
+		comb = window_sums(rows[...,None], start[...,None]+shifts, end[...,None]+shifts)
+		num_valid = np.sum(np.isfinite(comb), axis=-1)
+		with np.errstate(divide='ignore', invalid='ignore'):
+			accidentals = np.where(num_valid > 0, np.nansum(comb, axis=-1)/num_valid, np.nan)
+	with np.errstate(divide='ignore', invalid='ignore'):
+		CAR = coincidences/accidentals
+	return Window_Result(widths, offsets, coincidences, accidentals, CAR, peak_index)
+
+def centered_windows(result):
+	#Values of a Window_Result for windows of each width starting width//2 bins before the peak (one extra bin before the peak for even widths)
+	#Returns coincidences, accidentals and CAR, each (num_histograms, len(widths))
+	offset_index = -(result.widths//2)-result.offsets[0]
+	width_index = np.arange(len(result.widths))
+	return result.coincidences[:,width_index,offset_index], result.accidentals[:,width_index,offset_index], result.CAR[:,width_index,offset_index]
@@ -0,0 +1,74 @@
+#########################################################################
+# Script to test the measurement catalog on names built by the GUIs     #
+# Pulsed and DC runs of one device must be cataloged with the same      #
+# device and biases, so one query finds both                            #
+#                                                                       #
+# Author: agent                                                         #
+# Date: Oct 19, 2026                                                    #
+#########################################################################
+
+import sys, os
+import shutil
+import sqlite3
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(__file__),'..','GUI Code'))
+from data_catalog import parse_scan_name, update_catalog, query_catalog, catalog_location
+
+#name: (device, pulsed, biases)
+scan_names = {
+	'BRL9_M-AL_20C_120mA': ('BRL9_M-AL', False, [(20, 'C'), (120, 'mA')]),
+	'BRL9_M-AL_20C_pulsed_120mA': ('BRL9_M-AL', True, [(20, 'C'), (120, 'mA')]),
+	'BRL9_M-AL_20C_pulsed_-1.5V_120mA_run2': ('BRL9_M-AL', True, [(20, 'C'), (-1.5, 'V'), (120, 'mA')]),
+	'BRL9_M-AL_pulsed_120mA_2': ('BRL9_M-AL', True, [(120, 'mA')]),
+	'BRL9_M-AL': ('BRL9_M-AL', False, []),
+}
+
+def check(test_name, passed, result):
+	if passed:
+		print(" "+test_name+": PASSED")
+	else:
+		print(" "+test_name+" result "+str(result))
+		print(" "+test_name+": FAILED")
+	return passed
+
+def Data_Catalog_Test():
+	test_count = 0
+	pass_count = 0
+	#Name Test
+	for name, expected in scan_names.items():
+		test_count += 1
+		result = parse_scan_name(name)
+		pass_count += check("Name Test ("+name+")", result == expected, result)
+	#Query Test, as in Analysis/Find_Measurements.py
+	characterization_directory = tempfile.mkdtemp()
+	try:
+		data_directory = os.path.join(characterization_directory, 'user', '2026_10_19', 'LIV', 'Data')
+		os.makedirs(data_directory)
+		for name in scan_names:
+			with open(os.path.join(data_directory, name+'.csv'), 'w') as f:
+				f.write('Current [A], Voltage [V], Power [W]\n0,0,0\n')
+		update_catalog(characterization_directory, extract_metrics=False, print_progress=False)
+		test_count += 1
+		result = sorted(entry.name for entry in query_catalog(characterization_directory, 'LIV', 'BRL9_M-AL', biases={'C': 20}))
+		pass_count += check("Query Test", result == sorted(name for name, expected in scan_names.items() if (20, 'C') in expected[2]), result)
+		#Upgrade Test, catalogs made by an older parser are parsed again
+		connection = sqlite3.connect(catalog_location(characterization_directory))
+		connection.execute("UPDATE measurements SET device = 'old'")
+		connection.execute('PRAGMA user_version = 0')
+		connection.commit()
+		connection.close()
+		update_catalog(characterization_directory, extract_metrics=False, print_progress=False)
+		test_count += 1
+		result = len(query_catalog(characterization_directory, 'LIV', 'BRL9_M-AL'))
+		pass_count += check("Upgrade Test", result == len(scan_names), result)
+	finally:
+		shutil.rmtree(characterization_directory)
+	if pass_count == test_count:
+		print(" Passed all tests")
+	else:
+		print(" Passed "+str(pass_count)+"/"+str(test_count)+" tests")
+	return pass_count == test_count
+
+if __name__ == "__main__":
+	if not Data_Catalog_Test():
+		sys.exit(1)
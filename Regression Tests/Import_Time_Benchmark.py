@@ -0,0 +1,89 @@
+#########################################################################
+# Script to measure how long the GUIs take to start                     #
+# Each measurement runs in a new python process so imports are cold     #
+# -Import time of the shared modules                                    #
+# -Start to window time of each GUI (needs PySimpleGUI and a display)   #
+# The window is closed as soon as it first waits for an event           #
+#                                                                       #
+# Author: agent                                                         #
+# Date: Oct 18, 2026                                                    #
+#########################################################################
+
+import sys, os
+import time
+import subprocess
+import statistics
+
+#Benchmark options
+repeats = 3
+modules = ['data_files', 'figure_renderer', 'analysis_functions', 'plot_functions', 'GUI_common_functions']
+GUIs = ['LIV GUI', 'Spectrum Current Sweep GUI', 'Spectrum Capture GUI', 'Set Bias GUI', 'Power Monitor GUI', 'FP Loss GUI', 'DFG GUI', 'Autocorrelation GUI', 'Commercial Autocorrelator Capture GUI']
+#Define constants
+GUI_code_dir = os.path.abspath(os.path.join(os.path.dirname(__file__),'..','GUI Code'))
+
+class Window_Opened(Exception):
+	pass
+
+def time_import(module_name):
+	start_time = time.perf_counter()
+	__import__(module_name)
+	return time.perf_counter()-start_time
+
+def time_GUI(GUI_name):
+	#Loads '<GUI_name>.py' and runs GUI(debug=True) until the window first reads events
+	start_time = time.perf_counter()
+	import importlib.util
+	import PySimpleGUI as psg
+	opened = []
+	def read(window, *args, **kwargs):
+		opened.append(time.perf_counter())
+		raise Window_Opened
+	psg.Window.read = read
+	spec = importlib.util.spec_from_file_location(GUI_name.replace(' ','_'), os.path.join(GUI_code_dir, GUI_name+'.py'))
+	module = importlib.util.module_from_spec(spec)
+	spec.loader.exec_module(module)
+	try:
+		module.GUI(True)
+	except Window_Opened:
+		pass
+	if len(opened) == 0:
+		raise Exception(GUI_name+" returned without opening a window")
+	return opened[0]-start_time
+
+def measure(kind, name):
+	#Runs one measurement in a new process, returns the time [s] or the error it raised
+	result = subprocess.run([sys.executable, os.path.abspath(__file__), kind, name], cwd=GUI_code_dir, capture_output=True, text=True)
+	lines = result.stdout.strip().splitlines()
+	if result.returncode != 0 or len(lines) == 0:
+		error = result.stderr.strip().splitlines()
+		return error[-1] if len(error) > 0 else "exit code "+str(result.returncode)
+	return float(lines[-1])
+
+def print_results(title, names):
+	print(" "+title)
+	for name in names:
+		times = []
+		for i in range(repeats):
+			value = measure('module' if title.startswith('Import') else 'GUI', name)
+			if isinstance(value, str):
+				times = value
+				break
+			times.append(value)
+		if isinstance(times, str):
+			print("   {:<40s} failed: {}".format(name, times))
+		else:
+			print("   {:<40s} {:8.0f} ms (min {:.0f} ms)".format(name, statistics.median(times)*1e3, min(times)*1e3))
+
+### Main Code
+if __name__ == "__main__":
+	if len(sys.argv) == 3:
+		#Worker, prints one time [s]
+		sys.path.insert(0, GUI_code_dir)
+		if sys.argv[1] == 'module':
+			print(time_import(sys.argv[2]))
+		else:
+			print(time_GUI(sys.argv[2]))
+	else:
+		print(" Median of "+str(repeats)+" cold starts")
+		print_results("Import time", modules)
+		print_results("Start to window time", GUIs)
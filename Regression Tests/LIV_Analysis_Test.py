@@ -0,0 +1,65 @@
+#########################################################################
+# Script to test batch_LIV_analysis on synthetic LIVs                   #
+# Clean linear LIVs with power noise must not report kinks at any sweep #
+# density, and a real dip in dL/dI must be found where it starts        #
+#                                                                       #
+# Author: agent                                                         #
+# Date: Oct 18, 2026                                                    #
+#########################################################################
+
+import sys, os
+import numpy as np
+sys.path.append(os.path.join(os.path.dirname(__file__),'..','GUI Code'))
+from LIV_analysis import batch_LIV_analysis
+
+#Synthetic LIV options
+num_curves = 200
+threshold = 20e-3 #[A]
+slope_efficiency = 0.3 #[W/A]
+power_noise = 10e-6 #[W]
+kink_current = 60e-3 #[A]
+kink_width = 4e-3 #[A]
+kink_depth = 0.8 #fractional drop in dL/dI during the kink
+
+def synthetic_LIVs(num_points, kink=False, seed=0):
+	rng = np.random.default_rng(seed)
+	current = np.linspace(0, 0.1, num_points)
+	power = np.clip(current-threshold, 0, None)*slope_efficiency
+	if kink:
+		power -= np.clip(current-kink_current, 0, kink_width)*slope_efficiency*kink_depth
+	names = [str(i) for i in range(num_curves)]
+	powers = [power+rng.normal(0, power_noise, num_points) for i in range(num_curves)]
+	return names, [current]*num_curves, [1+10*current]*num_curves, powers
+
+def LIV_Analysis_Test():
+	test_count = 0
+	pass_count = 0
+	for num_points in [51, 101, 201, 401, 801]:
+		#Clean Test
+		test_count += 1
+		table = batch_LIV_analysis(*synthetic_LIVs(num_points))
+		if np.all(table['num_kinks'] == 0):
+			print(" Clean Test ("+str(num_points)+" points): PASSED")
+			pass_count += 1
+		else:
+			print(" Clean Test ("+str(num_points)+" points) found kinks in "+str(np.sum(table['num_kinks'] > 0))+"/"+str(num_curves)+" curves")
+			print(" Clean Test ("+str(num_points)+" points): FAILED")
+		#Kink Test
+		test_count += 1
+		table = batch_LIV_analysis(*synthetic_LIVs(num_points, kink=True))
+		found = (table['num_kinks'] == 1) & (np.abs(table['first_kink_current [mA]']-kink_current*1000) <= 5)
+		if np.all(found):
+			print(" Kink Test ("+str(num_points)+" points): PASSED")
+			pass_count += 1
+		else:
+			print(" Kink Test ("+str(num_points)+" points) missed the kink in "+str(np.sum(~found))+"/"+str(num_curves)+" curves")
+			print(" Kink Test ("+str(num_points)+" points): FAILED")
+	if pass_count == test_count:
+		print(" Passed all tests")
+	else:
+		print(" Passed "+str(pass_count)+"/"+str(test_count)+" tests")
+	return pass_count == test_count
+
+if __name__ == "__main__":
+	if not LIV_Analysis_Test():
+		sys.exit(1)